@@ -55,7 +55,16 @@ class Business(models.Model):
 
     @property
     def outstanding_balance(self):
-        """동적으로 미수금 계산 - 결제되지 않은 주문의 총액"""
+        """미수금 - 미수금 원장(payment.BusinessReceivable)에서 조회 (목록에서는 select_related('receivable') 사용)"""
+        from payment.models import BusinessReceivable
+        try:
+            return float(self.receivable.outstanding_balance)
+        except BusinessReceivable.DoesNotExist:
+            # 아직 주문이 없는 거래처는 원장 행이 없음
+            return 0.0
+
+    def compute_outstanding_balance(self):
+        """동적으로 미수금 계산 - 결제되지 않은 주문의 총액 (원장 검증용)"""
         from order.models import Order
         from payment.models import Payment
         from django.db.models import Q, Exists, OuterRef
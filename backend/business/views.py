@@ -496,7 +496,7 @@ class BusinessCreateView(View):
         if not hasattr(request, 'user_id') or not request.user_id:
             return JsonResponse({'error': '사용자 인증이 필요합니다.'}, status=401)
         
-        businesses = Business.objects.filter(user_id=request.user_id)
+        businesses = Business.objects.filter(user_id=request.user_id).select_related('receivable')
         serializer = BusinessSerializer(businesses, many=True)
         return JsonResponse(serializer.data, safe=False)
     
@@ -536,4 +536,4 @@ class BusinessListAPIView(ListAPIView):
         # 미들웨어에서 설정된 user_id 사용 (JWT 미들웨어 인증 필요)
         if not hasattr(self.request, 'user_id') or not self.request.user_id:
             raise PermissionDenied('사용자 인증이 필요합니다.')
-        return Business.objects.filter(user_id=self.request.user_id).order_by('-id')
\ No newline at end of file
+        return Business.objects.filter(user_id=self.request.user_id).select_related('receivable').order_by('-id')
\ No newline at end of file
@@ -0,0 +1,278 @@
+"""
+데이터베이스 헬스 모니터
+백그라운드 스레드에서 주기적으로 각 데이터베이스에 SELECT 1 을 보내고 결과를 메모리에 캐시합니다.
+라우터는 요청마다 연결 테스트를 하지 않고 캐시된 활성 데이터베이스 값만 읽습니다.
+"""
+import logging
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseLagError(Exception):
+    """replica 복제 지연이 허용치를 초과함"""
+
+
+class DatabaseHealthState:
+    """단일 데이터베이스 별칭의 헬스 상태 및 프로브 지표"""
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.healthy = True  # 첫 프로브 전에는 정상으로 간주
+        self.consecutive_failures = 0
+        self.consecutive_successes = 0
+        self.last_latency_ms = None
+        self.avg_latency_ms = None
+        self.max_latency_ms = None
+        self.probe_count = 0
+        self.failure_count = 0
+        self.last_error = None
+        self.last_checked_at = None
+        self.lag_seconds = None
+
+    def record_success(self, latency_ms):
+        self.probe_count += 1
+        self.consecutive_successes += 1
+        self.consecutive_failures = 0
+        self.last_latency_ms = latency_ms
+        # 지수 이동 평균으로 평균 지연시간 유지
+        if self.avg_latency_ms is None:
+            self.avg_latency_ms = latency_ms
+        else:
+            self.avg_latency_ms = self.avg_latency_ms * 0.8 + latency_ms * 0.2
+        self.max_latency_ms = max(self.max_latency_ms or 0, latency_ms)
+        self.last_error = None
+        self.last_checked_at = time.time()
+
+    def record_failure(self, error):
+        self.probe_count += 1
+        self.failure_count += 1
+        self.consecutive_failures += 1
+        self.consecutive_successes = 0
+        self.last_error = str(error)
+        self.last_checked_at = time.time()
+
+    def to_dict(self):
+        return {
+            'alias': self.alias,
+            'healthy': self.healthy,
+            'consecutive_failures': self.consecutive_failures,
+            'consecutive_successes': self.consecutive_successes,
+            'last_latency_ms': self.last_latency_ms,
+            'avg_latency_ms': round(self.avg_latency_ms, 3) if self.avg_latency_ms is not None else None,
+            'max_latency_ms': self.max_latency_ms,
+            'probe_count': self.probe_count,
+            'failure_count': self.failure_count,
+            'last_error': self.last_error,
+            'last_checked_at': self.last_checked_at,
+            'lag_seconds': self.lag_seconds,
+        }
+
+
+class DatabaseHealthMonitor:
+    """
+    primary(default) / fallback / 읽기 전용 replica 데이터베이스 헬스 모니터
+
+    - FAIL_THRESHOLD 회 연속 실패 시 primary → fallback 전환
+    - RECOVER_THRESHOLD 회 연속 성공 시 fallback → primary 자동 복귀 (히스테리시스)
+    - replica 는 복제 지연이 max_replica_lag 초를 넘으면 실패로 간주되어 풀에서 제외
+    - active_alias / healthy_replicas 는 단순 속성 읽기이므로 라우터에서 락 없이 사용
+    """
+
+    # 복제 지연(초) 조회 - 수신한 WAL 을 모두 재생했으면 0
+    POSTGRES_LAG_QUERY = (
+        "SELECT CASE WHEN NOT pg_is_in_recovery() "
+        "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+    )
+
+    def __init__(self, primary='default', fallback='fallback', replicas=(), interval=5.0,
+                 fail_threshold=2, recover_threshold=3, max_replica_lag=5.0, max_events=50):
+        self.primary = primary
+        self.fallback = fallback
+        self.replicas = tuple(replicas)
+        self.interval = interval
+        self.fail_threshold = fail_threshold
+        self.recover_threshold = recover_threshold
+        self.max_replica_lag = max_replica_lag
+
+        self.active_alias = primary
+        self.healthy_replicas = tuple(alias for alias in self.replicas if alias in settings.DATABASES)
+        self.states = {alias: DatabaseHealthState(alias) for alias in self.aliases}
+        self.switch_count = 0
+        self.switch_events = deque(maxlen=max_events)
+
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._start_lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls):
+        config = getattr(settings, 'DATABASE_HEALTH_CHECK', {})
+        replica_config = getattr(settings, 'DATABASE_REPLICAS', {})
+        return cls(
+            primary='default',
+            fallback='fallback',
+            replicas=replica_config.get('ALIASES', ()),
+            interval=config.get('INTERVAL_SECONDS', 5.0),
+            fail_threshold=config.get('FAIL_THRESHOLD', 2),
+            recover_threshold=config.get('RECOVER_THRESHOLD', 3),
+            max_replica_lag=replica_config.get('MAX_LAG_SECONDS', 5.0),
+        )
+
+    @property
+    def aliases(self):
+        """설정에 존재하는 프로브 대상 별칭 목록"""
+        candidates = (self.primary, self.fallback) + self.replicas
+        return [alias for alias in candidates if alias in settings.DATABASES]
+
+    # ------------------------------------------------------------------
+    # 백그라운드 스레드
+    # ------------------------------------------------------------------
+    def ensure_started(self):
+        """모니터 스레드가 없으면 시작 (이미 실행 중이면 속성 확인만 수행)"""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='db-health-monitor', daemon=True
+            )
+            self._thread.start()
+            logger.info(f"🩺 데이터베이스 헬스 모니터 시작 (주기: {self.interval}s)")
+
+    def stop(self):
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=self.interval + 1)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.probe_once()
+            except Exception as e:
+                logger.error(f"❌ 데이터베이스 헬스 프로브 오류: {e}")
+            self._stop_event.wait(self.interval)
+
+    # ------------------------------------------------------------------
+    # 프로브 및 전환
+    # ------------------------------------------------------------------
+    def probe_once(self):
+        """모든 대상 데이터베이스를 한 번씩 프로브하고 활성 데이터베이스를 갱신"""
+        with self._probe_lock:
+            for alias in self.aliases:
+                state = self.states.setdefault(alias, DatabaseHealthState(alias))
+                self._probe(state)
+            self._update_active_alias()
+        return self.active_alias
+
+    def _probe(self, state):
+        started = time.perf_counter()
+        connection = connections[state.alias]
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            if state.alias in self.replicas:
+                state.lag_seconds = self.measure_lag(state.alias)
+                if state.lag_seconds > self.max_replica_lag:
+                    raise DatabaseLagError(
+                        f"replication lag {state.lag_seconds:.1f}s > {self.max_replica_lag}s"
+                    )
+        except Exception as e:
+            state.record_failure(e)
+            if state.consecutive_failures >= self.fail_threshold:
+                state.healthy = False
+            logger.warning(f"⚠️ Database '{state.alias}' probe failed ({state.consecutive_failures}회 연속): {e}")
+            # 끊어진 연결은 닫아서 다음 프로브에서 새로 연결
+            try:
+                connection.close()
+            except Exception:
+                pass
+            return
+
+        latency_ms = round((time.perf_counter() - started) * 1000, 3)
+        state.record_success(latency_ms)
+        if not state.healthy and state.consecutive_successes >= self.recover_threshold:
+            state.healthy = True
+            logger.info(f"✅ Database '{state.alias}' recovered")
+
+    def measure_lag(self, alias):
+        """replica 의 복제 지연(초) 측정 - PostgreSQL 이외의 백엔드는 0"""
+        connection = connections[alias]
+        if connection.vendor != 'postgresql':
+            return 0.0
+        with connection.cursor() as cursor:
+            cursor.execute(self.POSTGRES_LAG_QUERY)
+            lag = cursor.fetchone()[0]
+        return float(lag or 0)
+
+    def _update_active_alias(self):
+        healthy_replicas = tuple(
+            alias for alias in self.replicas
+            if alias in self.states and self.states[alias].healthy
+        )
+        if healthy_replicas != self.healthy_replicas:
+            logger.warning(f"🔀 읽기 replica 풀 변경: {list(self.healthy_replicas)} → {list(healthy_replicas)}")
+            self.healthy_replicas = healthy_replicas
+
+        primary_state = self.states.get(self.primary)
+        fallback_state = self.states.get(self.fallback)
+
+        if self.active_alias == self.primary:
+            if primary_state and not primary_state.healthy and fallback_state and fallback_state.healthy:
+                self._switch(self.fallback, reason=primary_state.last_error)
+        elif primary_state and primary_state.healthy:
+            # primary 가 RECOVER_THRESHOLD 회 연속 성공해야 healthy 로 돌아오므로 여기서 바로 복귀
+            self._switch(self.primary, reason='primary recovered')
+
+    def _switch(self, alias, reason=None):
+        previous = self.active_alias
+        self.active_alias = alias
+        self.switch_count += 1
+        self.switch_events.append({
+            'at': time.time(),
+            'from': previous,
+            'to': alias,
+            'reason': reason,
+        })
+        logger.warning(f"🔀 데이터베이스 전환: {previous} → {alias} ({reason})")
+
+    def metrics(self):
+        return {
+            'active': self.active_alias,
+            'replicas': list(self.replicas),
+            'healthy_replicas': list(self.healthy_replicas),
+            'max_replica_lag_seconds': self.max_replica_lag,
+            'running': self._thread is not None and self._thread.is_alive(),
+            'interval_seconds': self.interval,
+            'fail_threshold': self.fail_threshold,
+            'recover_threshold': self.recover_threshold,
+            'switch_count': self.switch_count,
+            'switch_events': list(self.switch_events),
+            'databases': {alias: state.to_dict() for alias, state in self.states.items()},
+        }
+
+
+_monitor = None
+_monitor_lock = threading.Lock()
+
+
+def get_health_monitor():
+    """프로세스 단위 헬스 모니터 싱글톤 반환"""
+    global _monitor
+    if _monitor is None:
+        with _monitor_lock:
+            if _monitor is None:
+                _monitor = DatabaseHealthMonitor.from_settings()
+    return _monitor
@@ -1,88 +1,140 @@
 """
 데이터베이스 연결 fallback 로직
 1차 데이터베이스 연결 실패 시 자동으로 2차(fallback) 데이터베이스로 연결
+연결 상태 확인은 config.db_health 의 백그라운드 헬스 모니터가 담당합니다.
+
+읽기 replica 가 설정되어 있으면(DATABASE_REPLICAS) 읽기는 기본적으로 replica 풀로 보내고,
+쓰기가 발생한 요청과 최근에 쓰기를 한 사용자는 primary 에 고정(sticky)됩니다.
+primary 의 transaction.atomic() 블록 안에서 일어나는 읽기는 항상 primary 로 보냅니다.
 """
+import contextvars
+import itertools
 import logging
+from contextlib import contextmanager
+
 from django.db import DatabaseError, connections
 from django.conf import settings
 
+from config.db_health import get_health_monitor
+
 logger = logging.getLogger(__name__)
 
+# 현재 요청(컨텍스트)이 primary 에 고정되어 있는지 여부
+_pinned_to_primary = contextvars.ContextVar('db_pinned_to_primary', default=False)
+# 현재 요청에서 쓰기가 발생했는지 여부 (요청 종료 후 사용자 sticky 기간 설정용)
+_wrote_in_request = contextvars.ContextVar('db_wrote_in_request', default=False)
+
+
+def pin_to_primary():
+    """현재 요청의 이후 읽기를 모두 primary 로 보냄"""
+    _pinned_to_primary.set(True)
+
+
+def is_pinned_to_primary():
+    return _pinned_to_primary.get()
+
+
+def has_written():
+    return _wrote_in_request.get()
+
+
+def reset_request_routing(pinned=False):
+    """요청 시작 시 라우팅 컨텍스트 초기화 (반환된 토큰으로 복원)"""
+    return _pinned_to_primary.set(pinned), _wrote_in_request.set(False)
+
+
+def restore_request_routing(tokens):
+    pinned_token, wrote_token = tokens
+    _pinned_to_primary.reset(pinned_token)
+    _wrote_in_request.reset(wrote_token)
+
+
+@contextmanager
+def use_primary():
+    """
+    블록 안의 읽기를 primary 로 보냄 (쓰기 직후 다시 읽어야 하는 코드용)
+
+    Usage:
+        with use_primary():
+            order = Order.objects.get(id=order_id)
+    """
+    token = _pinned_to_primary.set(True)
+    try:
+        yield
+    finally:
+        _pinned_to_primary.reset(token)
+
+
 class DatabaseFallbackRouter:
     """
     데이터베이스 연결 실패 시 fallback 데이터베이스로 전환하는 라우터
+    헬스 모니터가 캐시한 활성 데이터베이스를 읽기만 하므로 쿼리마다 추가 왕복이 없습니다.
     """
-    
+
     def __init__(self):
-        self.primary_failed = False
-        self.fallback_active = False
-    
+        self._replica_cycle = itertools.count()
+
     def db_for_read(self, model, **hints):
-        """읽기 작업용 데이터베이스 선택"""
-        if not settings.DATABASE_FALLBACK_ENABLED:
-            return 'default'
-            
-        return self._get_database()
-    
+        """읽기 작업용 데이터베이스 선택 - 고정되지 않았으면 정상 replica 중 하나"""
+        primary = self._get_primary()
+        if primary != 'default' or _pinned_to_primary.get():
+            # fallback 으로 전환된 상태에서는 primary 의 replica 도 신뢰하지 않음
+            return primary
+        if connections[primary].in_atomic_block:
+            # primary 트랜잭션 안의 읽기(select_for_update 포함)는 같은 트랜잭션에서 수행해야 함
+            # 미들웨어 밖에서 도는 작업 스레드(STT/어종 분석 워커)도 여기서 primary 로 감
+            return primary
+
+        replicas = self._get_replicas()
+        if not replicas:
+            return primary
+        return replicas[next(self._replica_cycle) % len(replicas)]
+
     def db_for_write(self, model, **hints):
-        """쓰기 작업용 데이터베이스 선택"""
-        if not settings.DATABASE_FALLBACK_ENABLED:
-            return 'default'
-            
-        return self._get_database()
-    
+        """쓰기 작업용 데이터베이스 선택 - 이후 같은 요청의 읽기는 primary 로 고정"""
+        _wrote_in_request.set(True)
+        _pinned_to_primary.set(True)
+        return self._get_primary()
+
     def allow_relation(self, obj1, obj2, **hints):
         """객체간 관계 허용 여부"""
-        # 같은 데이터베이스에 있는 객체들 간의 관계는 허용
-        db_set = {'default', 'fallback'}
+        # 같은 데이터베이스에 있는 객체들 간의 관계는 허용 (replica 는 primary 의 복제본)
+        db_set = {'default', 'fallback', *self._get_replica_aliases()}
         if obj1._state.db in db_set and obj2._state.db in db_set:
             return True
         return None
-    
+
     def allow_migrate(self, db, app_label, model_name=None, **hints):
         """마이그레이션 허용 여부"""
+        if db in self._get_replica_aliases():
+            return False
+        if not getattr(settings, 'DATABASE_FALLBACK_ENABLED', False):
+            return db == 'default'
         # 현재 활성 데이터베이스에서만 마이그레이션 수행
         active_db = self._get_database()
         return db == active_db
-    
-    def _get_database(self):
-        """활성 데이터베이스 결정"""
-        if self.fallback_active:
-            return 'fallback'
-            
-        if self.primary_failed:
-            return 'fallback'
-        
-        # primary 데이터베이스 연결 테스트
-        try:
-            connection = connections['default']
-            # 간단한 쿼리로 연결 테스트
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                cursor.fetchone()
-            
-            # primary 연결 성공
+
+    def _get_primary(self):
+        if not getattr(settings, 'DATABASE_FALLBACK_ENABLED', False):
             return 'default'
-            
-        except (DatabaseError, Exception) as e:
-            logger.warning(f"Primary database connection failed: {e}")
-            self.primary_failed = True
-            
-            # fallback 데이터베이스로 전환
-            try:
-                connection = connections['fallback']
-                with connection.cursor() as cursor:
-                    cursor.execute("SELECT 1")
-                    cursor.fetchone()
-                
-                logger.info("Switched to fallback database successfully")
-                self.fallback_active = True
-                return 'fallback'
-                
-            except (DatabaseError, Exception) as e:
-                logger.error(f"Fallback database connection also failed: {e}")
-                # 두 데이터베이스 모두 실패한 경우 default로 fallback
-                return 'default'
+        return self._get_database()
+
+    def _get_replica_aliases(self):
+        return getattr(settings, 'DATABASE_REPLICAS', {}).get('ALIASES', ())
+
+    def _get_replicas(self):
+        """지연 허용치 이내의 정상 replica 목록 (헬스 모니터 캐시 값)"""
+        if not self._get_replica_aliases():
+            return ()
+        monitor = get_health_monitor()
+        monitor.ensure_started()
+        return monitor.healthy_replicas
+
+    def _get_database(self):
+        """활성 데이터베이스 결정 (헬스 모니터 캐시 값, 락 없는 메모리 읽기)"""
+        monitor = get_health_monitor()
+        monitor.ensure_started()
+        return monitor.active_alias
 
 
 def test_database_connections():
@@ -90,8 +142,11 @@ def test_database_connections():
     데이터베이스 연결 상태를 테스트하는 유틸리티 함수
     """
     results = {}
-    
-    for db_name in ['default', 'fallback']:
+
+    replica_aliases = list(getattr(settings, 'DATABASE_REPLICAS', {}).get('ALIASES', ()))
+    for db_name in ['default', 'fallback'] + replica_aliases:
+        if db_name not in settings.DATABASES:
+            continue
         try:
             connection = connections[db_name]
             with connection.cursor() as cursor:
@@ -102,13 +157,19 @@ def test_database_connections():
         except (DatabaseError, Exception) as e:
             results[db_name] = {'status': 'failed', 'error': str(e)}
             logger.error(f"Database '{db_name}' connection: FAILED - {e}")
-    
+
     return results
 
 
 def get_active_database():
     """
-    현재 활성 데이터베이스 반환
+    현재 활성 데이터베이스 반환 (헬스 모니터 프로브 1회 수행 후)
+    """
+    return get_health_monitor().probe_once()
+
+
+def get_database_health_metrics():
+    """
+    헬스 모니터 지표 반환 (프로브 지연시간, 전환 이벤트 등)
     """
-    router = DatabaseFallbackRouter()
-    return router._get_database()
\ No newline at end of file
+    return get_health_monitor().metrics()
@@ -35,6 +35,68 @@ JWT_ALGORITHM = 'HS256'
 JWT_ACCESS_EXPIRATION_MINUTES = 15  # 액세스 토큰: 15분
 JWT_REFRESH_EXPIRATION_DAYS = 7    # 리프레시 토큰: 7일
 
+# JWT 인증 캐시 (미들웨어의 토큰 검증/사용자 상태 조회 결과를 프로세스 단위로 캐시)
+# 사용자 상태는 post_save 시그널로 즉시 무효화되며, 다른 워커 프로세스에는 USER_TTL_SECONDS 안에 반영됨
+JWT_AUTH_CACHE = {
+    'ENABLED': os.getenv('JWT_AUTH_CACHE_ENABLED', 'True').lower() == 'true',
+    'TOKEN_MAX_ENTRIES': int(os.getenv('JWT_AUTH_CACHE_TOKEN_MAX_ENTRIES', '10000')),
+    'TOKEN_TTL_SECONDS': int(os.getenv('JWT_AUTH_CACHE_TOKEN_TTL', '60')),
+    'USER_MAX_ENTRIES': int(os.getenv('JWT_AUTH_CACHE_USER_MAX_ENTRIES', '5000')),
+    'USER_TTL_SECONDS': int(os.getenv('JWT_AUTH_CACHE_USER_TTL', '5')),
+}
+
+# STT 워커 풀 / 작업 큐 (transcription.workers)
+# 웹 프로세스가 여러 개인 운영 환경에서는 STT_WORKER_AUTOSTART=False 로 두고
+# `python manage.py run_transcription_workers` 를 별도 프로세스로 실행
+TRANSCRIPTION_WORKERS = {
+    'PROCESSES': int(os.getenv('STT_WORKER_PROCESSES', '2')),  # 모델을 로드한 워커 프로세스 수
+    'MAX_QUEUE_DEPTH': int(os.getenv('STT_MAX_QUEUE_DEPTH', '20')),  # 대기+처리 중 작업 상한 (초과 시 429)
+    'AUTOSTART': os.getenv('STT_WORKER_AUTOSTART', 'True').lower() == 'true',
+    'POLL_INTERVAL_SECONDS': float(os.getenv('STT_POLL_INTERVAL', '2')),
+    'JOB_TIMEOUT_SECONDS': int(os.getenv('STT_JOB_TIMEOUT', '600')),
+    'MAX_ATTEMPTS': int(os.getenv('STT_MAX_ATTEMPTS', '2')),
+    'MODEL': {
+        'MODEL_SIZE': os.getenv('STT_MODEL_SIZE', 'small'),
+        'DEVICE': os.getenv('STT_DEVICE', 'cpu'),
+        'COMPUTE_TYPE': os.getenv('STT_COMPUTE_TYPE', 'int8'),
+        'CPU_THREADS': int(os.getenv('STT_CPU_THREADS', '0')),  # 0 이면 코어 수 / 워커 수
+        'NUM_WORKERS': int(os.getenv('STT_MODEL_NUM_WORKERS', '1')),  # 모델 1개당 동시 변환 스레드 수
+        'BEAM_SIZE': int(os.getenv('STT_BEAM_SIZE', '1')),
+        'CHUNK_SECONDS': int(os.getenv('STT_CHUNK_SECONDS', '15')),  # 스트리밍 변환 청크 길이 (부분 결과 갱신 주기)
+        'BATCH_SIZE': int(os.getenv('STT_BATCH_SIZE', '8')),  # 배치 업로드 시 한 번에 추론하는 파일 수
+    },
+}
+
+# STT/OCR 결과 캐시 (미디어 SHA-256 기준, 같은 파일 재업로드 시 모델을 다시 돌리지 않음)
+MEDIA_RESULT_CACHE = {
+    'ENABLED': os.getenv('MEDIA_RESULT_CACHE_ENABLED', 'True').lower() == 'true',
+    'MAX_ENTRIES': int(os.getenv('MEDIA_RESULT_CACHE_MAX_ENTRIES', '5000')),  # 초과 시 LRU 제거
+}
+
+# 대시보드 통계 캐시 (사용자별 짧은 TTL, 주문/재고/결제/거래처 변경 시그널로 무효화)
+DASHBOARD_STATS_CACHE = {
+    'ENABLED': os.getenv('DASHBOARD_STATS_CACHE_ENABLED', 'True').lower() == 'true',
+    'TTL_SECONDS': int(os.getenv('DASHBOARD_STATS_CACHE_TTL', '30')),
+}
+
+# 재고 스냅샷 캐시 (재고 목록/재고 부족/재고 체크 API, 사용자별 짧은 TTL, 재고/어종 변경 시 무효화)
+INVENTORY_SNAPSHOT_CACHE = {
+    'ENABLED': os.getenv('INVENTORY_SNAPSHOT_CACHE_ENABLED', 'True').lower() == 'true',
+    'TTL_SECONDS': int(os.getenv('INVENTORY_SNAPSHOT_CACHE_TTL', '10')),
+}
+
+# 캐시 백엔드 - REDIS_URL 이 있으면 Redis 를 사용해 여러 워커 프로세스가 대시보드 통계/재고 스냅샷 캐시와 무효화를 공유
+# (없으면 Django 기본 프로세스 메모리 캐시, 다른 프로세스에는 TTL 안에 반영)
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'picko',
+        }
+    }
+
 # Toss Payments 설정
 TOSS_SECRET_KEY = os.getenv('TOSS_SECRET_KEY')  # .env 파일에서 설정
 TOSS_PAYMENT_KEY = os.getenv('TOSS_PAYMENT_KEY')  # .env 파일에서 설정
@@ -98,6 +160,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'core.middleware.JWTAuthMiddleware',
+    'core.middleware.DatabaseRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -228,6 +291,48 @@ DATABASES = {
 
 print(f"📊 데이터베이스 설정: {DEFAULT_DB_CONFIG['USER']}@{DEFAULT_DB_CONFIG['HOST']}:{DEFAULT_DB_CONFIG['PORT']}/{DEFAULT_DB_CONFIG['NAME']}")
 
+# Fallback 데이터베이스 (DATABASE_FALLBACK_ENABLED=True 일 때만 사용)
+DATABASE_FALLBACK_ENABLED = os.getenv('DATABASE_FALLBACK_ENABLED', 'False').lower() == 'true'
+if DATABASE_FALLBACK_ENABLED:
+    DATABASES['fallback'] = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.getenv('FALLBACK_DB_NAME', 'teamPicko'),
+        'USER': os.getenv('FALLBACK_DB_USER', 'teamPicko'),
+        'PASSWORD': os.getenv('FALLBACK_DB_PASSWORD', '12341234'),
+        'HOST': os.getenv('FALLBACK_DB_HOST', 'localhost'),
+        'PORT': os.getenv('FALLBACK_DB_PORT', '5432'),
+        'OPTIONS': {
+            'connect_timeout': 5,
+        },
+    }
+
+# 데이터베이스 헬스 모니터 (config.db_health) - 백그라운드 스레드에서 주기적으로 프로브
+DATABASE_HEALTH_CHECK = {
+    'INTERVAL_SECONDS': float(os.getenv('DB_HEALTH_CHECK_INTERVAL', '5')),
+    'FAIL_THRESHOLD': int(os.getenv('DB_HEALTH_FAIL_THRESHOLD', '2')),  # 연속 실패 N회 시 fallback 전환
+    'RECOVER_THRESHOLD': int(os.getenv('DB_HEALTH_RECOVER_THRESHOLD', '3')),  # 연속 성공 N회 시 primary 복귀
+}
+
+# 읽기 전용 replica (DB_REPLICA_HOSTS=host1,host2 → replica_1, replica_2)
+# 읽기는 지연 MAX_LAG_SECONDS 이내의 replica 로 분산되고, 쓰기를 한 사용자는 STICKY_SECONDS 동안 primary 고정
+# sticky 고정은 캐시에 저장되므로 워커 프로세스가 여러 개면 REDIS_URL 을 설정해야 모든 프로세스에 적용됨
+# (설정하지 않으면 프로세스별 메모리 캐시라 쓰기를 처리한 프로세스에서만 유지)
+DATABASE_REPLICAS = {
+    'ALIASES': [],
+    'MAX_LAG_SECONDS': float(os.getenv('DB_REPLICA_MAX_LAG', '5')),
+    'STICKY_SECONDS': int(os.getenv('DB_REPLICA_STICKY_SECONDS', '5')),
+}
+for index, replica_host in enumerate(filter(None, os.getenv('DB_REPLICA_HOSTS', '').split(',')), start=1):
+    replica_alias = f'replica_{index}'
+    DATABASES[replica_alias] = {
+        **DEFAULT_DB_CONFIG,
+        'HOST': replica_host.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS['ALIASES'].append(replica_alias)
+
+DATABASE_ROUTERS = ['config.db_router.DatabaseFallbackRouter']
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -408,6 +513,46 @@ AI_MODELS = {
     'HF_DISEASE_MODEL': os.getenv('HF_DISEASE_MODEL', 'fish-disease-classifier'),
     'CONFIDENCE_THRESHOLD': float(os.getenv('CONFIDENCE_THRESHOLD', '0.5')),
     'MODEL_CACHE_DIR': BASE_DIR / 'models',
+    'IMAGE_WORKERS': int(os.getenv('FISH_IMAGE_WORKERS', '0')),  # 배치 분석 전처리 스레드 수 (0: CPU 수, 최대 8)
+    'INFERENCE_BATCH_SIZE': int(os.getenv('FISH_INFERENCE_BATCH_SIZE', '16')),  # 탐지/분류 1회 추론 이미지 수
+    'ANNOTATED_IMAGE_OUTPUT': os.getenv('ANNOTATED_IMAGE_OUTPUT', 'url'),  # 광어 분석 표기 이미지: url(미디어 저장) / base64
+}
+
+# 생선 분석 모델 수명 주기 - MODE: lazy(첫 분석 시 로드) / eager(프로세스 시작 시 로드+워밍업, 준비 전 /health/ 503) / disabled(Mock)
+# 미설정 시 운영은 lazy, DEBUG 는 생선 분석기만 disabled (광어 분석기는 lazy). run_fish_analysis_workers 는 MODE 와 관계없이(disabled 제외) 시작 시 로드
+FISH_MODEL_LIFECYCLE = {
+    'MODE': os.getenv('FISH_MODEL_MODE', ''),
+    'WARMUP': os.getenv('FISH_MODEL_WARMUP', 'True').lower() == 'true',  # 로드 직후 빈 이미지로 워밍업 추론
+    'RETRY_SECONDS': int(os.getenv('FISH_MODEL_RETRY_SECONDS', '30')),  # 로드 실패 후 재시도 대기 (실패마다 두 배)
+    'MAX_RETRY_SECONDS': int(os.getenv('FISH_MODEL_MAX_RETRY_SECONDS', '600')),
+}
+
+# 생선 분석 비동기 작업 (async=true 업로드) - 운영에서는 AUTOSTART=False 후 run_fish_analysis_workers 를 별도 실행
+FISH_ANALYSIS_WORKERS = {
+    'THREADS': int(os.getenv('FISH_WORKER_THREADS', '2')),  # 동시에 실행하는 분석 작업 수
+    'MAX_QUEUE_DEPTH': int(os.getenv('FISH_MAX_QUEUE_DEPTH', '50')),  # 대기+처리 중 작업 상한 (초과 시 429)
+    'AUTOSTART': os.getenv('FISH_WORKER_AUTOSTART', 'True').lower() == 'true',
+    'POLL_INTERVAL_SECONDS': float(os.getenv('FISH_POLL_INTERVAL', '1')),
+    'JOB_TIMEOUT_SECONDS': int(os.getenv('FISH_JOB_TIMEOUT', '300')),
+    'MAX_ATTEMPTS': int(os.getenv('FISH_MAX_ATTEMPTS', '2')),
+    'LONG_POLL_MAX_SECONDS': int(os.getenv('FISH_LONG_POLL_MAX_SECONDS', '10')),  # gunicorn --timeout 30 보다 짧게
+}
+
+# 주문 일괄 가져오기 (POST /api/v1/orders/import/, import_orders 명령어)
+ORDER_IMPORT = {
+    'CHUNK_SIZE': int(os.getenv('ORDER_IMPORT_CHUNK_SIZE', '500')),  # 한 트랜잭션에 저장할 주문 수
+    'MAX_ROWS': int(os.getenv('ORDER_IMPORT_MAX_ROWS', '50000')),  # 요청 1회 최대 입력 행 수
+}
+
+# 경매 데이터 수집 (populate_auction_data) - 동시 요청/초당 요청 수/재시도/일괄 저장 크기
+AUCTION_INGEST = {
+    'WORKERS': int(os.getenv('AUCTION_INGEST_WORKERS', '8')),
+    'RATE_PER_SECOND': float(os.getenv('AUCTION_INGEST_RATE', '10')),  # 0: 제한 없음
+    'RETRIES': int(os.getenv('AUCTION_INGEST_RETRIES', '3')),
+    'BACKOFF_SECONDS': float(os.getenv('AUCTION_INGEST_BACKOFF', '0.5')),
+    'TIMEOUT_SECONDS': int(os.getenv('AUCTION_INGEST_TIMEOUT', '15')),
+    'PAGE_SIZE': int(os.getenv('AUCTION_INGEST_PAGE_SIZE', '1000')),
+    'BATCH_SIZE': int(os.getenv('AUCTION_INGEST_BATCH_SIZE', '1000')),
 }
 
 # API Keys
@@ -1,6 +1,7 @@
 """
 URL configuration for Team-PICK-O Backend project.
 """
+from django.apps import apps
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
@@ -36,8 +37,24 @@ def api_root(request):
     })
 
 def health_check(request):
-    """헬스 체크 엔드포인트"""
-    return JsonResponse({"status": "healthy"})
+    """
+    헬스 체크 엔드포인트 (생선 분석 모델 준비 상태 포함)
+    eager 모드 프로세스는 모델 로드/워밍업이 끝나기 전까지 503 을 반환합니다.
+    """
+    if not apps.is_installed('fish_analysis'):
+        return JsonResponse({"status": "healthy"})
+
+    from fish_analysis.model_lifecycle import model_lifecycle
+    models_ready = model_lifecycle.is_ready()
+    data = {
+        "status": "healthy",
+        "models_ready": models_ready,
+        "models": model_lifecycle.status(),
+    }
+    if model_lifecycle.requires_preload() and not models_ready:
+        data["status"] = "starting"
+        return JsonResponse(data, status=503)
+    return JsonResponse(data)
 
 def test_jwt(request):
     """JWT 검증 테스트 엔드포인트"""
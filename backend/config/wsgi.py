@@ -13,4 +13,14 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+# 생선 분석 모델 eager 모드: 웹 프로세스 시작 시 백그라운드에서 모델 로드 + 워밍업
+# (준비 전에는 /health/ 가 503 을 반환하므로 첫 사용자 요청에 로드 시간이 붙지 않음)
+from django.apps import apps  # noqa: E402
+
+if apps.is_installed('fish_analysis'):
+    from fish_analysis.model_lifecycle import model_lifecycle
+
+    if model_lifecycle.requires_preload():
+        model_lifecycle.preload(background=True)
\ No newline at end of file
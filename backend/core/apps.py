@@ -9,6 +9,9 @@ class CoreConfig(AppConfig):
         """
         Django 앱이 준비되었을 때 Firebase Admin SDK를 초기화합니다.
         """
+        # 인증 캐시 무효화 시그널 등록
+        import core.signals
+
         try:
             import firebase_admin
             from firebase_admin import credentials
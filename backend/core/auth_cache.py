@@ -0,0 +1,145 @@
+"""
+JWT 인증 캐시
+미들웨어가 요청마다 반복하는 토큰 서명 검증과 사용자 상태 DB 조회를 줄이기 위한 프로세스 단위 캐시
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class TTLCache:
+    """
+    크기 제한이 있는 TTL + LRU 캐시 (스레드 안전)
+    항목마다 만료 시각을 가지며, 최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_entries, ttl_seconds):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """캐시 조회 - 없거나 만료되었으면 None"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl_seconds=None):
+        """캐시 저장 - ttl_seconds가 주어지면 기본 TTL보다 짧은 쪽을 사용"""
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+    def __len__(self):
+        return len(self._data)
+
+
+_cache_settings = getattr(settings, 'JWT_AUTH_CACHE', {})
+
+# 토큰 문자열 → 검증된 페이로드 (토큰 만료 시각을 넘겨서 보관하지 않음)
+token_cache = TTLCache(
+    max_entries=_cache_settings.get('TOKEN_MAX_ENTRIES', 10000),
+    ttl_seconds=_cache_settings.get('TOKEN_TTL_SECONDS', 60),
+)
+
+# user_id → {'user_id', 'status', 'business_name'} (User 저장/삭제 시그널로 무효화)
+user_status_cache = TTLCache(
+    max_entries=_cache_settings.get('USER_MAX_ENTRIES', 5000),
+    ttl_seconds=_cache_settings.get('USER_TTL_SECONDS', 5),
+)
+
+
+def is_enabled():
+    return _cache_settings.get('ENABLED', True)
+
+
+def get_token_payload(token):
+    """캐시된 토큰 페이로드 반환 (없으면 None)"""
+    if not is_enabled():
+        return None
+    return token_cache.get(token)
+
+
+def cache_token_payload(token, payload):
+    """검증된 토큰 페이로드 저장 - 토큰의 exp를 넘지 않도록 TTL 제한"""
+    if not is_enabled():
+        return
+    exp = payload.get('exp')
+    ttl = None
+    if exp:
+        ttl = exp - time.time()
+    token_cache.set(token, payload, ttl)
+
+
+def get_user_status(user_id):
+    """캐시된 사용자 상태 정보 반환 (없으면 None)"""
+    if not is_enabled():
+        return None
+    return user_status_cache.get(user_id)
+
+
+def cache_user_status(user):
+    """사용자 상태 정보 저장 후 저장된 값을 반환"""
+    user_data = {
+        'user_id': user.id,
+        'status': user.status,
+        'business_name': user.business_name,
+    }
+    if is_enabled():
+        user_status_cache.set(user.id, user_data)
+    return user_data
+
+
+def invalidate_user(user_id):
+    """사용자 상태 캐시 무효화 (승인/정지 등 상태 변경 즉시 반영)"""
+    user_status_cache.delete(user_id)
+
+
+def get_cache_stats():
+    return {
+        'enabled': is_enabled(),
+        'token': token_cache.stats(),
+        'user_status': user_status_cache.stats(),
+    }
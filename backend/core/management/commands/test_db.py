@@ -3,7 +3,7 @@
 """
 from django.core.management.base import BaseCommand
 from django.db import connections
-from config.db_router import test_database_connections, get_active_database
+from config.db_router import test_database_connections, get_active_database, get_database_health_metrics
 
 
 class Command(BaseCommand):
@@ -47,6 +47,9 @@ class Command(BaseCommand):
                 self.style.WARNING(f'\n현재 활성 데이터베이스: {active_db}')
             )
 
+            if options['verbose']:
+                self.display_health_metrics(get_database_health_metrics())
+
     def test_single_database(self, db_name, verbose=False):
         """단일 데이터베이스 연결 테스트"""
         try:
@@ -103,4 +106,16 @@ class Command(BaseCommand):
                     self.style.ERROR(f'❌ {db_name}: 연결 실패')
                 )
                 if verbose and result['error']:
-                    self.stdout.write(f'  오류: {result["error"]}')
\ No newline at end of file
+                    self.stdout.write(f'  오류: {result["error"]}')
+
+    def display_health_metrics(self, metrics):
+        """헬스 모니터 지표 표시"""
+        self.stdout.write(f'\n헬스 모니터 (전환 {metrics["switch_count"]}회)')
+        for alias, state in metrics['databases'].items():
+            self.stdout.write(
+                f'  {alias}: healthy={state["healthy"]} '
+                f'지연(최근/평균/최대)={state["last_latency_ms"]}/{state["avg_latency_ms"]}/{state["max_latency_ms"]}ms '
+                f'실패={state["failure_count"]}/{state["probe_count"]}'
+            )
+        for event in metrics['switch_events']:
+            self.stdout.write(f'  전환: {event["from"]} → {event["to"]} ({event["reason"]})')
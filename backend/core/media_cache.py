@@ -0,0 +1,164 @@
+"""
+미디어 처리 결과 캐시 (콘텐츠 해시 기반)
+클라이언트가 타임아웃 후 같은 음성/이미지 파일을 다시 올리면 Whisper/Tesseract 를 다시 돌리지 않고
+이전 결과를 바로 반환합니다. 결과는 DB(media_result_cache)에 저장하고,
+MAX_ENTRIES 를 넘으면 가장 오래 사용되지 않은 항목부터 지웁니다(LRU).
+
+- 음성: 업로드 파일 바이트의 SHA-256 (디코딩 없이 청크 단위로 계산)
+- 이미지: 디코딩한 픽셀(모드/크기/데이터)의 SHA-256 - EXIF 등 메타데이터만 다른 파일도 같은 키
+"""
+import hashlib
+import json
+import logging
+import threading
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import MediaResultCacheEntry
+
+logger = logging.getLogger(__name__)
+
+KIND_STT = 'stt'
+KIND_OCR = 'ocr'
+
+
+class MediaResultCache:
+    """미디어 처리 결과 캐시 관리 클래스"""
+
+    _stats = {}
+    _stats_lock = threading.Lock()
+
+    @staticmethod
+    def _settings():
+        config = dict(getattr(settings, 'MEDIA_RESULT_CACHE', {}))
+        config.setdefault('ENABLED', True)
+        config.setdefault('MAX_ENTRIES', 5000)
+        return config
+
+    @staticmethod
+    def enabled():
+        return MediaResultCache._settings()['ENABLED']
+
+    # ------------------------------------------------------------------
+    # 해시
+    # ------------------------------------------------------------------
+    @staticmethod
+    def hash_file(uploaded_file):
+        """업로드 파일 전체의 SHA-256 (청크 단위로 읽고 파일 위치는 처음으로 되돌림)"""
+        digest = hashlib.sha256()
+        uploaded_file.seek(0)
+        for chunk in uploaded_file.chunks():
+            digest.update(chunk)
+        uploaded_file.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_image(image):
+        """PIL 이미지 픽셀 기준 SHA-256"""
+        digest = hashlib.sha256()
+        digest.update(f"{image.mode}:{image.size[0]}x{image.size[1]}:".encode())
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(kind, content_hash, params):
+        raw = f"{kind}:{content_hash}:{json.dumps(params, sort_keys=True)}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+    @staticmethod
+    def get(kind, content_hash, params):
+        """저장된 결과 텍스트 (없으면 None)"""
+        if not content_hash or not MediaResultCache.enabled():
+            return None
+
+        key = MediaResultCache.make_key(kind, content_hash, params)
+        text = MediaResultCacheEntry.objects.filter(key=key).values_list('result_text', flat=True).first()
+        if text is None:
+            MediaResultCache._record(kind, hit=False)
+            return None
+
+        MediaResultCacheEntry.objects.filter(key=key).update(
+            hit_count=F('hit_count') + 1,
+            last_used_at=timezone.now()
+        )
+        MediaResultCache._record(kind, hit=True)
+        logger.info(f"♻️ {kind.upper()} 결과 캐시 적중: {content_hash[:12]}")
+        return text
+
+    @staticmethod
+    def set(kind, content_hash, params, text):
+        """결과 저장 (빈 결과는 저장하지 않음) 후 크기 상한 초과분 제거"""
+        if not content_hash or not text or not MediaResultCache.enabled():
+            return
+
+        key = MediaResultCache.make_key(kind, content_hash, params)
+        try:
+            with transaction.atomic():
+                _, created = MediaResultCacheEntry.objects.update_or_create(
+                    key=key,
+                    defaults={
+                        'kind': kind,
+                        'content_hash': content_hash,
+                        'params': params,
+                        'result_text': text,
+                        'last_used_at': timezone.now(),
+                    }
+                )
+        except IntegrityError:
+            # 같은 파일을 동시에 처리한 다른 요청이 먼저 저장한 경우
+            return
+        if created:
+            MediaResultCache.evict()
+
+    @staticmethod
+    def evict(max_entries=None):
+        """MAX_ENTRIES 를 넘는 항목을 최근 사용일시가 오래된 순으로 삭제 - 삭제 수 반환"""
+        max_entries = max_entries or MediaResultCache._settings()['MAX_ENTRIES']
+        stale_keys = list(
+            MediaResultCacheEntry.objects.order_by('-last_used_at').values_list('key', flat=True)[max_entries:]
+        )
+        if not stale_keys:
+            return 0
+        deleted, _ = MediaResultCacheEntry.objects.filter(key__in=stale_keys).delete()
+        return deleted
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _record(kind, hit):
+        with MediaResultCache._stats_lock:
+            stats = MediaResultCache._stats.setdefault(kind, {'hits': 0, 'misses': 0})
+            stats['hits' if hit else 'misses'] += 1
+
+    @staticmethod
+    def metrics():
+        """종류별 적중/미스 (현재 프로세스) 및 저장 항목 수/누적 재사용 횟수 (DB)"""
+        from django.db.models import Count, Sum
+
+        with MediaResultCache._stats_lock:
+            process_stats = {kind: dict(stats) for kind, stats in MediaResultCache._stats.items()}
+
+        stored = {
+            row['kind']: row
+            for row in MediaResultCacheEntry.objects.values('kind').annotate(
+                entries=Count('key'), total_hits=Sum('hit_count')
+            )
+        }
+        metrics = {}
+        for kind in (KIND_STT, KIND_OCR):
+            stats = process_stats.get(kind, {'hits': 0, 'misses': 0})
+            lookups = stats['hits'] + stats['misses']
+            metrics[kind] = {
+                **stats,
+                'hit_rate': round(stats['hits'] / lookups, 3) if lookups else None,
+                'entries': stored.get(kind, {}).get('entries', 0),
+                'total_hits': stored.get(kind, {}).get('total_hits') or 0,
+            }
+        return metrics
@@ -9,6 +9,7 @@ from django.urls import resolve
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from business.models import User
+from core import auth_cache
 
 logger = logging.getLogger(__name__)
 
@@ -118,14 +119,20 @@ class JWTAuthMiddleware:
         logger.debug(f"🔑 JWT 토큰 추출: {token[:20]}...")
         
         try:
-            # JWT 토큰 검증 (전용 JWT 시크릿 키 사용)
-            logger.debug("🔐 JWT 토큰 검증 시작")
-            from core.jwt_utils import verify_access_token
-            payload = verify_access_token(token)
-            
-            if not payload:
-                logger.debug("❌ JWT 토큰 검증 실패")
-                return None
+            # JWT 토큰 검증 (캐시 우선, 미스 시 전용 JWT 시크릿 키로 검증)
+            payload = auth_cache.get_token_payload(token)
+            if payload:
+                logger.debug("⚡ JWT 토큰 캐시 히트")
+            else:
+                logger.debug("🔐 JWT 토큰 검증 시작")
+                from core.jwt_utils import verify_access_token
+                payload = verify_access_token(token)
+                
+                if not payload:
+                    logger.debug("❌ JWT 토큰 검증 실패")
+                    return None
+                
+                auth_cache.cache_token_payload(token, payload)
                 
             user_id = payload.get('user_id')
             logger.debug(f"✅ JWT 토큰 검증 성공: user_id={user_id}")
@@ -134,27 +141,28 @@ class JWTAuthMiddleware:
                 logger.debug("❌ JWT 페이로드에 user_id 없음")
                 return None
             
-            # 데이터베이스에서 사용자 정보 조회 및 승인 상태 확인
-            logger.debug(f"👤 사용자 정보 DB 조회: user_id={user_id}")
-            try:
-                user = User.objects.get(id=user_id)
-                logger.debug(f"✅ 사용자 정보 조회 성공: {user.business_name} (status: {user.status})")
-                
-                # 승인 상태 확인 (pending, rejected, suspended는 접근 제한)
-                if user.status not in ['approved']:
-                    logger.warning(f"❌ User {user_id} status: {user.status} - 접근 거부")
+            # 사용자 승인 상태 확인 (캐시 우선, 미스 시 DB 조회)
+            user_data = auth_cache.get_user_status(user_id)
+            if user_data:
+                logger.debug(f"⚡ 사용자 상태 캐시 히트: user_id={user_id}")
+            else:
+                logger.debug(f"👤 사용자 정보 DB 조회: user_id={user_id}")
+                try:
+                    user = User.objects.only('id', 'status', 'business_name').get(id=user_id)
+                except ObjectDoesNotExist:
+                    logger.warning(f"User {user_id} not found in database")
                     return None
                 
-                logger.debug(f"✅ 사용자 승인 상태 확인 완료: {user.status}")
-                return {
-                    'user_id': user.id,
-                    'status': user.status,
-                    'business_name': user.business_name
-                }
-                
-            except ObjectDoesNotExist:
-                logger.warning(f"User {user_id} not found in database")
+                logger.debug(f"✅ 사용자 정보 조회 성공: {user.business_name} (status: {user.status})")
+                user_data = auth_cache.cache_user_status(user)
+            
+            # 승인 상태 확인 (pending, rejected, suspended는 접근 제한)
+            if user_data['status'] not in ['approved']:
+                logger.warning(f"❌ User {user_id} status: {user_data['status']} - 접근 거부")
                 return None
+            
+            logger.debug(f"✅ 사용자 승인 상태 확인 완료: {user_data['status']}")
+            return user_data
                 
         except jwt.ExpiredSignatureError:
             logger.warning("JWT 토큰 만료됨")
@@ -164,6 +172,47 @@ class JWTAuthMiddleware:
             return None
 
 
+class DatabaseRoutingMiddleware:
+    """
+    읽기 replica 라우팅용 요청 컨텍스트 관리 미들웨어
+    - 쓰기 메서드(POST/PUT/PATCH/DELETE) 요청은 처음부터 primary 에 고정
+    - 쓰기가 발생한 사용자는 STICKY_SECONDS 동안 모든 요청을 primary 로 보냄 (자기 쓰기 즉시 조회 보장)
+    JWTAuthMiddleware 뒤에 위치해야 request.user_id 를 사용할 수 있습니다.
+    sticky 표시는 Django 캐시에 저장하므로 여러 워커 프로세스에서 유지하려면 REDIS_URL(공유 캐시)이 필요합니다.
+    기본 프로세스 메모리 캐시에서는 쓰기를 처리한 프로세스 안에서만 유지됩니다.
+    """
+    UNSAFE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+    STICKY_CACHE_KEY = 'db_router:sticky_primary:{user_id}'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        replica_settings = getattr(settings, 'DATABASE_REPLICAS', {})
+        self.enabled = bool(replica_settings.get('ALIASES'))
+        self.sticky_seconds = replica_settings.get('STICKY_SECONDS', 5)
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        from django.core.cache import cache
+        from config import db_router
+
+        user_id = getattr(request, 'user_id', None)
+        pinned = request.method in self.UNSAFE_METHODS
+        if not pinned and user_id:
+            pinned = bool(cache.get(self.STICKY_CACHE_KEY.format(user_id=user_id)))
+
+        tokens = db_router.reset_request_routing(pinned=pinned)
+        try:
+            response = self.get_response(request)
+            if user_id and db_router.has_written():
+                cache.set(self.STICKY_CACHE_KEY.format(user_id=user_id), True, self.sticky_seconds)
+                logger.debug(f"📌 user_id={user_id} primary 고정 {self.sticky_seconds}초")
+            return response
+        finally:
+            db_router.restore_request_routing(tokens)
+
+
 class UserValidationMixin:
     """
     View에서 사용할 수 있는 믹스인
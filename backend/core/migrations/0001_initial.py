@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:44
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaResultCacheEntry',
+            fields=[
+                ('key', models.CharField(max_length=64, primary_key=True, serialize=False, verbose_name='캐시 키')),
+                ('kind', models.CharField(choices=[('stt', '음성 인식'), ('ocr', '이미지 텍스트 인식')], max_length=10, verbose_name='종류')),
+                ('content_hash', models.CharField(max_length=64, verbose_name='미디어 SHA-256')),
+                ('params', models.JSONField(default=dict, verbose_name='모델/언어 파라미터')),
+                ('result_text', models.TextField(verbose_name='결과 텍스트')),
+                ('hit_count', models.PositiveIntegerField(default=0, verbose_name='재사용 횟수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('last_used_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='최근 사용일시')),
+            ],
+            options={
+                'verbose_name': '미디어 처리 결과 캐시',
+                'verbose_name_plural': '미디어 처리 결과 캐시',
+                'db_table': 'media_result_cache',
+            },
+        ),
+    ]
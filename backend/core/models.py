@@ -0,0 +1,31 @@
+from django.db import models
+from django.utils import timezone
+
+
+class MediaResultCacheEntry(models.Model):
+    """
+    미디어 처리 결과 캐시 (STT/OCR)
+    key = SHA-256(종류 + 정규화한 미디어의 SHA-256 + 모델/언어 파라미터)
+    같은 파일을 다시 올리면 모델을 다시 돌리지 않고 저장된 텍스트를 반환합니다.
+    """
+    KIND_CHOICES = [
+        ('stt', '음성 인식'),
+        ('ocr', '이미지 텍스트 인식'),
+    ]
+
+    key = models.CharField(max_length=64, primary_key=True, verbose_name="캐시 키")
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, verbose_name="종류")
+    content_hash = models.CharField(max_length=64, verbose_name="미디어 SHA-256")
+    params = models.JSONField(default=dict, verbose_name="모델/언어 파라미터")
+    result_text = models.TextField(verbose_name="결과 텍스트")
+    hit_count = models.PositiveIntegerField(default=0, verbose_name="재사용 횟수")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True, verbose_name="최근 사용일시")
+
+    class Meta:
+        db_table = 'media_result_cache'
+        verbose_name = '미디어 처리 결과 캐시'
+        verbose_name_plural = '미디어 처리 결과 캐시'
+
+    def __str__(self):
+        return f"{self.kind} {self.content_hash[:12]} ({self.hit_count}회 재사용)"
@@ -0,0 +1,21 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+import logging
+
+from business.models import User
+from core import auth_cache
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_status_on_save(sender, instance, **kwargs):
+    """사용자 저장 시 인증 캐시의 상태 정보 무효화 (승인/정지 즉시 반영)"""
+    auth_cache.invalidate_user(instance.id)
+    logger.debug(f"🧹 사용자 상태 캐시 무효화: user_id={instance.id}")
+
+
+@receiver(post_delete, sender=User)
+def invalidate_user_status_on_delete(sender, instance, **kwargs):
+    """사용자 삭제 시 인증 캐시의 상태 정보 무효화"""
+    auth_cache.invalidate_user(instance.id)
@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class DashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'dashboard'
-    verbose_name = '관리 대시보드'
\ No newline at end of file
+    verbose_name = '관리 대시보드'
+
+    def ready(self):
+        # 대시보드 통계 캐시 무효화 시그널 등록
+        import dashboard.signals
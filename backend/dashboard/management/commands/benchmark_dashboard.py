@@ -0,0 +1,138 @@
+"""
+대시보드 통계 이전 구현과 단일 SQL 집계 구현을 비교하는 벤치마크 명령어
+임시 사용자에 거래처/주문/재고 데이터를 생성해 측정하고, 끝나면 트랜잭션을 롤백해 데이터를 남기지 않습니다.
+"""
+import random
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+from django.test.utils import CaptureQueriesContext
+
+from business.models import User, Business
+from dashboard.services import DashboardStatsService
+from fish_registry.models import FishType
+from inventory.models import Inventory
+from order.models import Order
+from payment.ledger import ReceivableLedger
+from payment.models import Payment, BusinessReceivable, OrderReceivable
+
+
+class _Rollback(Exception):
+    """벤치마크 데이터 롤백용"""
+
+
+class Command(BaseCommand):
+    help = '대시보드 통계 이전 구현과 단일 SQL 집계 구현의 지연시간/쿼리 수를 비교합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--businesses', type=int, nargs='+', default=[10, 100, 500],
+                            help='측정할 거래처 수 (여러 값 지정 가능)')
+        parser.add_argument('--orders-per-business', type=int, default=20, help='거래처당 주문 수')
+        parser.add_argument('--inventories', type=int, default=50, help='재고 항목 수')
+        parser.add_argument('--iterations', type=int, default=30, help='구현별 반복 측정 횟수')
+
+    def handle(self, *args, **options):
+        for business_count in options['businesses']:
+            try:
+                with transaction.atomic():
+                    user = self._generate_dataset(
+                        business_count, options['orders_per_business'], options['inventories']
+                    )
+                    self._compare(user, business_count, options['iterations'])
+                    raise _Rollback()
+            except _Rollback:
+                pass
+
+    def _generate_dataset(self, business_count, orders_per_business, inventory_count):
+        """시그널 없이 bulk_create 로 데이터 생성 후 해당 사용자의 미수금 원장만 채움"""
+        user = User.objects.create(
+            username=f'bench_{uuid.uuid4().hex[:12]}', business_name='벤치마크수산', status='approved'
+        )
+        businesses = Business.objects.bulk_create([
+            Business(user=user, business_name=f'거래처{i}', phone_number='01000000000', address='부산')
+            for i in range(business_count)
+        ])
+        fish_types = FishType.objects.bulk_create([
+            FishType(user=user, name=f'어종{i}', unit='kg') for i in range(inventory_count)
+        ])
+        Inventory.objects.bulk_create([
+            Inventory(user=user, fish_type=fish_type, stock_quantity=random.randint(0, 50), unit='kg')
+            for fish_type in fish_types
+        ])
+
+        statuses = ['placed', 'ready', 'delivered', 'cancelled']
+        Order.objects.bulk_create([
+            Order(
+                user=user, business=business, total_price=random.randint(1, 100) * 1000,
+                source_type='manual', order_status=random.choice(statuses)
+            )
+            for business in businesses
+            for _ in range(orders_per_business)
+        ], batch_size=1000)
+
+        orders = list(Order.objects.filter(user=user).values_list('id', 'business_id', 'total_price'))
+        Payment.objects.bulk_create([
+            Payment(order_id=order_id, business_id=business_id, amount=total_price,
+                    method='cash', payment_status='paid')
+            for order_id, business_id, total_price in orders
+            if random.random() < 0.5
+        ], batch_size=1000)
+
+        receivable_orders = ReceivableLedger.receivable_orders().filter(user=user)
+        OrderReceivable.objects.bulk_create([
+            OrderReceivable(order_id=order_id, business_id=business_id, amount=total_price)
+            for order_id, business_id, total_price in receivable_orders.values_list('id', 'business_id', 'total_price')
+        ], batch_size=1000)
+        balances = {
+            row['business_id']: row
+            for row in receivable_orders.values('business_id').annotate(total=Sum('total_price'), count=Count('id'))
+        }
+        BusinessReceivable.objects.bulk_create([
+            BusinessReceivable(
+                business=business,
+                outstanding_balance=balances.get(business.id, {}).get('total') or 0,
+                unpaid_order_count=balances.get(business.id, {}).get('count') or 0
+            )
+            for business in businesses
+        ])
+        return user
+
+    def _measure(self, func, user_id, iterations):
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as context:
+            result = func(user_id)
+        query_count = len(context)
+
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            func(user_id)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+        return result, query_count, statistics.median(timings), p95
+
+    def _compare(self, user, business_count, iterations):
+        order_count = Order.objects.filter(user=user).count()
+        self.stdout.write(self.style.SUCCESS(
+            f'\n📊 거래처 {business_count}곳 / 주문 {order_count}건 ({iterations}회 측정)'
+        ))
+
+        legacy, legacy_queries, legacy_p50, legacy_p95 = self._measure(
+            DashboardStatsService.compute_stats_legacy, user.id, iterations
+        )
+        current, current_queries, current_p50, current_p95 = self._measure(
+            DashboardStatsService.compute_stats, user.id, iterations
+        )
+
+        self.stdout.write(f'  이전 구현   : 쿼리 {legacy_queries:>5}개, p50 {legacy_p50:8.2f}ms, p95 {legacy_p95:8.2f}ms')
+        self.stdout.write(f'  단일 SQL 집계: 쿼리 {current_queries:>5}개, p50 {current_p50:8.2f}ms, p95 {current_p95:8.2f}ms')
+
+        if legacy != current:
+            self.stdout.write(self.style.ERROR(f'  ❌ 결과 불일치: 이전 {legacy} / 현재 {current}'))
+        else:
+            self.stdout.write(self.style.SUCCESS('  ✅ 결과 일치'))
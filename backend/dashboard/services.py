@@ -0,0 +1,129 @@
+"""
+대시보드 통계 집계 서비스
+대시보드 타일(오늘 주문, 재고 부족, 미수금 합계, 거래처 수)을 스칼라 서브쿼리로 묶어 SQL 한 번에 계산하고,
+결과는 사용자별로 짧게 캐시합니다. 캐시는 dashboard.signals 에서 데이터 변경 시 무효화됩니다.
+"""
+import logging
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Sum, OuterRef, Subquery, IntegerField, BigIntegerField, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from business.models import User, Business
+from inventory.models import Inventory
+from order.models import Order
+from payment.models import BusinessReceivable
+
+logger = logging.getLogger(__name__)
+
+# 재고 부족 기준 (재고수량 <= 10)
+LOW_STOCK_THRESHOLD = 10
+
+
+def _day_range(day):
+    """로컬 날짜 하루의 [시작, 끝) 시각 - __date 변환 없이 인덱스 범위 검색에 사용"""
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return start, start + timedelta(days=1)
+
+
+def _count_subquery(queryset, field_type=IntegerField):
+    """사용자별 COUNT 스칼라 서브쿼리 (행이 없으면 0)"""
+    subquery = queryset.order_by().values('user_id').annotate(value=Count('pk')).values('value')
+    return Coalesce(Subquery(subquery, output_field=field_type()), Value(0))
+
+
+class DashboardStatsService:
+    """대시보드 통계 집계 클래스"""
+
+    CACHE_KEY = 'dashboard:stats:{user_id}'
+
+    @staticmethod
+    def _cache_settings():
+        return getattr(settings, 'DASHBOARD_STATS_CACHE', {})
+
+    @staticmethod
+    def get_stats(user_id):
+        """캐시된 통계 반환 (없으면 계산 후 캐시)"""
+        config = DashboardStatsService._cache_settings()
+        if not config.get('ENABLED', True):
+            return DashboardStatsService.compute_stats(user_id)
+
+        cache_key = DashboardStatsService.CACHE_KEY.format(user_id=user_id)
+        stats = cache.get(cache_key)
+        if stats is not None:
+            return stats
+
+        stats = DashboardStatsService.compute_stats(user_id)
+        cache.set(cache_key, stats, config.get('TTL_SECONDS', 30))
+        return stats
+
+    @staticmethod
+    def compute_stats(user_id, today=None):
+        """대시보드 통계를 단일 SQL 로 계산"""
+        today = today or timezone.localdate()
+        day_start, day_end = _day_range(today)
+
+        outstanding = BusinessReceivable.objects.filter(
+            business__user_id=OuterRef('pk')
+        ).order_by().values('business__user_id').annotate(
+            value=Sum('outstanding_balance')
+        ).values('value')
+
+        row = User.objects.filter(id=user_id).annotate(
+            today_orders=_count_subquery(
+                Order.objects.filter(
+                    user_id=OuterRef('pk'), order_datetime__gte=day_start, order_datetime__lt=day_end
+                )
+            ),
+            low_stock_count=_count_subquery(
+                Inventory.objects.filter(user_id=OuterRef('pk'), stock_quantity__lte=LOW_STOCK_THRESHOLD)
+            ),
+            total_outstanding=Coalesce(
+                Subquery(outstanding, output_field=BigIntegerField()), Value(0)
+            ),
+            business_count=_count_subquery(Business.objects.filter(user_id=OuterRef('pk'))),
+        ).values('today_orders', 'low_stock_count', 'total_outstanding', 'business_count').first()
+
+        row = row or {}
+        return {
+            'todayOrders': row.get('today_orders', 0),
+            'lowStockCount': row.get('low_stock_count', 0),
+            'totalOutstandingBalance': float(row.get('total_outstanding', 0)),
+            'businessCount': row.get('business_count', 0),
+        }
+
+    @staticmethod
+    def compute_stats_legacy(user_id, today=None):
+        """
+        이전 구현 (벤치마크 비교용)
+        타일마다 쿼리를 보내고 거래처마다 미수금을 직접 계산하므로 거래처 수에 비례해 쿼리가 늘어납니다.
+        """
+        today = today or timezone.localdate()
+
+        today_orders = Order.objects.filter(user_id=user_id, order_datetime__date=today).count()
+        low_stock_count = Inventory.objects.filter(
+            user_id=user_id, stock_quantity__lte=LOW_STOCK_THRESHOLD
+        ).count()
+        total_outstanding = 0
+        for business in Business.objects.filter(user_id=user_id):
+            total_outstanding += business.compute_outstanding_balance()
+        business_count = Business.objects.filter(user_id=user_id).count()
+
+        return {
+            'todayOrders': today_orders,
+            'lowStockCount': low_stock_count,
+            'totalOutstandingBalance': float(total_outstanding),
+            'businessCount': business_count,
+        }
+
+    @staticmethod
+    def invalidate(user_id):
+        """사용자 통계 캐시 무효화 - 커밋 후에도 한 번 더 지워서 커밋 전 재계산된 값이 남지 않게 함"""
+        if not user_id:
+            return
+        cache_key = DashboardStatsService.CACHE_KEY.format(user_id=user_id)
+        cache.delete(cache_key)
+        transaction.on_commit(lambda: cache.delete(cache_key))
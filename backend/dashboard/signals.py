@@ -0,0 +1,31 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+import logging
+
+from business.models import Business
+from inventory.models import Inventory
+from order.models import Order
+from payment.models import Payment
+from .services import DashboardStatsService
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+@receiver(post_save, sender=Inventory)
+@receiver(post_delete, sender=Inventory)
+@receiver(post_save, sender=Business)
+@receiver(post_delete, sender=Business)
+def invalidate_dashboard_stats(sender, instance, **kwargs):
+    """주문/재고/거래처 변경 시 해당 사용자의 대시보드 통계 캐시 무효화"""
+    DashboardStatsService.invalidate(instance.user_id)
+    logger.debug(f"🧹 대시보드 통계 캐시 무효화: user_id={instance.user_id} ({sender.__name__})")
+
+
+@receiver(post_save, sender=Payment)
+@receiver(post_delete, sender=Payment)
+def invalidate_dashboard_stats_on_payment(sender, instance, **kwargs):
+    """결제 변경 시 (미수금 합계) 주문 소유자의 대시보드 통계 캐시 무효화"""
+    user_id = Order.objects.filter(id=instance.order_id).values_list('user_id', flat=True).first()
+    DashboardStatsService.invalidate(user_id)
@@ -4,10 +4,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import status
 from django.db.models import Sum, Count
-from datetime import datetime, date
+from datetime import datetime
 from order.models import Order
-from inventory.models import Inventory
-from business.models import Business
+from inventory.services import InventorySnapshotService, snapshot_response
+from .services import DashboardStatsService
 
 
 @api_view(['GET'])
@@ -32,36 +32,8 @@ class DashboardStatsView(APIView):
             if not hasattr(request, 'user_id') or not request.user_id:
                 return Response({'error': '사용자 인증이 필요합니다.'}, status=status.HTTP_401_UNAUTHORIZED)
             
-            user_id = request.user_id
-            today = date.today()
-            
-            # 1. 오늘 주문 건수
-            today_orders = Order.objects.filter(
-                user_id=user_id,
-                order_datetime__date=today
-            ).count()
-            
-            # 2. 재고 부족 어종 수 계산 (재고수량 <= 10)
-            low_stock_count = Inventory.objects.filter(
-                user_id=user_id,
-                stock_quantity__lte=10
-            ).count()
-            
-            # 3. 전체 미수금 합계 (각 거래처별로 계산해서 합산)
-            businesses = Business.objects.filter(user_id=user_id)
-            total_outstanding = 0
-            for business in businesses:
-                total_outstanding += business.outstanding_balance
-            
-            # 4. 거래처 수
-            business_count = Business.objects.filter(user_id=user_id).count()
-            
-            return Response({
-                'todayOrders': today_orders,
-                'lowStockCount': low_stock_count,
-                'totalOutstandingBalance': float(total_outstanding),
-                'businessCount': business_count
-            })
+            # 단일 SQL 집계 + 사용자별 캐시 (dashboard.services)
+            return Response(DashboardStatsService.get_stats(request.user_id))
             
         except Exception as e:
             return Response({
@@ -82,20 +54,20 @@ class DashboardRecentOrdersView(APIView):
             user_id = request.user_id
             limit = int(request.GET.get('limit', 10))
             
-            # 최근 주문 조회 (business는 property이므로 select_related 사용 불가)
+            # 최근 주문 조회 (거래처는 JOIN, 주문 품목은 prefetch 로 일괄 조회)
             recent_orders = Order.objects.filter(
                 user_id=user_id
-            ).prefetch_related('items__fish_type').order_by('-order_datetime')[:limit]
+            ).select_related('business').prefetch_related('items__fish_type').order_by('-order_datetime')[:limit]
             
             # 주문 데이터 정리
             orders_data = []
             for order in recent_orders:
-                # 주문 아이템들을 요약 (related_name이 'items'임)
-                order_items = order.items.all()
-                items_count = order_items.count()
+                # 주문 아이템들을 요약 (related_name이 'items'임, prefetch 결과 사용)
+                order_items = list(order.items.all())
+                items_count = len(order_items)
                 
                 if items_count > 0:
-                    first_item = order_items.first()
+                    first_item = order_items[0]
                     if items_count > 1:
                         items_summary = f"{first_item.fish_type.name} 외 {items_count-1}종"
                     else:
@@ -130,25 +102,9 @@ class DashboardLowStockView(APIView):
             if not hasattr(request, 'user_id') or not request.user_id:
                 return Response({'error': '사용자 인증이 필요합니다.'}, status=status.HTTP_401_UNAUTHORIZED)
             
-            user_id = request.user_id
-            
-            # 재고 부족 어종 조회 (재고수량 <= 10)
-            low_stock_inventories = Inventory.objects.filter(
-                user_id=user_id,
-                stock_quantity__lte=10
-            ).select_related('fish_type')
-            
-            stock_summary = []
-            for inventory in low_stock_inventories:
-                stock_summary.append({
-                    'fish_name': inventory.fish_type.name,
-                    'stock_quantity': inventory.stock_quantity,
-                    'ordered_quantity': inventory.ordered_quantity,
-                    'unit': inventory.unit,
-                    'status': 'out_of_stock' if inventory.stock_quantity <= 0 else 'low'
-                })
-            
-            return Response(stock_summary)
+            # 재고 부족 어종 (재고수량 <= 10) - 사용자 재고 스냅샷에 미리 만들어 둔 JSON, If-None-Match 시 304
+            body, etag = InventorySnapshotService.get_snapshot(request.user_id)['low_stock_json']
+            return snapshot_response(request, body, etag)
             
         except Exception as e:
             return Response({
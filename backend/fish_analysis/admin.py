@@ -5,7 +5,7 @@ from django.urls import reverse
 from django.db.models import Count
 import json
 
-from .models import FishAnalysis, DetectionBox, DiseaseDetection, AnalysisSession
+from .models import FishAnalysis, DetectionBox, DiseaseDetection, AnalysisSession, FishAnalysisJob
 
 
 @admin.register(FishAnalysis)
@@ -253,6 +253,20 @@ class AnalysisSessionAdmin(admin.ModelAdmin):
     healthy_percentage_display.short_description = '건강도'
 
 
+@admin.register(FishAnalysisJob)
+class FishAnalysisJobAdmin(admin.ModelAdmin):
+    """비동기 분석 작업 관리"""
+    
+    list_display = ['id_short', 'job_type', 'status', 'user', 'attempts', 'created_at', 'completed_at']
+    list_filter = ['job_type', 'status', 'created_at']
+    search_fields = ['id', 'user__username', 'error_message']
+    readonly_fields = ['id', 'analysis', 'result', 'timings', 'created_at', 'started_at', 'completed_at', 'updated_at']
+    
+    def id_short(self, obj):
+        return str(obj.id)[:8] + '...'
+    id_short.short_description = 'ID'
+
+
 # Django Admin 사이트 커스터마이징
 admin.site.site_header = "Team-PICK-O 관리자"
 admin.site.site_title = "Team-PICK-O Admin"
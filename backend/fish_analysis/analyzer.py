@@ -1,19 +1,23 @@
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
 from PIL import Image
-import torch
 from typing import List, Optional, Tuple, Dict, Any
 import logging
 from datetime import datetime
 import uuid
 import asyncio
 import httpx
-from io import BytesIO
 from django.conf import settings
 from django.core.files.base import ContentFile
+from django.db import transaction
 
 from .models import FishAnalysis, DetectionBox, DiseaseDetection
+from .image_preprocessing import load_bgr_image
+from .model_lifecycle import model_lifecycle, warmup_image, FISH_ANALYZER
 
 # YOLOv8 및 Hugging Face 관련 임포트 (설치 후 주석 해제)
 # from ultralytics import YOLO
@@ -21,15 +25,39 @@ from .models import FishAnalysis, DetectionBox, DiseaseDetection
 
 logger = logging.getLogger(__name__)
 
+# 이미지 디코딩/품질 평가용 공유 스레드 풀 (요청마다 새로 만들지 않음)
+_image_pool = None
+_image_pool_lock = threading.Lock()
+
+
+def _get_image_pool() -> ThreadPoolExecutor:
+    """프로세스 단위 이미지 전처리 스레드 풀 싱글톤 반환"""
+    global _image_pool
+    if _image_pool is None:
+        with _image_pool_lock:
+            if _image_pool is None:
+                ai_config = getattr(settings, 'AI_MODELS', {})
+                workers = ai_config.get('IMAGE_WORKERS') or min(8, os.cpu_count() or 1)
+                _image_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fish-image')
+    return _image_pool
+
+
 class DjangoFishAnalyzer:
     """Django용 생선 상태 분석기"""
     
+    # 종류 분류 모델 클래스 ID → 종류
+    SPECIES_MAPPING = {0: 'flatfish', 1: 'unknown'}
+    
     def __init__(self):
         self.yolo_model = None
         self.disease_model = None
+        self.disease_processor = None
         self.species_model = None
+        self.species_processor = None
         self.model_loaded = False
         self.last_updated = None
+        # 여러 요청이 동시에 배치 추론을 돌리면 모델 메모리/스레드를 두고 경쟁하므로 한 번에 한 배치씩 실행
+        self._inference_lock = threading.Lock()
         
     def initialize_models(self):
         """모델 초기화 (동기 버전)"""
@@ -58,6 +86,15 @@ class DjangoFishAnalyzer:
         except Exception as e:
             logger.error(f"❌ 모델 로드 실패: {str(e)}")
             self.model_loaded = False
+    
+    def warmup(self):
+        """워밍업 추론 - 빈 이미지로 탐지/분류를 한 번 실행해 첫 요청의 초기화 비용(커널 선택, 메모리 할당)을 미리 처리"""
+        image = warmup_image()
+        self._assess_image_quality(image)
+        if self.yolo_model is not None:
+            self._detect_fish_batch([image], 0.5)
+        if self.species_model is not None:
+            self._classify_species_batch([image])
             
     def analyze_image_sync(
         self, 
@@ -67,11 +104,19 @@ class DjangoFishAnalyzer:
         analyze_health: bool = True, 
         analyze_diseases: bool = True,
         confidence_threshold: float = 0.5,
-        session=None
+        session=None,
+        timings: Optional[Dict[str, float]] = None
     ) -> FishAnalysis:
-        """이미지 분석 메인 함수 (Django 동기 버전)"""
+        """
+        이미지 분석 메인 함수 (Django 동기 버전)
+        timings 딕셔너리를 넘기면 단계별 처리 시간(preprocess/inference, 초)을 기록합니다.
+        """
+        
+        # 모델 준비 (lazy 모드에서는 첫 분석 시 로드, 로드 시간은 단계별 처리 시간에서 제외)
+        model_lifecycle.ensure_ready(FISH_ANALYZER)
         
         start_time = datetime.now()
+        timings = timings if timings is not None else {}
         
         try:
             # 이미지 전처리
@@ -80,6 +125,7 @@ class DjangoFishAnalyzer:
             
             # 이미지 품질 평가
             quality_score = self._assess_image_quality(image)
+            timings['preprocess'] = (datetime.now() - start_time).total_seconds()
             
             # Django 모델 인스턴스 생성
             analysis = FishAnalysis.objects.create(
@@ -105,6 +151,7 @@ class DjangoFishAnalyzer:
                 return self._generate_mock_result(analysis, warnings)
             
             # 1. YOLOv8으로 생선 탐지
+            inference_start = datetime.now()
             detection_boxes = self._detect_fish_sync(image, confidence_threshold)
             analysis.fish_detected = len(detection_boxes) > 0
             
@@ -119,6 +166,7 @@ class DjangoFishAnalyzer:
                 )
             
             if not analysis.fish_detected:
+                timings['inference'] = (datetime.now() - inference_start).total_seconds()
                 warnings.append("이미지에서 생선을 찾을 수 없습니다.")
                 analysis.warning_messages = warnings
                 analysis.save()
@@ -149,6 +197,8 @@ class DjangoFishAnalyzer:
                         treatment_recommendation=disease_data.get('treatment_recommendation', '')
                     )
                 
+            timings['inference'] = (datetime.now() - inference_start).total_seconds()
+                
             # 4. 권장사항 생성
             recommendations = self._generate_recommendations(analysis)
             analysis.recommendations = recommendations
@@ -167,28 +217,181 @@ class DjangoFishAnalyzer:
             logger.error(f"❌ 이미지 분석 실패: {str(e)}")
             raise
             
-    def _preprocess_image(self, image_bytes: bytes) -> np.ndarray:
-        """이미지 전처리"""
+    def analyze_batch_sync(
+        self,
+        images_bytes: List[bytes],
+        user=None,
+        analyze_species: bool = True,
+        analyze_health: bool = True,
+        analyze_diseases: bool = True,
+        confidence_threshold: float = 0.5,
+        session=None
+    ) -> List[Optional[FishAnalysis]]:
+        """
+        여러 이미지 배치 분석 (Django 동기 버전)
+        - 디코딩/전처리와 품질 평가는 공유 스레드 풀에서 이미지별로 동시에 실행
+        - 생선 탐지/종류 분류는 이미지를 모아 배치 추론으로 한 번에 실행
+        - FishAnalysis/DetectionBox/DiseaseDetection 은 한 트랜잭션에서 bulk_create 로 저장
+        반환: 입력 순서대로 FishAnalysis (이미지를 읽지 못한 항목은 None)
+        """
+        model_lifecycle.ensure_ready(FISH_ANALYZER)
+        start_time = time.perf_counter()
+        
+        # 1. 전처리 + 품질 평가 (이미지별 병렬)
+        prepared = list(_get_image_pool().map(self._prepare_image_safe, images_bytes))
+        valid = [index for index, item in enumerate(prepared) if item is not None]
+        if not valid:
+            return [None] * len(images_bytes)
+        
+        images = [prepared[index]['image'] for index in valid]
+        boxes_by_image = {index: [] for index in valid}
+        diseases_by_image = {index: [] for index in valid}
+        species_by_image = {}
+        health_by_image = {}
+        
+        # 2. 탐지/분류 (배치 추론)
+        inference_start = time.perf_counter()
+        if not self.model_loaded:
+            logger.warning("⚠️ AI 모델이 로드되지 않음. Mock 데이터를 반환합니다.")
+            for index in valid:
+                height, width = prepared[index]['image'].shape[:2]
+                boxes, diseases = self._build_mock_detections(width, height)
+                boxes_by_image[index] = boxes
+                diseases_by_image[index] = diseases
+                species_by_image[index] = ('flatfish', 0.92)
+                health_by_image[index] = {
+                    'health_status': 'diseased' if diseases else 'healthy',
+                    'health_confidence': 0.88,
+                }
+        else:
+            with self._inference_lock:
+                detections = self._detect_fish_batch(images, confidence_threshold)
+                for index, boxes in zip(valid, detections):
+                    boxes_by_image[index] = boxes
+                
+                detected = [index for index in valid if boxes_by_image[index]]
+                if analyze_species and detected:
+                    species = self._classify_species_batch([prepared[index]['image'] for index in detected])
+                    species_by_image.update(zip(detected, species))
+            
+            if analyze_health or analyze_diseases:
+                for index in valid:
+                    if not boxes_by_image[index]:
+                        continue
+                    health_result = self._analyze_health_and_diseases_sync(
+                        prepared[index]['image'], boxes_by_image[index], analyze_diseases
+                    )
+                    health_by_image[index] = health_result
+                    diseases_by_image[index] = health_result['diseases']
+        # 배치 추론 시간은 이미지 수로 나눠 각 분석의 처리 시간에 더함
+        inference_share = (time.perf_counter() - inference_start) / len(valid)
+        
+        # 3. 분석 결과 인스턴스 구성 (DB 접근 없음)
+        results = [None] * len(images_bytes)
+        for index in valid:
+            item = prepared[index]
+            height, width = item['image'].shape[:2]
+            analysis = FishAnalysis(
+                user=user,
+                session=session,
+                image=ContentFile(
+                    images_bytes[index],
+                    name=f"fish_analysis_{uuid.uuid4().hex}.jpg"
+                ),
+                image_width=width,
+                image_height=height,
+                quality_score=item['quality_score'],
+                fish_detected=bool(boxes_by_image[index]),
+            )
+            
+            warnings = []
+            if item['quality_score'] < 0.3:
+                warnings.append("이미지 품질이 낮습니다. 더 선명한 이미지를 사용해주세요.")
+            if not analysis.fish_detected:
+                warnings.append("이미지에서 생선을 찾을 수 없습니다.")
+            
+            if index in species_by_image:
+                analysis.fish_species, analysis.species_confidence = species_by_image[index]
+            if index in health_by_image:
+                analysis.overall_health = health_by_image[index]['health_status']
+                analysis.health_confidence = health_by_image[index]['health_confidence']
+            
+            if analysis.fish_detected:
+                analysis.recommendations = self._generate_recommendations(
+                    analysis, has_diseases=bool(diseases_by_image[index])
+                )
+            analysis.warning_messages = warnings
+            analysis.processing_time = item['elapsed'] + inference_share
+            results[index] = analysis
+        
+        # 4. 저장 (한 트랜잭션, 테이블별 bulk_create 1회)
+        analyses = [results[index] for index in valid]
+        with transaction.atomic():
+            FishAnalysis.objects.bulk_create(analyses)
+            
+            box_objects = {}
+            for index in valid:
+                box_objects[index] = [
+                    DetectionBox(
+                        analysis=results[index],
+                        x1=box_data['x1'], y1=box_data['y1'],
+                        x2=box_data['x2'], y2=box_data['y2'],
+                        confidence=box_data['confidence'],
+                        class_name=box_data['class_name']
+                    )
+                    for box_data in boxes_by_image[index]
+                ]
+            DetectionBox.objects.bulk_create(
+                [box for index in valid for box in box_objects[index]]
+            )
+            
+            disease_objects = []
+            for index in valid:
+                for disease_data in diseases_by_image[index]:
+                    box_index = disease_data.get('box_index')
+                    disease_objects.append(DiseaseDetection(
+                        analysis=results[index],
+                        disease_type=disease_data['disease_type'],
+                        confidence=disease_data['confidence'],
+                        severity=disease_data['severity'],
+                        description=disease_data['description'],
+                        treatment_recommendation=disease_data.get('treatment_recommendation', ''),
+                        affected_box=box_objects[index][box_index] if box_index is not None else None
+                    ))
+            DiseaseDetection.objects.bulk_create(disease_objects)
+        
+        elapsed = time.perf_counter() - start_time
+        logger.info(
+            f"✅ 배치 분석 완료 - {len(analyses)}/{len(images_bytes)}개, "
+            f"처리시간: {elapsed:.2f}초 (이미지별 합계 {sum(a.processing_time for a in analyses):.2f}초)"
+        )
+        return results
+    
+    def _prepare_image_safe(self, image_bytes: bytes) -> Optional[Dict[str, Any]]:
+        """전처리 + 품질 평가 (스레드 풀 작업 단위, 실패 시 None)"""
+        started = time.perf_counter()
         try:
-            # PIL로 이미지 로드
-            image = Image.open(BytesIO(image_bytes))
+            image = self._preprocess_image(image_bytes)
+        except Exception:
+            return None
+        return {
+            'image': image,
+            'quality_score': self._assess_image_quality(image),
+            'elapsed': time.perf_counter() - started,
+        }
+    
+    @staticmethod
+    def _inference_batches(items: List[Any]):
+        """배치 추론 단위로 나누기 (AI_MODELS INFERENCE_BATCH_SIZE)"""
+        ai_config = getattr(settings, 'AI_MODELS', {})
+        batch_size = max(1, ai_config.get('INFERENCE_BATCH_SIZE', 16))
+        for start in range(0, len(items), batch_size):
+            yield items[start:start + batch_size]
             
-            # RGB로 변환
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-                
-            # OpenCV 형식으로 변환
-            opencv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-            
-            # 이미지 크기 정규화 (최대 1920x1080)
-            height, width = opencv_image.shape[:2]
-            if width > 1920 or height > 1080:
-                scale = min(1920/width, 1080/height)
-                new_width = int(width * scale)
-                new_height = int(height * scale)
-                opencv_image = cv2.resize(opencv_image, (new_width, new_height))
-                
-            return opencv_image
+    def _preprocess_image(self, image_bytes: bytes) -> np.ndarray:
+        """이미지 전처리 (최대 1920x1080 BGR, JPEG 는 축소 디코딩)"""
+        try:
+            return load_bgr_image(image_bytes, max_width=1920, max_height=1080)
             
         except Exception as e:
             logger.error(f"이미지 전처리 실패: {str(e)}")
@@ -252,6 +455,41 @@ class DjangoFishAnalyzer:
             logger.error(f"생선 탐지 실패: {str(e)}")
             return []
             
+    def _detect_fish_batch(self, images: List[np.ndarray], confidence_threshold: float) -> List[List[Dict]]:
+        """YOLOv8 배치 탐지 - 이미지 목록을 한 번에 추론해 이미지별 탐지 박스 목록 반환"""
+        if self.yolo_model is None:
+            # Mock 데이터 (실제 모델 대신)
+            return [[] for _ in images]
+        
+        detections = []
+        try:
+            for batch in self._inference_batches(images):
+                results = self.yolo_model(batch, conf=confidence_threshold, verbose=False)
+                detections.extend(self._parse_yolo_result(result) for result in results)
+            return detections
+        except Exception as e:
+            logger.error(f"생선 배치 탐지 실패: {str(e)}")
+            return [[] for _ in images]
+    
+    def _parse_yolo_result(self, result) -> List[Dict]:
+        """YOLOv8 결과 1개(이미지 1장) → 탐지 박스 목록"""
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            return []
+        
+        xyxy = boxes.xyxy.cpu().numpy()
+        confs = boxes.conf.cpu().numpy()
+        classes = boxes.cls.cpu().numpy().astype(int)
+        return [
+            {
+                'x1': float(x1), 'y1': float(y1),
+                'x2': float(x2), 'y2': float(y2),
+                'confidence': float(conf),
+                'class_name': self.yolo_model.names[cls]
+            }
+            for (x1, y1, x2, y2), conf, cls in zip(xyxy, confs, classes)
+        ]
+            
     def _classify_species_sync(self, image: np.ndarray) -> Tuple[str, float]:
         """생선 종류 분류 (동기 버전)"""
         try:
@@ -276,6 +514,32 @@ class DjangoFishAnalyzer:
             logger.error(f"종류 분류 실패: {str(e)}")
             return 'unknown', 0.0
             
+    def _classify_species_batch(self, images: List[np.ndarray]) -> List[Tuple[str, float]]:
+        """생선 종류 배치 분류 - 전처리한 입력을 하나의 텐서로 쌓아 한 번에 추론"""
+        if self.species_model is None:
+            # Mock 데이터
+            return [('unknown', 0.0)] * len(images)
+        
+        import torch
+        
+        predictions = []
+        try:
+            for batch in self._inference_batches(images):
+                pil_images = [Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB)) for image in batch]
+                inputs = self.species_processor(images=pil_images, return_tensors="pt")
+                with torch.inference_mode():
+                    outputs = self.species_model(**inputs)
+                probabilities = torch.nn.functional.softmax(outputs.logits, dim=-1)
+                confidences, class_ids = probabilities.max(dim=-1)
+                predictions.extend(
+                    (self.SPECIES_MAPPING.get(class_id, 'unknown'), confidence)
+                    for class_id, confidence in zip(class_ids.tolist(), confidences.tolist())
+                )
+            return predictions
+        except Exception as e:
+            logger.error(f"종류 배치 분류 실패: {str(e)}")
+            return [('unknown', 0.0)] * len(images)
+            
     def _analyze_health_and_diseases_sync(
         self, 
         image: np.ndarray, 
@@ -311,8 +575,8 @@ class DjangoFishAnalyzer:
                 'diseases': []
             }
             
-    def _generate_recommendations(self, analysis: FishAnalysis) -> List[str]:
-        """분석 결과 기반 권장사항 생성"""
+    def _generate_recommendations(self, analysis: FishAnalysis, has_diseases: Optional[bool] = None) -> List[str]:
+        """분석 결과 기반 권장사항 생성 (has_diseases 를 넘기면 질병 조회 쿼리를 생략)"""
         recommendations = []
         
         if analysis.quality_score < 0.5:
@@ -324,7 +588,9 @@ class DjangoFishAnalyzer:
         if analysis.fish_species == 'unknown':
             recommendations.append("생선 종류 식별을 위해 전체적인 모습이 보이도록 촬영해주세요.")
             
-        if analysis.diseases.exists():
+        if has_diseases is None:
+            has_diseases = analysis.diseases.exists()
+        if has_diseases:
             recommendations.append("질병이 의심되니 전문가의 진단을 받아보세요.")
             recommendations.append("격리 조치를 고려해보세요.")
             
@@ -333,43 +599,51 @@ class DjangoFishAnalyzer:
             
         return recommendations
         
+    def _build_mock_detections(self, width: int, height: int) -> Tuple[List[Dict], List[Dict]]:
+        """Mock 탐지 박스/질병 데이터 (이미지 중앙에 가상의 생선, 30% 확률로 질병)"""
+        center_x, center_y = width // 2, height // 2
+        box_width, box_height = 200, 150
+        
+        boxes = [{
+            'x1': center_x - box_width // 2,
+            'y1': center_y - box_height // 2,
+            'x2': center_x + box_width // 2,
+            'y2': center_y + box_height // 2,
+            'confidence': 0.85,
+            'class_name': "flatfish"
+        }]
+        
+        diseases = []
+        if np.random.random() > 0.7:  # 30% 확률로 질병 탐지
+            diseases.append({
+                'disease_type': 'bacterial',
+                'confidence': 0.65,
+                'severity': 0.4,
+                'description': "세균성 감염 의심 (Mock)",
+                'treatment_recommendation': "항생제 치료 고려 (Mock)",
+                'box_index': 0,
+            })
+        return boxes, diseases
+        
     def _generate_mock_result(self, analysis: FishAnalysis, warnings: List[str]) -> FishAnalysis:
         """Mock 분석 결과 생성 (테스트용)"""
         
-        # Mock 탐지 박스 (이미지 중앙에 가상의 생선)
-        center_x, center_y = analysis.image_width // 2, analysis.image_height // 2
-        box_width, box_height = 200, 150
+        boxes, diseases = self._build_mock_detections(analysis.image_width, analysis.image_height)
         
-        mock_box = DetectionBox.objects.create(
-            analysis=analysis,
-            x1=center_x - box_width // 2,
-            y1=center_y - box_height // 2,
-            x2=center_x + box_width // 2,
-            y2=center_y + box_height // 2,
-            confidence=0.85,
-            class_name="flatfish"
-        )
+        mock_box = DetectionBox.objects.create(analysis=analysis, **boxes[0])
         
-        # Mock 질병 (확률적으로 생성)
-        if np.random.random() > 0.7:  # 30% 확률로 질병 탐지
-            DiseaseDetection.objects.create(
-                analysis=analysis,
-                disease_type='bacterial',
-                confidence=0.65,
-                severity=0.4,
-                description="세균성 감염 의심 (Mock)",
-                treatment_recommendation="항생제 치료 고려 (Mock)",
-                affected_box=mock_box
-            )
+        for disease_data in diseases:
+            disease_data = {key: value for key, value in disease_data.items() if key != 'box_index'}
+            DiseaseDetection.objects.create(analysis=analysis, affected_box=mock_box, **disease_data)
         
         # 결과 업데이트
         analysis.fish_detected = True
         analysis.fish_species = 'flatfish'
         analysis.species_confidence = 0.92
-        analysis.overall_health = 'diseased' if analysis.diseases.exists() else 'healthy'
+        analysis.overall_health = 'diseased' if diseases else 'healthy'
         analysis.health_confidence = 0.88
         analysis.processing_time = 0.15
-        analysis.recommendations = self._generate_recommendations(analysis)
+        analysis.recommendations = self._generate_recommendations(analysis, has_diseases=bool(diseases))
         analysis.warning_messages = warnings
         analysis.save()
         
@@ -385,7 +659,8 @@ class DjangoFishAnalyzer:
                 'species_classification': self.species_model is not None
             },
             'status': 'ready' if self.model_loaded else 'loading',
-            'last_updated': self.last_updated
+            'last_updated': self.last_updated,
+            'lifecycle': model_lifecycle.status()
         }
 
 # 전역 분석기 인스턴스
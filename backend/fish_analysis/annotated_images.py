@@ -0,0 +1,96 @@
+"""
+분석 결과 표기 이미지 저장소 (콘텐츠 주소 방식)
+표기 이미지를 base64 로 응답에 넣지 않고 미디어 스토리지에 JPEG 파일로 저장한 뒤 URL 만 반환합니다.
+- 파일 이름은 JPEG 바이트의 SHA-256 이므로 같은 결과는 한 번만 저장되고, URL 은 영구 캐시할 수 있습니다.
+- 썸네일/프로그레시브 JPEG 변형은 저장 시 만들지 않고 처음 요청될 때 생성해 저장합니다.
+"""
+import hashlib
+import logging
+import re
+import threading
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+STORAGE_DIR = 'flounder_annotated'
+KEY_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+ORIGINAL = 'original'
+THUMBNAIL = 'thumbnail'
+PROGRESSIVE = 'progressive'
+VARIANTS = (ORIGINAL, THUMBNAIL, PROGRESSIVE)
+
+THUMBNAIL_SIZE = (320, 320)
+
+
+class AnnotatedImageStore:
+    """표기 이미지 저장/변형 생성 관리 클래스"""
+
+    # 같은 변형을 여러 스레드가 동시에 만들지 않도록 경로 해시로 고른 잠금 사용
+    _variant_locks = [threading.Lock() for _ in range(16)]
+
+    @staticmethod
+    def is_valid_key(key):
+        return bool(KEY_PATTERN.match(key or ''))
+
+    @staticmethod
+    def path(key, variant=ORIGINAL):
+        suffix = '' if variant == ORIGINAL else f'_{variant}'
+        return f'{STORAGE_DIR}/{key[:2]}/{key}{suffix}.jpg'
+
+    @staticmethod
+    def save(jpeg_bytes):
+        """JPEG 바이트 저장 (이미 같은 내용이 있으면 저장 생략) - 키 반환"""
+        key = hashlib.sha256(jpeg_bytes).hexdigest()
+        path = AnnotatedImageStore.path(key)
+        if not default_storage.exists(path):
+            default_storage.save(path, ContentFile(jpeg_bytes))
+        return key
+
+    @staticmethod
+    def urls(key):
+        """변형별 조회 URL (상대 경로)"""
+        base = reverse('fish_analysis:annotated-image', args=[key])
+        return {variant: base if variant == ORIGINAL else f'{base}?variant={variant}' for variant in VARIANTS}
+
+    @staticmethod
+    def open_variant(key, variant=ORIGINAL):
+        """
+        변형 파일 열기 (없으면 원본에서 생성 후 저장)
+        원본이 없으면 FileNotFoundError
+        """
+        path = AnnotatedImageStore.path(key, variant)
+        if variant != ORIGINAL and not default_storage.exists(path):
+            with AnnotatedImageStore._lock_for(path):
+                if not default_storage.exists(path):
+                    AnnotatedImageStore._generate(key, variant, path)
+        return default_storage.open(path, 'rb')
+
+    @staticmethod
+    def _lock_for(path):
+        locks = AnnotatedImageStore._variant_locks
+        return locks[int(hashlib.md5(path.encode()).hexdigest(), 16) % len(locks)]
+
+    @staticmethod
+    def _generate(key, variant, path):
+        with default_storage.open(AnnotatedImageStore.path(key), 'rb') as source:
+            image = Image.open(source)
+            if variant == THUMBNAIL:
+                # 원본 JPEG 를 축소 디코딩한 뒤 썸네일 크기로 줄임
+                image.draft('RGB', THUMBNAIL_SIZE)
+                image = image.convert('RGB')
+                image.thumbnail(THUMBNAIL_SIZE)
+                quality = 80
+            else:
+                image = image.convert('RGB')
+                quality = 85
+            buffer = BytesIO()
+            image.save(buffer, format='JPEG', quality=quality, progressive=True, optimize=True)
+
+        default_storage.save(path, ContentFile(buffer.getvalue()))
+        logger.info(f"🖼️ 표기 이미지 변형 생성: {key[:12]} {variant} ({len(buffer.getvalue()) // 1024}KB)")
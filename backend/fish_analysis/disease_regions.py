@@ -0,0 +1,219 @@
+"""
+광어 질병 의심 부위 탐지기 (OpenCV 기반, 단일 패스)
+FlounderDiseaseAnalyzer 의 색상/텍스처/형태 탐지를 하나로 묶어 이미지당 한 번에 처리합니다.
+- HSV 변환/붉은색 마스크/그레이스케일 변환은 모든 광어 ROI 를 감싸는 영역에서 한 번만 계산하고 ROI 별로 잘라 사용
+- 텍스처/형태 탐지는 같은 그레이스케일 ROI 를 공유 (기존에는 탐지기마다 변환)
+- 붉은색 마스크는 inRange 두 번 대신 색상 조회 테이블 + inRange 한 번, 라플라시안은 float64 대신 int16 으로 계산
+- 큰 영역의 픽셀 단위 변환은 행 단위 타일로 나눠 스레드 풀에서 처리하고, ROI 가 여러 개면 ROI 별로 병렬 처리
+- 블러/라플라시안/적응적 임계값 등 주변 픽셀을 쓰는 연산은 기존과 같이 ROI 단위로 수행하므로 결과는 기존 탐지기와 동일
+
+모델 워커/벤치마크에서도 사용하므로 이 모듈은 Django 를 import 하지 않습니다.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+# 붉은 반점(세균성 감염) HSV 범위 - 색상환 양 끝 (H 0~10, 170~180 / S, V 50 이상)
+# 두 범위의 S/V 조건이 같으므로 H 는 조회 테이블로, S/V 는 inRange 한 번으로 검사
+RED_HUE_LUT = np.zeros(256, np.uint8)
+RED_HUE_LUT[0:11] = 255
+RED_HUE_LUT[170:181] = 255
+RED_SV_LOWER = np.array([0, 50, 50])
+RED_SV_UPPER = np.array([255, 255, 255])
+
+TEXTURE_KERNEL = np.ones((3, 3), np.uint8)
+MORPHOLOGY_KERNEL = np.ones((5, 5), np.uint8)
+
+# 이 픽셀 수 이상인 영역은 색공간 변환을 타일로 나눠 병렬 처리
+TILE_MIN_PIXELS = 512 * 512
+MIN_TILE_ROWS = 64
+
+
+def _normalize_bbox(bbox: Sequence[int], height: int, width: int) -> Optional[Tuple[int, int, int, int]]:
+    """image[y1:y2, x1:x2] 와 같은 규칙(음수 인덱스 포함)으로 정규화한 좌표, 빈 영역이면 None"""
+    x1, y1, x2, y2 = bbox
+    ys, ye, _ = slice(y1, y2).indices(height)
+    xs, xe, _ = slice(x1, x2).indices(width)
+    if ye <= ys or xe <= xs:
+        return None
+    return xs, ys, xe, ye
+
+
+class DiseaseRegionDetector:
+    """광어 ROI 들의 질병 의심 부위를 한 번에 탐지하는 단일 패스 탐지기"""
+
+    def __init__(self, max_workers: Optional[int] = None, tile_min_pixels: int = TILE_MIN_PIXELS):
+        self.max_workers = max_workers or min(4, cv2.getNumberOfCPUs())
+        self.tile_min_pixels = tile_min_pixels
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='flounder-roi')
+        return self._executor
+
+    def detect(self, image: np.ndarray, bboxes: Sequence[Sequence[int]]) -> List[Dict[str, Any]]:
+        """
+        이미지의 광어 bbox 목록([x1, y1, x2, y2])에 대해 질병 의심 부위 반환
+        결과 순서: bbox 순서대로, bbox 안에서는 색상 → 텍스처 → 형태 탐지 순 (기존 탐지기와 동일)
+        """
+        height, width = image.shape[:2]
+        rois = []
+        for bbox in bboxes:
+            bounds = _normalize_bbox(bbox, height, width)
+            if bounds is not None:
+                rois.append((bounds, (bbox[0], bbox[1])))
+        if not rois:
+            return []
+
+        # 모든 ROI 를 감싸는 영역에서 픽셀 단위 변환을 한 번만 수행
+        ux1 = min(bounds[0] for bounds, _ in rois)
+        uy1 = min(bounds[1] for bounds, _ in rois)
+        ux2 = max(bounds[2] for bounds, _ in rois)
+        uy2 = max(bounds[3] for bounds, _ in rois)
+        gray, red_mask = self._convert(image[uy1:uy2, ux1:ux2])
+
+        def analyze(roi):
+            (xs, ys, xe, ye), offset = roi
+            rows, cols = slice(ys - uy1, ye - uy1), slice(xs - ux1, xe - ux1)
+            return self._analyze_roi(gray[rows, cols], red_mask[rows, cols], offset)
+
+        if len(rois) > 1:
+            results = list(self._get_executor().map(analyze, rois))
+        else:
+            results = [analyze(rois[0])]
+        return [region for regions in results for region in regions]
+
+    # ------------------------------------------------------------------
+    # 픽셀 단위 변환 (공유)
+    # ------------------------------------------------------------------
+    def _convert(self, area: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """영역의 그레이스케일과 붉은색 마스크 (큰 영역은 행 타일 단위로 병렬 계산)"""
+        rows, cols = area.shape[:2]
+        gray = np.empty((rows, cols), np.uint8)
+        red_mask = np.empty((rows, cols), np.uint8)
+
+        tiles = 1
+        if rows * cols >= self.tile_min_pixels:
+            tiles = max(1, min(self.max_workers, rows // MIN_TILE_ROWS))
+        if tiles == 1:
+            self._convert_rows(area, gray, red_mask, 0, rows)
+            return gray, red_mask
+
+        bounds = np.linspace(0, rows, tiles + 1, dtype=int)
+        futures = [
+            self._get_executor().submit(self._convert_rows, area, gray, red_mask, start, stop)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            future.result()
+        return gray, red_mask
+
+    @staticmethod
+    def _convert_rows(area, gray, red_mask, start, stop):
+        band = area[start:stop]
+        cv2.cvtColor(band, cv2.COLOR_BGR2GRAY, dst=gray[start:stop])
+        hsv = cv2.cvtColor(band, cv2.COLOR_BGR2HSV)
+        cv2.bitwise_and(
+            cv2.LUT(cv2.extractChannel(hsv, 0), RED_HUE_LUT),
+            cv2.inRange(hsv, RED_SV_LOWER, RED_SV_UPPER),
+            dst=red_mask[start:stop]
+        )
+
+    # ------------------------------------------------------------------
+    # ROI 단위 탐지
+    # ------------------------------------------------------------------
+    def _analyze_roi(self, gray_view: np.ndarray, red_mask_view: np.ndarray, offset: Tuple[int, int]) -> List[Dict]:
+        x_offset, y_offset = offset
+        # 주변 픽셀을 쓰는 필터는 ROI 경계 밖을 보지 않도록 ROI 만 복사해 사용 (기존 결과와 동일)
+        gray = np.ascontiguousarray(gray_view)
+        regions = []
+        regions.extend(self._color_regions(np.ascontiguousarray(red_mask_view), x_offset, y_offset))
+        regions.extend(self._texture_regions(gray, x_offset, y_offset))
+        regions.extend(self._morphological_regions(gray, x_offset, y_offset))
+        return regions
+
+    @staticmethod
+    def _color_regions(red_mask, x_offset, y_offset):
+        """붉은 반점 (세균성 감염 의심)"""
+        regions = []
+        contours, _ = cv2.findContours(red_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        for contour in contours:
+            area = cv2.contourArea(contour)
+            if area > 100:  # 최소 크기 필터
+                x, y, width, height = cv2.boundingRect(contour)
+                regions.append({
+                    'bbox': [x_offset + x, y_offset + y, x_offset + x + width, y_offset + y + height],
+                    'disease_type': 'bacterial_infection',
+                    'disease_name': '세균성 감염 의심',
+                    'confidence': min(0.6 + (area / 1000), 0.9),
+                    'severity': 'medium' if area > 500 else 'low',
+                    'description': '비정상적인 붉은 반점이 발견되었습니다.'
+                })
+        return regions
+
+    @staticmethod
+    def _texture_regions(gray, x_offset, y_offset, limit=2):
+        """이상 텍스처 (피부 병변 의심) - 최대 limit 개"""
+        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+        # uint8 입력의 3x3 라플라시안은 -1020~1020 정수이므로 CV_64F 대신 CV_16S 로 계산
+        # (uint8 변환 시 하위 바이트만 남는 것은 기존 float 경로와 동일)
+        laplacian = np.absolute(cv2.Laplacian(blurred, cv2.CV_16S)).astype(np.uint8)
+        _, thresh = cv2.threshold(laplacian, 30, 255, cv2.THRESH_BINARY)
+        thresh = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, TEXTURE_KERNEL)
+
+        regions = []
+        contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        for contour in contours:
+            area = cv2.contourArea(contour)
+            if area > 200:  # 최소 크기 필터
+                x, y, width, height = cv2.boundingRect(contour)
+                regions.append({
+                    'bbox': [x_offset + x, y_offset + y, x_offset + x + width, y_offset + y + height],
+                    'disease_type': 'skin_lesion',
+                    'disease_name': '피부 병변 의심',
+                    'confidence': min(0.5 + (area / 2000), 0.8),
+                    'severity': 'high' if area > 800 else 'medium',
+                    'description': '피부 표면의 이상 텍스처가 발견되었습니다.'
+                })
+                if len(regions) >= limit:
+                    break
+        return regions
+
+    @staticmethod
+    def _morphological_regions(gray, x_offset, y_offset, limit=1):
+        """불규칙한 형태의 병변 (기생충 감염 의심) - 최대 limit 개"""
+        adaptive_thresh = cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 11, 2
+        )
+        cleaned = cv2.morphologyEx(adaptive_thresh, cv2.MORPH_OPEN, MORPHOLOGY_KERNEL)
+
+        regions = []
+        contours, _ = cv2.findContours(cleaned, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        for contour in contours:
+            area = cv2.contourArea(contour)
+            if area <= 150:
+                continue
+            perimeter = cv2.arcLength(contour, True)
+            if perimeter <= 0:
+                continue
+            circularity = 4 * np.pi * area / (perimeter * perimeter)
+            if circularity < 0.3:
+                x, y, width, height = cv2.boundingRect(contour)
+                regions.append({
+                    'bbox': [x_offset + x, y_offset + y, x_offset + x + width, y_offset + y + height],
+                    'disease_type': 'parasitic_infection',
+                    'disease_name': '기생충 감염 의심',
+                    'confidence': min(0.4 + (1 - circularity), 0.7),
+                    'severity': 'low',
+                    'description': '불규칙한 형태의 병변이 의심됩니다.'
+                })
+                if len(regions) >= limit:
+                    break
+        return regions
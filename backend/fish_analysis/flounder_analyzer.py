@@ -7,26 +7,25 @@ from typing import List, Dict, Tuple, Any
 from io import BytesIO
 import base64
 import json
-import torch
+from importlib.util import find_spec
 from django.conf import settings
 
-# YOLO 및 AI 모델 임포트
-try:
-    from ultralytics import YOLO
-    YOLO_AVAILABLE = True
-except ImportError:
-    YOLO_AVAILABLE = False
+from .disease_regions import DiseaseRegionDetector
+from .image_preprocessing import load_bgr_image
+from .annotated_images import AnnotatedImageStore
+from .model_lifecycle import model_lifecycle, warmup_image, FLOUNDER_ANALYZER
+
+logger = logging.getLogger(__name__)
+
+# YOLO 및 AI 모델 라이브러리 설치 여부 (torch 를 끌어오는 import 는 모델 로드 시점에 수행)
+YOLO_AVAILABLE = find_spec('ultralytics') is not None
+if not YOLO_AVAILABLE:
     logger.warning("⚠️ Ultralytics YOLO not available. Using mock data.")
 
-try:
-    from transformers import AutoImageProcessor, AutoModelForImageClassification
-    TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
+TRANSFORMERS_AVAILABLE = find_spec('transformers') is not None
+if not TRANSFORMERS_AVAILABLE:
     logger.warning("⚠️ Transformers not available. Using mock data.")
 
-logger = logging.getLogger(__name__)
-
 class FlounderDiseaseAnalyzer:
     """광어 질병 분석기"""
     
@@ -36,9 +35,11 @@ class FlounderDiseaseAnalyzer:
         self.disease_model = None
         self.disease_processor = None
         self.models_loaded = False
-        self._initialize_models()
+        # 색상/텍스처/형태 탐지를 이미지당 한 번에 처리하는 단일 패스 탐지기
+        self.region_detector = DiseaseRegionDetector()
+        # 모델은 생성 시 로드하지 않음 - model_lifecycle 이 첫 분석 시(또는 워커 시작 시) initialize_models 호출
     
-    def _initialize_models(self):
+    def initialize_models(self):
         """AI 모델 초기화"""
         try:
             ai_config = getattr(settings, 'AI_MODELS', {})
@@ -54,6 +55,7 @@ class FlounderDiseaseAnalyzer:
                 # yolo_path = os.path.join(model_cache_dir, 'flounder_detection.pt')
                 
                 try:
+                    from ultralytics import YOLO
                     self.yolo_model = YOLO(yolo_path)
                     logger.info(f"✅ YOLO 모델 로드 완료: {yolo_path}")
                 except Exception as e:
@@ -68,6 +70,7 @@ class FlounderDiseaseAnalyzer:
                 # 현재는 일반적인 이미지 분류 모델 사용 (예시)
                 try:
                     # 실제 환경에서는 훈련된 질병 분류 모델 사용
+                    # from transformers import AutoImageProcessor, AutoModelForImageClassification
                     # self.disease_processor = AutoImageProcessor.from_pretrained(disease_model_name)
                     # self.disease_model = AutoModelForImageClassification.from_pretrained(disease_model_name)
                     logger.info("✅ 질병 분류 모델 준비 완료 (Mock)")
@@ -80,18 +83,31 @@ class FlounderDiseaseAnalyzer:
         except Exception as e:
             logger.error(f"❌ 모델 초기화 실패: {e}")
             self.models_loaded = False
+    
+    def warmup(self):
+        """워밍업 추론 - 빈 이미지로 탐지/질병 부위 분석을 한 번 실행해 첫 요청의 초기화 비용을 미리 처리"""
+        image = warmup_image()
+        if self.yolo_model:
+            self.yolo_model(image, conf=self.confidence_threshold, verbose=False)
+        self.region_detector.detect(image, [[0, 0, image.shape[1], image.shape[0]]])
         
-    def analyze_flounder_image(self, image_bytes: bytes) -> Dict[str, Any]:
+    def analyze_flounder_image(self, image_bytes: bytes, annotated_output: str = None) -> Dict[str, Any]:
         """
         광어 이미지를 분석하여 질병 의심 부분을 탐지하고 표기합니다.
         
         Args:
             image_bytes: 이미지 바이트 데이터
+            annotated_output: 표기 이미지 반환 방식
+                'url' - 미디어 스토리지에 저장하고 annotated_image_urls 로 반환 (기본값, AI_MODELS['ANNOTATED_IMAGE_OUTPUT'])
+                'base64' - annotated_image 에 base64 문자열로 반환
             
         Returns:
             분석 결과 딕셔너리
         """
         try:
+            # 모델 준비 (lazy 모드에서는 첫 분석 시 로드)
+            model_lifecycle.ensure_ready(FLOUNDER_ANALYZER)
+            
             # 이미지 전처리
             image = self._preprocess_image(image_bytes)
             
@@ -112,7 +128,8 @@ class FlounderDiseaseAnalyzer:
             disease_regions = self._detect_disease_regions_ai(image, flounder_detections)
             
             # 이미지에 질병 의심 부분 표기
-            annotated_image_base64 = self._annotate_image(image, flounder_detections, disease_regions)
+            annotated_jpeg = self._annotate_image(image, flounder_detections, disease_regions)
+            annotated_image, annotated_image_urls = self._export_annotated_image(annotated_jpeg, annotated_output)
             
             # 신뢰도 점수 계산
             confidence_scores = self._calculate_confidence_scores(flounder_detections, disease_regions)
@@ -123,7 +140,8 @@ class FlounderDiseaseAnalyzer:
                 'flounder_detected': True,
                 'flounder_count': len(flounder_detections),
                 'disease_regions': disease_regions,
-                'annotated_image': annotated_image_base64,
+                'annotated_image': annotated_image,
+                'annotated_image_urls': annotated_image_urls,
                 'confidence_scores': confidence_scores
             }
             
@@ -139,27 +157,9 @@ class FlounderDiseaseAnalyzer:
             }
     
     def _preprocess_image(self, image_bytes: bytes) -> np.ndarray:
-        """이미지 전처리"""
+        """이미지 전처리 (최대 1024x1024 BGR, JPEG 는 축소 디코딩)"""
         try:
-            # PIL로 이미지 로드
-            image = Image.open(BytesIO(image_bytes))
-            
-            # RGB로 변환
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-                
-            # OpenCV 형식으로 변환
-            opencv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-            
-            # 이미지 크기 정규화 (최대 1024x1024)
-            height, width = opencv_image.shape[:2]
-            if width > 1024 or height > 1024:
-                scale = min(1024/width, 1024/height)
-                new_width = int(width * scale)
-                new_height = int(height * scale)
-                opencv_image = cv2.resize(opencv_image, (new_width, new_height))
-                
-            return opencv_image
+            return load_bgr_image(image_bytes, max_width=1024, max_height=1024)
             
         except Exception as e:
             logger.error(f"이미지 전처리 실패: {str(e)}")
@@ -235,21 +235,10 @@ class FlounderDiseaseAnalyzer:
                 logger.warning("질병 분류 모델이 없음. Mock 데이터 사용.")
                 return self._detect_disease_regions_mock(image, flounder_detections)
             
-            disease_regions = []
-            
-            for detection in flounder_detections:
-                bbox = detection['bbox']
-                x1, y1, x2, y2 = bbox
-                
-                # 광어 영역 추출
-                flounder_roi = image[y1:y2, x1:x2]
-                
-                if flounder_roi.size == 0:
-                    continue
-                
-                # 질병 탐지를 위한 이미지 분석
-                disease_detections = self._analyze_disease_in_roi(flounder_roi, (x1, y1))
-                disease_regions.extend(disease_detections)
+            # 모든 광어 ROI 를 한 번에 분석 (색공간 변환/마스크는 한 번만 계산)
+            disease_regions = self.region_detector.detect(
+                image, [detection['bbox'] for detection in flounder_detections]
+            )
             
             logger.info(f"🔬 AI 질병 탐지 완료: {len(disease_regions)}개 발견")
             return disease_regions
@@ -259,7 +248,10 @@ class FlounderDiseaseAnalyzer:
             return self._detect_disease_regions_mock(image, flounder_detections)
     
     def _analyze_disease_in_roi(self, roi_image: np.ndarray, offset: Tuple[int, int]) -> List[Dict]:
-        """광어 ROI 내에서 질병 탐지"""
+        """
+        광어 ROI 내에서 질병 탐지 (탐지기별로 따로 변환하는 기준 구현)
+        실제 분석은 DiseaseRegionDetector 를 사용하며, 이 메서드는 결과 비교/벤치마크 기준으로 유지합니다.
+        """
         try:
             x_offset, y_offset = offset
             disease_regions = []
@@ -483,12 +475,12 @@ class FlounderDiseaseAnalyzer:
             logger.error(f"질병 탐지 실패: {str(e)}")
             return []
     
-    def _annotate_image(self, image: np.ndarray, flounder_detections: List[Dict], disease_regions: List[Dict]) -> str:
-        """이미지에 탐지 결과 표기"""
+    def _annotate_image(self, image: np.ndarray, flounder_detections: List[Dict], disease_regions: List[Dict]) -> bytes:
+        """이미지에 탐지 결과 표기 - JPEG 바이트 반환"""
         try:
-            # OpenCV 이미지를 PIL로 변환
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(image_rgb)
+            # OpenCV(BGR) 배열을 중간 RGB 배열 없이 PIL 이미지로 변환
+            height, width = image.shape[:2]
+            pil_image = Image.frombuffer('RGB', (width, height), np.ascontiguousarray(image), 'raw', 'BGR', 0, 1)
             draw = ImageDraw.Draw(pil_image)
             
             # 광어 경계 상자 그리기 (파란색)
@@ -517,17 +509,31 @@ class FlounderDiseaseAnalyzer:
                     fill=color
                 )
             
-            # Base64로 인코딩
             buffer = BytesIO()
             pil_image.save(buffer, format='JPEG', quality=85)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-            
-            return image_base64
+            return buffer.getvalue()
             
         except Exception as e:
             logger.error(f"이미지 표기 실패: {str(e)}")
             return None
     
+    def _export_annotated_image(self, annotated_jpeg: bytes, annotated_output: str = None) -> Tuple[str, Dict[str, str]]:
+        """표기 이미지를 응답 형식으로 변환 - (base64 문자열, 변형별 URL) 중 하나만 채움"""
+        if annotated_jpeg is None:
+            return None, None
+        
+        annotated_output = annotated_output or getattr(settings, 'AI_MODELS', {}).get('ANNOTATED_IMAGE_OUTPUT', 'url')
+        if annotated_output == 'base64':
+            return base64.b64encode(annotated_jpeg).decode('utf-8'), None
+        
+        try:
+            key = AnnotatedImageStore.save(annotated_jpeg)
+            return None, AnnotatedImageStore.urls(key)
+        except Exception as e:
+            # 스토리지 저장 실패 시 기존 방식으로 응답
+            logger.error(f"❌ 표기 이미지 저장 실패: {str(e)}")
+            return base64.b64encode(annotated_jpeg).decode('utf-8'), None
+    
     def _calculate_confidence_scores(self, flounder_detections: List[Dict], disease_regions: List[Dict]) -> Dict[str, float]:
         """신뢰도 점수 계산"""
         try:
@@ -0,0 +1,50 @@
+"""
+분석용 이미지 디코딩/리사이즈 공통 모듈
+휴대폰 원본 사진(12MP 등)을 전체 해상도로 디코딩한 뒤 복사/색 변환/축소하는 대신
+- JPEG 는 Image.draft 로 디코딩 단계에서 1/2, 1/4, 1/8 축소해 목표 크기에 가깝게 바로 디코딩하고
+- 남은 축소는 PIL 에서 한 번만 수행한 뒤
+- RGB → BGR 변환은 픽셀을 내보낼 때(BGR raw 모드) 함께 처리해 중간 RGB 배열을 만들지 않습니다.
+반환한 BGR 배열 하나를 품질 평가와 탐지에서 함께 사용합니다.
+
+분석 워커에서도 사용하므로 이 모듈은 Django 를 import 하지 않습니다.
+"""
+from io import BytesIO
+from typing import Tuple
+
+import numpy as np
+from PIL import Image
+
+
+def target_size(width: int, height: int, max_width: int, max_height: int) -> Tuple[int, int]:
+    """최대 크기에 맞춘 축소 크기 (이미 작으면 원래 크기, 기존 전처리와 같은 계산)"""
+    if width > max_width or height > max_height:
+        scale = min(max_width / width, max_height / height)
+        return int(width * scale), int(height * scale)
+    return width, height
+
+
+def load_bgr_image(image_bytes: bytes, max_width: int, max_height: int) -> np.ndarray:
+    """
+    이미지 바이트 → 최대 크기 이하로 축소한 OpenCV 형식(BGR, uint8) 배열
+    결과 크기는 기존 전처리(전체 디코딩 후 cv2.resize)와 같습니다.
+    """
+    image = Image.open(BytesIO(image_bytes))
+    size = target_size(image.width, image.height, max_width, max_height)
+
+    # JPEG: 목표 크기 이상을 유지하는 가장 작은 배율(1/2~1/8)로 디코딩 (그 외 형식은 영향 없음)
+    if size != image.size:
+        image.draft('RGB', size)
+
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    if image.size != size:
+        # draft 가 적용되지 않은 형식(PNG 등)은 정수 배율 축소(reduce)를 먼저 해 리샘플링 비용을 줄임
+        image = image.resize(size, Image.BILINEAR, reducing_gap=2.0)
+
+    return rgb_to_bgr_array(image)
+
+
+def rgb_to_bgr_array(image: Image.Image) -> np.ndarray:
+    """PIL RGB 이미지 → 쓰기 가능한 BGR 배열 (축소된 크기에서 BGR 순서로 바로 내보냄)"""
+    buffer = bytearray(image.tobytes('raw', 'BGR'))
+    return np.frombuffer(buffer, dtype=np.uint8).reshape(image.height, image.width, 3)
@@ -0,0 +1,383 @@
+"""
+생선 분석 비동기 작업 서브시스템
+- FishAnalysisJob 테이블을 영속 작업 큐로 사용 (status='pending' 행이 대기 작업)
+- 업로드 요청은 작업만 등록하고 바로 202 로 응답하며, 클라이언트는 작업 ID 로 결과를 조회(롱폴링)합니다.
+- 디스패처 스레드가 분석 워커 스레드(THREADS 개)에 여유가 있을 때만 작업을 꺼내 실행하고,
+  대기+처리 중 작업이 MAX_QUEUE_DEPTH 를 넘으면 새 업로드를 FishAnalysisQueueFull(→ 429)로 거절합니다.
+
+운영 환경에서는 FISH_ANALYSIS_WORKERS['AUTOSTART']=False 로 두고
+`python manage.py run_fish_analysis_workers` 를 별도 프로세스로 실행하면
+gunicorn 워커에서는 추론이 실행되지 않아 주문/결제 요청이 분석 부하에 막히지 않습니다.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ('completed', 'failed')
+
+
+class FishAnalysisQueueFull(Exception):
+    """생선 분석 작업 대기열이 포화 상태"""
+
+    def __init__(self, depth, limit):
+        self.depth = depth
+        self.limit = limit
+        super().__init__(f"생선 분석 작업 대기열이 가득 찼습니다 ({depth}/{limit})")
+
+
+def get_job_settings():
+    config = dict(getattr(settings, 'FISH_ANALYSIS_WORKERS', {}))
+    config.setdefault('THREADS', 2)
+    config.setdefault('MAX_QUEUE_DEPTH', 50)
+    config.setdefault('AUTOSTART', True)
+    config.setdefault('POLL_INTERVAL_SECONDS', 1.0)
+    config.setdefault('JOB_TIMEOUT_SECONDS', 300)
+    config.setdefault('MAX_ATTEMPTS', 2)
+    config.setdefault('LONG_POLL_MAX_SECONDS', 10)
+    return config
+
+
+class FishAnalysisJobQueue:
+    """FishAnalysisJob 테이블 기반 영속 작업 큐 + 디스패처 + 분석 워커 스레드 풀"""
+
+    QUEUED_STATUSES = ['pending', 'processing']
+
+    def __init__(self, threads=2, max_depth=50, poll_interval=1.0, job_timeout=300, max_attempts=2):
+        self.threads = max(1, threads)
+        self.max_depth = max_depth
+        self.poll_interval = poll_interval
+        self.job_timeout = job_timeout
+        self.max_attempts = max_attempts
+
+        self._executor = None
+        self._lock = threading.Lock()
+        self._inflight = 0
+        self.completed = 0
+        self.failed = 0
+
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._last_stale_check = 0.0
+
+    @classmethod
+    def from_settings(cls):
+        config = get_job_settings()
+        return cls(
+            threads=config['THREADS'],
+            max_depth=config['MAX_QUEUE_DEPTH'],
+            poll_interval=config['POLL_INTERVAL_SECONDS'],
+            job_timeout=config['JOB_TIMEOUT_SECONDS'],
+            max_attempts=config['MAX_ATTEMPTS'],
+        )
+
+    # ------------------------------------------------------------------
+    # 등록 / 조회
+    # ------------------------------------------------------------------
+    def depth(self):
+        from .models import FishAnalysisJob
+        return FishAnalysisJob.objects.filter(status__in=self.QUEUED_STATUSES).count()
+
+    def check_capacity(self):
+        """대기열이 가득 찬 경우 FishAnalysisQueueFull (업로드 파일 저장 전에 호출)"""
+        depth = self.depth()
+        if depth >= self.max_depth:
+            raise FishAnalysisQueueFull(depth, self.max_depth)
+        return depth
+
+    def enqueue(self, job):
+        """status='pending' 으로 저장된 작업을 커밋 후 디스패처에 알림"""
+        transaction.on_commit(self.notify)
+        if get_job_settings()['AUTOSTART']:
+            self.ensure_started()
+
+    def notify(self):
+        self._wake.set()
+
+    def position(self, job):
+        """대기 순번 (0 이면 다음 실행 대상), 대기 중이 아니면 None"""
+        from .models import FishAnalysisJob
+        if job.status != 'pending':
+            return None
+        return FishAnalysisJob.objects.filter(status='pending', created_at__lt=job.created_at).count()
+
+    def wait(self, job, timeout):
+        """작업이 끝나거나 timeout(초)이 지날 때까지 대기 후 최신 상태 반환 (롱폴링)"""
+        from .models import FishAnalysisJob
+        deadline = time.monotonic() + min(timeout, get_job_settings()['LONG_POLL_MAX_SECONDS'])
+        while job.status not in FINISHED_STATUSES and time.monotonic() < deadline:
+            time.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
+            job = FishAnalysisJob.objects.get(id=job.id)
+        return job
+
+    # ------------------------------------------------------------------
+    # 디스패처
+    # ------------------------------------------------------------------
+    @property
+    def idle_workers(self):
+        return max(0, self.threads - self._inflight)
+
+    def _get_executor(self):
+        if self._executor is None:
+            logger.info(f"🚀 생선 분석 워커 시작 (스레드 {self.threads}개)")
+            self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='fish-analysis')
+        return self._executor
+
+    def ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self.run_forever, name='fish-dispatcher', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.poll_interval + 1)
+        self._thread = None
+
+    def shutdown(self, wait=True):
+        """디스패처를 멈추고 실행 중인 분석이 끝날 때까지 대기"""
+        self.stop()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def run_forever(self):
+        logger.info(f"🐟 생선 분석 디스패처 시작 (스레드 {self.threads}개, 최대 대기 {self.max_depth}건)")
+        while not self._stop_event.is_set():
+            try:
+                close_old_connections()
+                self.dispatch_once()
+            except Exception as e:
+                logger.error(f"❌ 생선 분석 디스패처 오류: {e}", exc_info=True)
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+        close_old_connections()
+
+    def dispatch_once(self):
+        """유휴 워커 수만큼 대기 작업을 꺼내 실행 - 실행한 작업 수 반환"""
+        if time.monotonic() - self._last_stale_check > self.job_timeout / 2:
+            self.requeue_stale()
+            self._last_stale_check = time.monotonic()
+
+        idle = self.idle_workers
+        if idle <= 0:
+            return 0
+        jobs = self._claim_jobs(limit=idle)
+        for job in jobs:
+            self._submit(job)
+        return len(jobs)
+
+    def _claim_jobs(self, limit=1):
+        """대기 작업을 오래된 순으로 최대 limit 건 processing 으로 점유 (여러 디스패처가 있어도 중복 실행 없음)"""
+        from .models import FishAnalysisJob
+        with transaction.atomic():
+            jobs = list(
+                FishAnalysisJob.objects.select_for_update(skip_locked=True)
+                .filter(status='pending')
+                .order_by('created_at')[:limit]
+            )
+            if not jobs:
+                return []
+            now = timezone.now()
+            FishAnalysisJob.objects.filter(id__in=[job.id for job in jobs]).update(
+                status='processing',
+                started_at=now,
+                attempts=F('attempts') + 1,
+                updated_at=now,
+            )
+        for job in jobs:
+            job.status = 'processing'
+            job.started_at = now
+            job.attempts += 1
+        return jobs
+
+    def _submit(self, job):
+        with self._lock:
+            self._inflight += 1
+            future = self._get_executor().submit(self._run, job)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future):
+        with self._lock:
+            self._inflight -= 1
+        self._wake.set()
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    def _run(self, job):
+        close_old_connections()
+        started = time.perf_counter()
+        timings = {'queue_wait': round((job.started_at - job.created_at).total_seconds(), 3)}
+        try:
+            with job.image.open('rb') as image_file:
+                image_bytes = image_file.read()
+            timings['load'] = time.perf_counter() - started
+
+            analysis, result = self._execute(job, image_bytes, timings)
+            timings['total'] = time.perf_counter() - started
+            self._finish(job, analysis=analysis, result=result, timings=timings)
+        except Exception as e:
+            timings['total'] = time.perf_counter() - started
+            self._finish(job, error=e, timings=timings)
+        finally:
+            close_old_connections()
+
+    def _execute(self, job, image_bytes, timings):
+        """작업 종류별 분석 실행 - (FishAnalysis 또는 None, 결과 JSON 또는 None)"""
+        if job.job_type == 'flounder':
+            from .flounder_analyzer import flounder_analyzer
+
+            started = time.perf_counter()
+            result = flounder_analyzer.analyze_flounder_image(
+                image_bytes, annotated_output=(job.options or {}).get('annotated_output')
+            )
+            timings['analysis'] = time.perf_counter() - started
+            return None, result
+
+        from .analyzer import django_fish_analyzer
+        from .models import AnalysisSession
+
+        options = job.options or {}
+        session = None
+        if options.get('session_id'):
+            session = AnalysisSession.objects.filter(id=options['session_id']).first()
+
+        started = time.perf_counter()
+        analysis = django_fish_analyzer.analyze_image_sync(
+            image_bytes=image_bytes,
+            user=job.user,
+            analyze_species=options.get('analyze_species', True),
+            analyze_health=options.get('analyze_health', True),
+            analyze_diseases=options.get('analyze_diseases', True),
+            confidence_threshold=options.get('confidence_threshold', 0.5),
+            session=session,
+            timings=timings,
+        )
+        timings['analysis'] = time.perf_counter() - started
+        return analysis, None
+
+    def _finish(self, job, analysis=None, result=None, error=None, timings=None):
+        from .models import FishAnalysisJob
+        now = timezone.now()
+        timings = {stage: round(seconds, 3) for stage, seconds in (timings or {}).items()}
+        if error is None:
+            FishAnalysisJob.objects.filter(id=job.id).update(
+                status='completed',
+                analysis=analysis,
+                result=result,
+                error_message='',
+                timings=timings,
+                completed_at=now,
+                updated_at=now,
+            )
+            self._discard_upload(job)
+            with self._lock:
+                self.completed += 1
+            logger.info(f"✅ 생선 분석 작업 완료: {job.id} ({timings.get('total', 0):.2f}s, 대기 {timings.get('queue_wait', 0):.2f}s)")
+            return
+
+        retry = job.attempts < self.max_attempts
+        FishAnalysisJob.objects.filter(id=job.id).update(
+            status='pending' if retry else 'failed',
+            error_message=str(error)[:1000],
+            timings=timings,
+            completed_at=None if retry else now,
+            updated_at=now,
+        )
+        with self._lock:
+            self.failed += 1
+        logger.error(f"❌ 생선 분석 작업 실패: {job.id} ({job.attempts}/{self.max_attempts}회) - {error}")
+
+    @staticmethod
+    def _discard_upload(job):
+        """완료된 작업의 업로드 원본 삭제 (FishAnalysis 는 이미지 사본을 따로 저장)"""
+        from .models import FishAnalysisJob
+        try:
+            job.image.delete(save=False)
+        except Exception as e:
+            logger.warning(f"⚠️ 작업 이미지 삭제 실패: {job.id} - {e}")
+            return
+        FishAnalysisJob.objects.filter(id=job.id).update(image='')
+
+    def requeue_stale(self):
+        """JOB_TIMEOUT 이 지나도록 processing 인 작업(워커/프로세스 중단)을 다시 대기열로"""
+        from .models import FishAnalysisJob
+        cutoff = timezone.now() - timedelta(seconds=self.job_timeout)
+        stale = FishAnalysisJob.objects.filter(status='processing', started_at__lt=cutoff)
+        failed = stale.filter(attempts__gte=self.max_attempts).update(
+            status='failed', error_message='처리 시간 초과', completed_at=timezone.now()
+        )
+        requeued = stale.update(status='pending')
+        if failed or requeued:
+            logger.warning(f"⚠️ 중단된 생선 분석 작업 정리: 재시도 {requeued}건, 실패 {failed}건")
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+    def stage_timings(self, recent=100):
+        """최근 완료 작업의 단계별 평균 처리 시간(초) - 워커가 다른 프로세스여도 DB 기준으로 집계"""
+        from .models import FishAnalysisJob
+        rows = (
+            FishAnalysisJob.objects.filter(status='completed')
+            .order_by('-completed_at')
+            .values_list('timings', flat=True)[:recent]
+        )
+        totals = {}
+        for timings in rows:
+            for stage, seconds in (timings or {}).items():
+                stage_total = totals.setdefault(stage, [0.0, 0])
+                stage_total[0] += seconds
+                stage_total[1] += 1
+        return {stage: round(total / count, 3) for stage, (total, count) in totals.items()}
+
+    def metrics(self):
+        from .models import FishAnalysisJob
+        counts = dict(
+            FishAnalysisJob.objects.filter(status__in=self.QUEUED_STATUSES)
+            .values_list('status').annotate(count=Count('id'))
+        )
+        return {
+            'pending': counts.get('pending', 0),
+            'processing': counts.get('processing', 0),
+            'max_queue_depth': self.max_depth,
+            'threads': self.threads,
+            'inflight': self._inflight,
+            'completed': self.completed,
+            'failed': self.failed,
+            'dispatcher_running': self._thread is not None and self._thread.is_alive(),
+            'avg_stage_seconds': self.stage_timings(),
+        }
+
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+    """프로세스 단위 작업 큐 싱글톤 반환"""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                _job_queue = FishAnalysisJobQueue.from_settings()
+    return _job_queue
@@ -0,0 +1,102 @@
+"""
+광어 질병 부위 탐지 마이크로 벤치마크
+합성 이미지로 기존 탐지(ROI 마다 색상/텍스처/형태 탐지기를 따로 실행)와
+단일 패스 탐지기(DiseaseRegionDetector)의 이미지당 처리 시간을 비교하고 결과가 같은지 확인합니다.
+
+    python manage.py benchmark_flounder_regions --images 20 --rois 2
+"""
+import time
+
+import cv2
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from fish_analysis.disease_regions import DiseaseRegionDetector
+from fish_analysis.flounder_analyzer import FlounderDiseaseAnalyzer
+
+
+def make_synthetic_image(rng, width, height, roi_count):
+    """광어 형태 + 붉은 반점 + 불규칙 병변이 있는 합성 이미지와 광어 bbox 목록"""
+    image = np.empty((height, width, 3), np.uint8)
+    gradient = np.linspace(90, 160, width, dtype=np.float32)
+    image[:] = gradient[None, :, None].astype(np.uint8)
+    image = cv2.add(image, rng.integers(0, 25, image.shape, dtype=np.uint8))
+
+    bboxes = []
+    slot = width // roi_count
+    for index in range(roi_count):
+        x1 = index * slot + int(slot * 0.05)
+        x2 = (index + 1) * slot - int(slot * 0.05)
+        y1, y2 = int(height * 0.2), int(height * 0.8)
+        center = ((x1 + x2) // 2, (y1 + y2) // 2)
+        cv2.ellipse(image, center, ((x2 - x1) // 2, (y2 - y1) // 2), 0, 0, 360, (60, 90, 120), -1)
+
+        for _ in range(rng.integers(3, 8)):
+            spot = (int(rng.integers(x1, x2)), int(rng.integers(y1, y2)))
+            cv2.circle(image, spot, int(rng.integers(6, 25)), (30, 30, 200), -1)
+        for _ in range(rng.integers(2, 5)):
+            points = np.stack([rng.integers(x1, x2, 6), rng.integers(y1, y2, 6)], axis=1).astype(np.int32)
+            cv2.polylines(image, [points], True, (20, 20, 20), 3)
+        bboxes.append([x1, y1, x2, y2])
+
+    image = cv2.add(image, rng.integers(0, 10, image.shape, dtype=np.uint8))
+    return image, bboxes
+
+
+class Command(BaseCommand):
+    help = '광어 질병 부위 탐지 기존 방식 vs 단일 패스 탐지기 이미지당 처리 시간 비교 (합성 이미지)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--images', type=int, default=20, help='합성 이미지 수')
+        parser.add_argument('--repeat', type=int, default=3, help='이미지당 반복 횟수 (최솟값 사용)')
+        parser.add_argument('--width', type=int, default=1024)
+        parser.add_argument('--height', type=int, default=768)
+        parser.add_argument('--rois', type=int, default=2, help='이미지당 광어 수')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options['seed'])
+        # 모델 로드 없이 기준 구현 메서드만 사용
+        reference = FlounderDiseaseAnalyzer.__new__(FlounderDiseaseAnalyzer)
+        detector = DiseaseRegionDetector()
+
+        def run_reference(image, bboxes):
+            regions = []
+            for x1, y1, x2, y2 in bboxes:
+                roi = image[y1:y2, x1:x2]
+                if roi.size:
+                    regions.extend(reference._analyze_disease_in_roi(roi, (x1, y1)))
+            return regions
+
+        def best_time(func, *func_args):
+            timings = []
+            for _ in range(max(1, options['repeat'])):
+                started = time.perf_counter()
+                result = func(*func_args)
+                timings.append(time.perf_counter() - started)
+            return min(timings), result
+
+        baseline_total = fused_total = 0.0
+        region_count = 0
+        for index in range(options['images']):
+            image, bboxes = make_synthetic_image(rng, options['width'], options['height'], options['rois'])
+            baseline_seconds, expected = best_time(run_reference, image, bboxes)
+            fused_seconds, actual = best_time(detector.detect, image, bboxes)
+            if actual != expected:
+                raise CommandError(f'이미지 {index}: 단일 패스 탐지 결과가 기존 결과와 다릅니다')
+            baseline_total += baseline_seconds
+            fused_total += fused_seconds
+            region_count += len(actual)
+
+        count = max(1, options['images'])
+        baseline_ms = baseline_total / count * 1000
+        fused_ms = fused_total / count * 1000
+        self.stdout.write(
+            f"🖼️ 합성 이미지 {options['images']}장 ({options['width']}x{options['height']}, 광어 {options['rois']}마리), "
+            f"탐지 부위 {region_count}개 - 결과 동일"
+        )
+        self.stdout.write(f"  기존 방식:      {baseline_ms:.2f} ms/이미지")
+        self.stdout.write(f"  단일 패스:      {fused_ms:.2f} ms/이미지")
+        self.stdout.write(self.style.SUCCESS(
+            f"  속도 향상:      {baseline_ms / fused_ms:.2f}x" if fused_ms else "  속도 향상: -"
+        ))
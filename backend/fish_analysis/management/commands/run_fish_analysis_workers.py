@@ -0,0 +1,55 @@
+"""
+생선 분석 워커 스레드 풀과 작업 큐 디스패처를 전용 프로세스로 실행하는 Django 관리 명령어
+"""
+import signal
+
+from django.core.management.base import BaseCommand
+
+from fish_analysis.jobs import FishAnalysisJobQueue, get_job_settings
+from fish_analysis.model_lifecycle import model_lifecycle
+
+
+class Command(BaseCommand):
+    help = 'FishAnalysisJob 대기 작업을 생선 분석 워커에서 처리합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads',
+            type=int,
+            help='동시 분석 작업 수 (기본: FISH_ANALYSIS_WORKERS["THREADS"])',
+        )
+
+    def handle(self, *args, **options):
+        config = get_job_settings()
+        job_queue = FishAnalysisJobQueue(
+            threads=options.get('threads') or config['THREADS'],
+            max_depth=config['MAX_QUEUE_DEPTH'],
+            poll_interval=config['POLL_INTERVAL_SECONDS'],
+            job_timeout=config['JOB_TIMEOUT_SECONDS'],
+            max_attempts=config['MAX_ATTEMPTS'],
+        )
+
+        def shutdown(signum, frame):
+            self.stdout.write(self.style.WARNING('🛑 종료 신호 수신 - 실행 중 작업 완료 후 종료합니다'))
+            job_queue.stop()
+
+        signal.signal(signal.SIGTERM, shutdown)
+        signal.signal(signal.SIGINT, shutdown)
+
+        try:
+            # 추론 워커는 작업을 받기 전에 모든 모델을 로드하고 워밍업 추론까지 마침 (첫 작업에 로드 시간이 붙지 않도록)
+            self.stdout.write('🔄 생선 분석 모델 로딩 + 워밍업...')
+            model_lifecycle.preload()
+            for name, state in model_lifecycle.status().items():
+                self.stdout.write(
+                    f"  {name}: {state['state']} "
+                    f"(로드 {state['load_seconds'] or 0}초, 워밍업 {state['warmup_seconds'] or 0}초)"
+                )
+
+            self.stdout.write(self.style.SUCCESS(
+                f'🐟 생선 분석 워커 시작 (스레드 {job_queue.threads}개, 최대 대기 {job_queue.max_depth}건)'
+            ))
+            job_queue.run_forever()
+        finally:
+            job_queue.shutdown(wait=True)
+            self.stdout.write(self.style.SUCCESS('✅ 생선 분석 워커 종료'))
@@ -0,0 +1,227 @@
+"""
+생선 분석 모델 수명 주기 관리
+분석기(DjangoFishAnalyzer, FlounderDiseaseAnalyzer)의 모델 로드와 워밍업을 한 곳에서 관리합니다.
+- MODE=lazy: 웹 프로세스 기본값. 모델은 처음 분석 요청이 들어올 때 한 번만 로드합니다.
+- MODE=eager: 프로세스 시작 시(wsgi 로드 시 백그라운드, 분석 워커 명령은 항상) 미리 로드하고 워밍업 추론까지 마칩니다.
+  준비가 끝나기 전에는 /health/ 가 503 을 반환해 로드밸런서가 요청을 보내지 않습니다.
+- MODE=disabled: 모델을 로드하지 않고 Mock 결과를 사용합니다.
+MODE 를 설정하지 않으면 운영은 모두 lazy 이고, DEBUG 에서는 생선 분석기만 disabled 입니다
+(기존 signals 는 DEBUG 에서 django_fish_analyzer 만 건너뛰고, 광어 분석기는 항상 모델을 로드했음).
+로드에 실패하면 Mock 결과를 쓰다가 RETRY_SECONDS 부터 두 배씩 늘어나는 대기 후 다음 분석 요청에서 다시 로드합니다.
+모델별 상태(not_loaded/loading/ready/failed)와 로드/워밍업 시간을 기록해 /health/ 와 모델 상태 API 에서 보고합니다.
+
+/health/ 에서 상태만 조회할 때 torch 등을 import 하지 않도록 분석기 모듈은 실제로 로드할 때 import 합니다.
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+FISH_ANALYZER = 'fish_analyzer'
+FLOUNDER_ANALYZER = 'flounder_analyzer'
+
+NOT_LOADED = 'not_loaded'
+LOADING = 'loading'
+READY = 'ready'
+FAILED = 'failed'
+DISABLED = 'disabled'
+
+MODE_LAZY = 'lazy'
+MODE_EAGER = 'eager'
+MODE_DISABLED = 'disabled'
+
+# 워밍업 추론용 빈 이미지 크기 (YOLO 기본 입력 크기)
+WARMUP_IMAGE_SIZE = 640
+
+
+def get_lifecycle_settings():
+    """FISH_MODEL_LIFECYCLE 설정 (기본값 포함, MODE 미설정이면 None - 분석기별 기본값 사용)"""
+    config = getattr(settings, 'FISH_MODEL_LIFECYCLE', {})
+    mode = config.get('MODE') or None
+    return {
+        'MODE': mode if mode in (None, MODE_LAZY, MODE_EAGER, MODE_DISABLED) else MODE_LAZY,
+        'WARMUP': config.get('WARMUP', True),
+        'RETRY_SECONDS': config.get('RETRY_SECONDS', 30),
+        'MAX_RETRY_SECONDS': config.get('MAX_RETRY_SECONDS', 600),
+    }
+
+
+def warmup_image():
+    """워밍업 추론용 빈 BGR 이미지"""
+    return np.zeros((WARMUP_IMAGE_SIZE, WARMUP_IMAGE_SIZE, 3), np.uint8)
+
+
+class _ModelEntry:
+    def __init__(self, name, loader, disabled_in_debug=False):
+        self.name = name
+        self.loader = loader
+        self.disabled_in_debug = disabled_in_debug
+        self.lock = threading.Lock()
+        self.state = NOT_LOADED
+        self.error = None
+        self.failures = 0  # 연속 로드 실패 횟수 (재시도 대기 시간 계산용)
+        self.retry_at = None  # 이 시각(monotonic) 이후 다음 분석 요청에서 다시 로드
+        self.load_seconds = None
+        self.warmup_seconds = None
+        self.ready_at = None
+
+
+class ModelLifecycle:
+    """이름 → 분석기 로더 레지스트리 (프로세스 단위)"""
+
+    def __init__(self):
+        self._entries = {}
+        self._preload_thread = None
+        self._lock = threading.Lock()
+
+    def register(self, name, loader, disabled_in_debug=False):
+        """
+        분석기 등록 - loader() 는 모델을 로드한 분석기를 반환합니다.
+        분석기에 warmup() 이 있으면 로드 직후 워밍업 추론에 사용합니다.
+        disabled_in_debug=True 면 MODE 미설정 + DEBUG 에서 disabled 로 동작합니다.
+        """
+        self._entries[name] = _ModelEntry(name, loader, disabled_in_debug)
+
+    def mode_for(self, name):
+        """분석기별 동작 모드 (MODE 설정이 있으면 모든 분석기에 적용)"""
+        mode = get_lifecycle_settings()['MODE']
+        if mode:
+            return mode
+        if settings.DEBUG and self._entries[name].disabled_in_debug:
+            return MODE_DISABLED
+        return MODE_LAZY
+
+    def ensure_ready(self, name):
+        """
+        분석 전에 호출 - 아직 로드하지 않았으면 로드 (동시에 호출돼도 로드는 한 번)
+        disabled 모드이거나 로드에 실패한 경우 분석기는 Mock 결과를 사용하고,
+        실패 후 재시도 대기 시간이 지나면 다시 로드합니다.
+        """
+        entry = self._entries[name]
+        if entry.state == READY or self.mode_for(name) == MODE_DISABLED:
+            return
+        if entry.state == FAILED and time.monotonic() < entry.retry_at:
+            return
+        self.load(name)
+
+    def load(self, name, force=False, warmup=None):
+        """분석기 로드 + 워밍업 (force=True 면 이미 로드됐어도 다시 로드) - 성공 여부 반환"""
+        entry = self._entries[name]
+        if warmup is None:
+            warmup = get_lifecycle_settings()['WARMUP']
+
+        with entry.lock:
+            if entry.state == READY and not force:
+                return True
+            if entry.state == FAILED and not force and time.monotonic() < entry.retry_at:
+                # 기다리는 동안 다른 스레드가 방금 실패한 경우 바로 다시 로드하지 않음
+                return False
+
+            entry.state = LOADING
+            entry.error = None
+            logger.info(f"🔄 분석 모델 로딩: {name}")
+            try:
+                started = time.perf_counter()
+                analyzer = entry.loader()
+                entry.load_seconds = round(time.perf_counter() - started, 3)
+
+                if warmup and hasattr(analyzer, 'warmup'):
+                    started = time.perf_counter()
+                    analyzer.warmup()
+                    entry.warmup_seconds = round(time.perf_counter() - started, 3)
+            except Exception as e:
+                config = get_lifecycle_settings()
+                entry.state = FAILED
+                entry.error = str(e)
+                entry.failures += 1
+                retry_seconds = min(
+                    config['RETRY_SECONDS'] * 2 ** (entry.failures - 1), config['MAX_RETRY_SECONDS']
+                )
+                entry.retry_at = time.monotonic() + retry_seconds
+                logger.error(f"❌ 분석 모델 로드 실패: {name} - {e} ({retry_seconds}초 후 재시도)")
+                return False
+
+            entry.state = READY
+            entry.failures = 0
+            entry.retry_at = None
+            entry.ready_at = datetime.now()
+            logger.info(
+                f"✅ 분석 모델 준비 완료: {name} "
+                f"(로드 {entry.load_seconds}초, 워밍업 {entry.warmup_seconds or 0}초)"
+            )
+            return True
+
+    def preload(self, names=None, background=False):
+        """
+        등록된 분석기를 미리 로드 (disabled 모드에서는 건너뜀)
+        background=True 면 별도 스레드에서 로드하고 즉시 반환합니다.
+        """
+        names = [name for name in (names or self._entries) if self.mode_for(name) != MODE_DISABLED]
+        if not names:
+            logger.info("🔄 분석 모델 로드 비활성화 (Mock 결과 사용)")
+            return
+
+        if not background:
+            for name in names:
+                self.load(name)
+            return
+
+        with self._lock:
+            if self._preload_thread is not None and self._preload_thread.is_alive():
+                return
+            self._preload_thread = threading.Thread(
+                target=self.preload, args=(names,), name='fish-model-preload', daemon=True
+            )
+            self._preload_thread.start()
+
+    def is_ready(self):
+        """모든 분석기가 분석 가능한 상태인지 (disabled 분석기는 항상 준비됨)"""
+        return all(
+            entry.state in (READY, FAILED) or self.mode_for(name) == MODE_DISABLED
+            for name, entry in self._entries.items()
+        )
+
+    def requires_preload(self):
+        """이 프로세스가 준비 완료 전까지 요청을 받지 않아야 하는지 (eager 모드)"""
+        return any(self.mode_for(name) == MODE_EAGER for name in self._entries)
+
+    def status(self):
+        """분석기별 상태 (/health/, 모델 상태 API 용)"""
+        return {
+            name: {
+                'state': (
+                    DISABLED if self.mode_for(name) == MODE_DISABLED and entry.state == NOT_LOADED
+                    else entry.state
+                ),
+                'load_seconds': entry.load_seconds,
+                'warmup_seconds': entry.warmup_seconds,
+                'ready_at': entry.ready_at.isoformat() if entry.ready_at else None,
+                'error': entry.error,
+            }
+            for name, entry in self._entries.items()
+        }
+
+
+def _load_fish_analyzer():
+    from .analyzer import django_fish_analyzer
+    django_fish_analyzer.initialize_models()
+    if not django_fish_analyzer.model_loaded:
+        raise RuntimeError('생선 분석 모델을 로드하지 못했습니다')
+    return django_fish_analyzer
+
+
+def _load_flounder_analyzer():
+    from .flounder_analyzer import flounder_analyzer
+    flounder_analyzer.initialize_models()
+    return flounder_analyzer
+
+
+# 전역 수명 주기 관리자
+model_lifecycle = ModelLifecycle()
+model_lifecycle.register(FISH_ANALYZER, _load_fish_analyzer, disabled_in_debug=True)
+model_lifecycle.register(FLOUNDER_ANALYZER, _load_flounder_analyzer)
@@ -231,4 +231,62 @@ FishAnalysis.add_to_class('session', models.ForeignKey(
     blank=True,
     related_name='analyses',
     verbose_name='분석 세션'
-))
\ No newline at end of file
+))
+
+class FishAnalysisJob(models.Model):
+    """
+    비동기 분석 작업 (이 테이블이 작업 큐 역할 - status='pending' 행이 대기 작업)
+    업로드 요청은 작업만 등록하고 바로 응답하며, 추론은 별도 워커 스레드 풀에서 실행됩니다.
+    """
+    
+    JOB_TYPE_CHOICES = [
+        ('analyze', '생선 상태 분석'),
+        ('flounder', '광어 질병 분석'),
+    ]
+    
+    STATUS_CHOICES = [
+        ('pending', '대기 중'),
+        ('processing', '처리 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True, blank=True, verbose_name='사용자')
+    job_type = models.CharField(max_length=20, choices=JOB_TYPE_CHOICES, default='analyze', verbose_name='작업 종류')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', verbose_name='상태')
+    image = models.ImageField(upload_to='fish_analysis_jobs/%Y/%m/%d/', blank=True, verbose_name='업로드 이미지')
+    options = models.JSONField(default=dict, blank=True, verbose_name='분석 옵션')
+    
+    # 결과 (생선 상태 분석은 FishAnalysis, 광어 질병 분석은 결과 JSON)
+    analysis = models.ForeignKey(
+        FishAnalysis,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='jobs',
+        verbose_name='분석 결과'
+    )
+    result = models.JSONField(null=True, blank=True, verbose_name='결과 데이터')
+    error_message = models.TextField(blank=True, verbose_name='오류 메시지')
+    
+    # 처리 정보
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')
+    timings = models.JSONField(default=dict, blank=True, verbose_name='단계별 처리 시간(초)')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='등록 시간')
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name='처리 시작 시간')
+    completed_at = models.DateTimeField(null=True, blank=True, verbose_name='완료 시간')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정 시간')
+    
+    class Meta:
+        db_table = 'fish_analysis_job'
+        ordering = ['-created_at']
+        verbose_name = '분석 작업'
+        verbose_name_plural = '분석 작업들'
+        indexes = [
+            # 작업 큐: 오래된 대기 작업부터
+            models.Index(fields=['status', 'created_at'], name='fish_job_queue_idx'),
+        ]
+        
+    def __str__(self):
+        return f"{self.get_job_type_display()} 작업 {self.id} - {self.status}"
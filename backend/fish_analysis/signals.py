@@ -1,24 +1,19 @@
 from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 from django.apps import apps
-from django.conf import settings
 import logging
 import os
 
 from .models import FishAnalysis, DiseaseDetection
-from .analyzer import django_fish_analyzer
+from .model_lifecycle import model_lifecycle
 
 logger = logging.getLogger(__name__)
 
 def initialize_ai_models():
-    """AI 모델 초기화 (필요시 수동 호출)"""
+    """AI 모델 초기화 (필요시 수동 호출, 개발 모드 기본값인 disabled 모드에서는 건너뜀)"""
     try:
-        if settings.DEBUG:
-            logger.info("🔄 개발 모드에서 AI 모델 초기화 건너뜀")
-            return
-            
         logger.info("🚀 AI 모델 초기화 시작...")
-        django_fish_analyzer.initialize_models()
+        model_lifecycle.preload()
         logger.info("✅ AI 모델 초기화 완료")
         
     except Exception as e:
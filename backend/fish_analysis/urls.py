@@ -18,6 +18,10 @@ urlpatterns = [
     
     # 광어 질병 분석 API (1회성, DB 저장 없음)
     path('flounder-disease/', views.analyze_flounder_disease, name='flounder-disease'),
+    path('annotated/<slug:key>/', views.get_annotated_image, name='annotated-image'),
+    
+    # 비동기 분석 작업 조회 (async=true 로 등록한 작업)
+    path('jobs/<uuid:job_id>/', views.get_analysis_job, name='job-detail'),
     
     # 결과 조회
     path('history/', views.AnalysisHistoryListView.as_view(), name='history'),
@@ -43,6 +47,14 @@ API 엔드포인트 목록:
 - POST /api/v1/fish/analyze/                 # 단일 이미지 분석
 - POST /api/v1/fish/batch-analyze/           # 배치 이미지 분석  
 - POST /api/v1/fish/mobile-analyze/          # 모바일 앱용 분석
+  (analyze/mobile-analyze/flounder-disease 에 async=true 를 넘기면 작업 ID 를 바로 반환 - 202)
+
+비동기 작업:
+- GET  /api/v1/fish/jobs/<uuid>/?wait=초     # 작업 상태/결과 조회 (롱폴링)
+
+광어 질병 분석:
+- POST /api/v1/fish/flounder-disease/        # 광어 질병 분석 (annotated_output=url|base64)
+- GET  /api/v1/fish/annotated/<sha256>/      # 표기 이미지 (?variant=thumbnail|progressive, 첫 요청 시 생성)
 
 결과 조회:
 - GET  /api/v1/fish/history/                 # 분석 기록 목록 (페이지네이션)
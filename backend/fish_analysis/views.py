@@ -5,8 +5,11 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView, RetrieveAPIView, CreateAPIView
 from rest_framework.pagination import PageNumberPagination
+from django.db import transaction
 from django.db.models import Count, Avg, Q
+from django.http import FileResponse, Http404
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from django.contrib.auth.models import User
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
@@ -16,7 +19,7 @@ import logging
 from collections import Counter
 from datetime import datetime, timedelta
 
-from .models import FishAnalysis, DiseaseDetection, AnalysisSession
+from .models import FishAnalysis, DiseaseDetection, AnalysisSession, FishAnalysisJob
 from .serializers import (
     FishAnalysisSerializer,
     AnalysisRequestSerializer,
@@ -31,6 +34,9 @@ from .serializers import (
 )
 from .analyzer import django_fish_analyzer
 from .flounder_analyzer import flounder_analyzer
+from .jobs import get_job_queue, FishAnalysisQueueFull
+from .annotated_images import AnnotatedImageStore, VARIANTS, ORIGINAL
+from .model_lifecycle import model_lifecycle, FISH_ANALYZER
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +49,63 @@ SUPPORTED_IMAGE_TYPES = {
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
 
+def _wants_async(request):
+    """비동기 작업 모드 요청 여부 (폼 필드 또는 쿼리 파라미터 async=true)"""
+    value = request.data.get('async', request.query_params.get('async', 'false'))
+    return str(value).lower() in ('true', '1')
+
+
+def _enqueue_analysis_job(request, job_type, image_file, options=None):
+    """분석 작업을 등록하고 작업 ID 를 바로 반환 (202), 대기열이 가득 차면 429"""
+    job_queue = get_job_queue()
+    try:
+        queue_depth = job_queue.check_capacity()
+    except FishAnalysisQueueFull as e:
+        logger.warning(f"⏳ 생선 분석 대기열 포화: {e.depth}/{e.limit}")
+        response = Response(
+            {
+                "error": "분석 요청이 많아 잠시 후 다시 시도해주세요.",
+                "queue_depth": e.depth,
+                "max_queue_depth": e.limit
+            },
+            status=status.HTTP_429_TOO_MANY_REQUESTS
+        )
+        response['Retry-After'] = '10'
+        return response
+    
+    with transaction.atomic():
+        job = FishAnalysisJob.objects.create(
+            user=request.user if request.user.is_authenticated else None,
+            job_type=job_type,
+            image=image_file,
+            options=options or {}
+        )
+        job_queue.enqueue(job)
+    
+    logger.info(f"📥 생선 분석 작업 등록 - ID: {job.id}, 종류: {job_type}, 대기 {queue_depth}건")
+    
+    return Response(
+        {
+            "job_id": str(job.id),
+            "status": job.status,
+            "queue_position": queue_depth,
+            "status_url": request.build_absolute_uri(reverse('fish_analysis:job-detail', args=[job.id]))
+        },
+        status=status.HTTP_202_ACCEPTED
+    )
+
+
+def _absolute_annotated_urls(request, result):
+    """광어 분석 결과의 표기 이미지 URL 을 절대 URL 로 변환"""
+    if result and result.get('annotated_image_urls'):
+        result = dict(result)
+        result['annotated_image_urls'] = {
+            variant: request.build_absolute_uri(url)
+            for variant, url in result['annotated_image_urls'].items()
+        }
+    return result
+
+
 class StandardResultsSetPagination(PageNumberPagination):
     """표준 페이지네이션"""
     page_size = 20
@@ -91,6 +154,16 @@ def analyze_fish_image(request):
                 defaults={'description': f'세션 생성: {datetime.now()}'}
             )
         
+        # 비동기 모드: 작업만 등록하고 결과는 작업 조회 API 로 확인
+        if _wants_async(request):
+            return _enqueue_analysis_job(request, 'analyze', image_file, {
+                'analyze_species': validated_data['analyze_species'],
+                'analyze_health': validated_data['analyze_health'],
+                'analyze_diseases': validated_data['analyze_diseases'],
+                'confidence_threshold': validated_data['confidence_threshold'],
+                'session_id': str(session.id) if session else None,
+            })
+        
         # 이미지 바이트 읽기
         image_bytes = image_file.read()
         
@@ -168,36 +241,34 @@ def batch_analyze_fish_images(request):
                 description=f'배치 분석 - {len(images)}개 이미지'
             )
         
-        results = []
-        
-        for i, image_file in enumerate(images):
-            try:
-                logger.info(f"🔍 배치 분석 [{i+1}/{len(images)}] - 파일명: {image_file.name}")
-                
-                # 파일 유효성 검사
-                if image_file.content_type not in SUPPORTED_IMAGE_TYPES:
-                    continue
-                    
-                if image_file.size > MAX_FILE_SIZE:
-                    continue
-                
-                # 이미지 분석
-                image_bytes = image_file.read()
-                analysis_result = django_fish_analyzer.analyze_image_sync(
-                    image_bytes=image_bytes,
-                    user=request.user if request.user.is_authenticated else None,
-                    analyze_species=analyze_species,
-                    analyze_health=analyze_health,
-                    analyze_diseases=analyze_diseases,
-                    confidence_threshold=confidence_threshold,
-                    session=session
-                )
-                
-                results.append(analysis_result)
-                
-            except Exception as e:
-                logger.error(f"❌ 파일 {image_file.name} 분석 실패: {str(e)}")
+        # 파일 유효성 검사 (지원하지 않는 형식/크기 초과 파일은 건너뜀)
+        valid_files = []
+        for image_file in images:
+            if image_file.content_type not in SUPPORTED_IMAGE_TYPES:
+                logger.warning(f"⚠️ 지원하지 않는 형식 건너뜀: {image_file.name}")
                 continue
+            if image_file.size > MAX_FILE_SIZE:
+                logger.warning(f"⚠️ 파일 크기 초과 건너뜀: {image_file.name}")
+                continue
+            valid_files.append(image_file)
+        
+        logger.info(f"🔍 배치 분석 시작 - {len(valid_files)}/{len(images)}개 이미지")
+        
+        # 전처리는 병렬, 탐지/분류는 배치 추론, 저장은 한 트랜잭션으로 처리
+        analyses = django_fish_analyzer.analyze_batch_sync(
+            images_bytes=[image_file.read() for image_file in valid_files],
+            user=request.user if request.user.is_authenticated else None,
+            analyze_species=analyze_species,
+            analyze_health=analyze_health,
+            analyze_diseases=analyze_diseases,
+            confidence_threshold=confidence_threshold,
+            session=session
+        )
+        
+        for image_file, analysis in zip(valid_files, analyses):
+            if analysis is None:
+                logger.error(f"❌ 파일 {image_file.name} 분석 실패: 이미지를 읽을 수 없습니다.")
+        results = [analysis for analysis in analyses if analysis is not None]
         
         # 결과 직렬화
         response_serializer = FishAnalysisSerializer(
@@ -361,6 +432,7 @@ def get_supported_formats(request):
 def get_model_status(request):
     """AI 모델 상태 확인 API"""
     model_status = django_fish_analyzer.get_model_status()
+    model_status['job_queue'] = get_job_queue().metrics()
     return Response(model_status)
 
 
@@ -375,11 +447,13 @@ def get_model_status(request):
 def initialize_models(request):
     """AI 모델 초기화 API (관리자 전용)"""
     try:
-        django_fish_analyzer.initialize_models()
+        # 이미 로드된 모델도 다시 로드 + 워밍업 (상태는 /health/ 와 모델 상태 API 에 반영)
+        model_lifecycle.load(FISH_ANALYZER, force=True)
         return Response({
             "success": True,
             "message": "모델 초기화가 완료되었습니다.",
-            "model_loaded": django_fish_analyzer.model_loaded
+            "model_loaded": django_fish_analyzer.model_loaded,
+            "lifecycle": model_lifecycle.status()[FISH_ANALYZER]
         })
     except Exception as e:
         logger.error(f"❌ 모델 초기화 실패: {str(e)}")
@@ -494,6 +568,7 @@ def mobile_analyze_fish_image(request):
             'type': 'object',
             'properties': {
                 'image': {'type': 'string', 'format': 'binary', 'description': '분석할 광어 이미지'},
+                'annotated_output': {'type': 'string', 'enum': ['url', 'base64'], 'description': '표기 이미지 반환 방식 (기본: url)'},
             },
             'required': ['image']
         }
@@ -520,7 +595,11 @@ def mobile_analyze_fish_image(request):
                         }
                     }
                 },
-                'annotated_image': {'type': 'string', 'description': 'Base64 encoded annotated image'},
+                'annotated_image': {'type': 'string', 'description': 'Base64 encoded annotated image (annotated_output=base64 인 경우)'},
+                'annotated_image_urls': {
+                    'type': 'object',
+                    'description': '표기 이미지 URL (original/thumbnail/progressive, annotated_output=url 인 경우)'
+                },
                 'confidence_scores': {'type': 'object'}
             }
         },
@@ -559,21 +638,106 @@ def analyze_flounder_disease(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        # 비동기 모드: 작업만 등록하고 결과는 작업 조회 API 로 확인
+        annotated_output = request.data.get('annotated_output') or None
+        if annotated_output not in (None, 'url', 'base64'):
+            return Response(
+                {"error": "annotated_output 은 url 또는 base64 만 가능합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if _wants_async(request):
+            return _enqueue_analysis_job(request, 'flounder', image_file, {'annotated_output': annotated_output})
+        
         logger.info(f"🐟 광어 질병 분석 시작 - 파일명: {image_file.name}, 크기: {image_file.size} bytes")
         
         # 이미지 바이트 읽기
         image_bytes = image_file.read()
         
         # 광어 질병 분석 수행
-        analysis_result = flounder_analyzer.analyze_flounder_image(image_bytes)
+        analysis_result = flounder_analyzer.analyze_flounder_image(image_bytes, annotated_output=annotated_output)
         
         logger.info(f"✅ 광어 질병 분석 완료 - 성공: {analysis_result['success']}")
         
-        return Response(analysis_result, status=status.HTTP_200_OK)
+        return Response(_absolute_annotated_urls(request, analysis_result), status=status.HTTP_200_OK)
         
     except Exception as e:
         logger.error(f"❌ 광어 질병 분석 실패: {str(e)}")
         return Response(
             {"error": f"분석 중 오류가 발생했습니다: {str(e)}"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+        )
+
+@extend_schema(
+    summary="분석 작업 조회",
+    description="비동기(async=true)로 등록한 분석 작업의 상태와 결과를 조회합니다. wait=초 를 넘기면 완료될 때까지 최대 그 시간만큼 기다립니다(롱폴링).",
+    parameters=[
+        OpenApiParameter(name='wait', type=OpenApiTypes.INT, description='완료까지 대기할 최대 시간(초)'),
+    ],
+    tags=["생선 분석"]
+)
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+def get_analysis_job(request, job_id):
+    """분석 작업 상태/결과 조회 API (광어 질병 분석 작업은 비로그인 사용자도 등록하므로 작업 ID 로 조회)"""
+    job = get_object_or_404(FishAnalysisJob, id=job_id)
+    if job.user_id and job.user_id != request.user.id and not request.user.is_staff:
+        return Response({"error": "작업을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+    
+    try:
+        wait_seconds = float(request.query_params.get('wait', 0))
+    except ValueError:
+        wait_seconds = 0
+    job_queue = get_job_queue()
+    if wait_seconds > 0:
+        job = job_queue.wait(job, wait_seconds)
+    
+    data = {
+        "job_id": str(job.id),
+        "job_type": job.job_type,
+        "status": job.status,
+        "queue_position": job_queue.position(job),
+        "attempts": job.attempts,
+        "timings": job.timings,
+        "created_at": job.created_at,
+        "completed_at": job.completed_at,
+        "error": job.error_message or None,
+        "result": None,
+    }
+    if job.status == 'completed':
+        if job.analysis_id:
+            analysis = FishAnalysis.objects.select_related('user', 'session').prefetch_related(
+                'detection_boxes', 'diseases'
+            ).get(id=job.analysis_id)
+            data["result"] = FishAnalysisSerializer(analysis, context={'request': request}).data
+        else:
+            data["result"] = _absolute_annotated_urls(request, job.result)
+    
+    return Response(data)
+
+
+@extend_schema(
+    summary="광어 분석 표기 이미지",
+    description="광어 질병 분석 결과의 표기 이미지를 반환합니다. variant=thumbnail|progressive 변형은 처음 요청될 때 생성됩니다.",
+    parameters=[
+        OpenApiParameter(name='variant', type=OpenApiTypes.STR, description='original(기본) / thumbnail / progressive'),
+    ],
+    tags=["광어 질병 분석"]
+)
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+def get_annotated_image(request, key):
+    """표기 이미지 파일 응답 (파일 이름이 내용 해시이므로 영구 캐시)"""
+    variant = request.query_params.get('variant', ORIGINAL)
+    if not AnnotatedImageStore.is_valid_key(key) or variant not in VARIANTS:
+        raise Http404
+    
+    try:
+        image_file = AnnotatedImageStore.open_variant(key, variant)
+    except FileNotFoundError:
+        raise Http404
+    
+    response = FileResponse(image_file, content_type='image/jpeg')
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    response['ETag'] = f'"{key}-{variant}"'
+    return response
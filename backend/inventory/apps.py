@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class InventoryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'inventory'
-    verbose_name = '재고 관리' 
\ No newline at end of file
+    verbose_name = '재고 관리' 
+
+    def ready(self):
+        # 재고 스냅샷 캐시 무효화 시그널 등록
+        import inventory.signals
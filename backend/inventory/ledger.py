@@ -0,0 +1,264 @@
+"""
+재고 원장 서비스
+주문 접수/수정/출고/취소로 생기는 재고 변동을 한 곳에서 처리합니다.
+- 주문의 모든 항목을 한 트랜잭션에서 반영 (select_for_update 로 재고 행 잠금, id 순으로 잠가 교착 방지)
+- 잠근 값 기준으로 새 수량을 계산해 bulk_update 1회로 저장 (동시 주문에서도 갱신 유실 없음)
+- StockTransaction / InventoryLog 는 bulk_create 로 기록
+주문 항목의 재고는 기존과 같이 사용자의 해당 어종 첫 번째 재고(id 순)입니다.
+
+StockTransaction.quantity_change 는 판매 가능 수량(재고 - 주문수량) 기준입니다.
+- 주문 접수: 'order' (-수량, 주문수량 증가)
+- 주문 취소: 'cancel' (+수량, 주문수량 감소)
+- 주문 수정: 'adjustment' (기존 항목 +수량, 새 항목 -수량)
+- 출고: 'order' (-수량, 재고수량/주문수량 감소) - 실제 재고가 바뀌므로 InventoryLog('out') 도 기록
+"""
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Inventory, InventoryLog, StockTransaction
+
+logger = logging.getLogger(__name__)
+
+
+class InsufficientStockError(Exception):
+    """출고할 재고가 부족함 - insufficient_items 에 어종별 부족 내역"""
+
+    def __init__(self, insufficient_items):
+        self.insufficient_items = insufficient_items
+        super().__init__(f"재고 부족: {len(insufficient_items)}개 어종")
+
+
+class StockMovement:
+    """주문 항목 하나의 재고 변동"""
+
+    def __init__(self, fish_type_id, stock_change=0, ordered_change=0, transaction_type='order',
+                 order_id=None, unit='', fish_name='', notes=''):
+        self.fish_type_id = fish_type_id
+        self.stock_change = stock_change
+        self.ordered_change = ordered_change
+        self.transaction_type = transaction_type
+        self.order_id = order_id
+        self.unit = unit
+        self.fish_name = fish_name
+        self.notes = notes
+        self.inventory = None
+
+    @property
+    def available_change(self):
+        """판매 가능 수량(재고 - 주문수량) 변화량"""
+        return self.stock_change - self.ordered_change
+
+
+class StockLedger:
+    """주문 단위 재고 변동 관리 클래스"""
+
+    # ------------------------------------------------------------------
+    # 주문 단위 진입점
+    # ------------------------------------------------------------------
+    @staticmethod
+    def reserve(order, items=None):
+        """주문 접수 - 항목 수량만큼 주문수량 증가"""
+        items = StockLedger._order_items(order, items)
+        return StockLedger.reserve_items(order.user_id, items)
+
+    @staticmethod
+    def reserve_items(user_id, items):
+        """여러 주문의 항목을 한 번에 접수 (주문 일괄 가져오기)"""
+        movements = [
+            StockLedger._movement(item, ordered_change=item.quantity or 0, transaction_type='order', action='접수')
+            for item in items
+        ]
+        return StockLedger.apply(user_id, movements)
+
+    @staticmethod
+    def release(order, items=None):
+        """주문 취소 - 항목 수량만큼 주문수량 감소 (재고수량은 그대로)"""
+        items = StockLedger._order_items(order, items)
+        movements = [
+            StockLedger._movement(item, ordered_change=-(item.quantity or 0), transaction_type='cancel', action='취소')
+            for item in items
+        ]
+        return StockLedger.apply(order.user_id, movements)
+
+    @staticmethod
+    def replace_items(order, old_items, new_items):
+        """주문 수정 - 기존 항목 주문수량 감소 + 새 항목 주문수량 증가를 한 번에 반영"""
+        movements = [
+            StockLedger._movement(item, ordered_change=-(item.quantity or 0), transaction_type='adjustment', action='수정 전')
+            for item in old_items
+        ] + [
+            StockLedger._movement(item, ordered_change=item.quantity or 0, transaction_type='adjustment', action='수정 후')
+            for item in new_items
+        ]
+        return StockLedger.apply(order.user_id, movements)
+
+    @staticmethod
+    def ship(order, items=None):
+        """
+        출고 - 재고수량과 주문수량을 함께 감소
+        잠근 재고로 부족 여부를 확인하므로 동시 출고에서도 재고가 음수가 되지 않습니다.
+        부족하면 InsufficientStockError (아무것도 반영하지 않음)
+        """
+        items = StockLedger._order_items(order, items)
+        movements = [
+            StockLedger._movement(
+                item, stock_change=-(item.quantity or 0), ordered_change=-(item.quantity or 0),
+                transaction_type='order', action='출고'
+            )
+            for item in items
+        ]
+        return StockLedger.apply(order.user_id, movements, check_stock=True)
+
+    @staticmethod
+    def shortages(order, items=None):
+        """출고 시 부족한 항목 목록 (잠금 없이 조회만, 출고 준비 상태 변경 전 검증용)"""
+        items = StockLedger._order_items(order, items)
+        movements = [
+            StockLedger._movement(item, stock_change=-(item.quantity or 0), action='출고')
+            for item in items
+        ]
+        inventories = StockLedger._first_inventories(Inventory.objects.all(), order.user_id, movements)
+        return StockLedger._insufficient_items(movements, inventories)
+
+    # ------------------------------------------------------------------
+    # 공통 처리
+    # ------------------------------------------------------------------
+    @staticmethod
+    def apply(user_id, movements, check_stock=False):
+        """
+        재고 변동 목록을 한 트랜잭션에서 반영하고 재고가 있어 반영된 변동 목록 반환
+        쿼리 수는 항목 수와 무관: 잠금 조회 1회 + bulk_update 1회 + 이력 bulk_create 최대 2회
+        """
+        movements = [m for m in movements if m.stock_change or m.ordered_change]
+        if not movements:
+            return []
+
+        with transaction.atomic():
+            locked = Inventory.objects.select_for_update().order_by('id')
+            inventories = StockLedger._first_inventories(locked, user_id, movements)
+
+            if check_stock:
+                insufficient_items = StockLedger._insufficient_items(movements, inventories)
+                if insufficient_items:
+                    raise InsufficientStockError(insufficient_items)
+
+            now = timezone.now()
+            applied, logs, changed = [], [], {}
+            for movement in movements:
+                inventory = inventories.get(movement.fish_type_id)
+                if inventory is None:
+                    logger.warning(f"재고 변동 실패: {movement.fish_name or movement.fish_type_id} - 재고 없음")
+                    continue
+
+                before = inventory.stock_quantity
+                inventory.stock_quantity += movement.stock_change
+                inventory.ordered_quantity += movement.ordered_change
+                inventory.updated_at = now  # bulk_update 는 auto_now 를 갱신하지 않음
+                changed[inventory.id] = inventory
+                movement.inventory = inventory
+                applied.append(movement)
+
+                if movement.stock_change:
+                    logs.append(InventoryLog(
+                        inventory=inventory,
+                        fish_type_id=movement.fish_type_id,
+                        type='in' if movement.stock_change > 0 else 'out',
+                        change=movement.stock_change,
+                        before_quantity=before,
+                        after_quantity=inventory.stock_quantity,
+                        unit=movement.unit or inventory.unit,
+                        source_type='manual',
+                        memo=movement.notes,
+                        updated_by_id=user_id,
+                    ))
+
+            if changed:
+                Inventory.objects.bulk_update(
+                    list(changed.values()), ['stock_quantity', 'ordered_quantity', 'updated_at']
+                )
+                StockTransaction.objects.bulk_create([
+                    StockTransaction(
+                        user_id=user_id,
+                        fish_type_id=movement.fish_type_id,
+                        inventory=movement.inventory,
+                        order_id=movement.order_id,
+                        transaction_type=movement.transaction_type,
+                        quantity_change=movement.available_change,
+                        unit=movement.unit or movement.inventory.unit,
+                        notes=movement.notes,
+                    )
+                    for movement in applied
+                ])
+                if logs:
+                    InventoryLog.objects.bulk_create(logs)
+                # bulk_update 는 Inventory post_save 시그널을 보내지 않으므로 대시보드/재고 스냅샷 캐시를 직접 무효화 (커밋 후에도 한 번 더)
+                StockLedger._invalidate_caches(user_id)
+
+        logger.info(f"재고 변동 반영: 사용자 {user_id}, 항목 {len(applied)}개, 재고 {len(changed)}개")
+        return applied
+
+    @staticmethod
+    def _order_items(order, items):
+        if items is not None:
+            return items
+        return list(order.items.select_related('fish_type'))
+
+    @staticmethod
+    def _movement(item, stock_change=0, ordered_change=0, transaction_type='order', action=''):
+        # select_related 로 읽은 항목만 어종명 사용 (일괄 가져오기 항목에서 어종 조회를 하지 않도록)
+        fish_type = item.fish_type if type(item).fish_type.is_cached(item) else None
+        return StockMovement(
+            item.fish_type_id,
+            stock_change=stock_change,
+            ordered_change=ordered_change,
+            transaction_type=transaction_type,
+            order_id=item.order_id,
+            unit=item.unit,
+            fish_name=fish_type.name if fish_type else '',
+            notes=f"주문 #{item.order_id} {action}: {item.quantity or 0:g}{item.unit or ''}",
+        )
+
+    @staticmethod
+    def _first_inventories(queryset, user_id, movements):
+        """어종별 첫 번째 재고 (조회 1회, 기존 .first() 와 같은 id 순)"""
+        fish_type_ids = {movement.fish_type_id for movement in movements}
+        inventories = {}
+        for inventory in queryset.filter(user_id=user_id, fish_type_id__in=fish_type_ids).order_by('id'):
+            inventories.setdefault(inventory.fish_type_id, inventory)
+        return inventories
+
+    @staticmethod
+    def _insufficient_items(movements, inventories):
+        """어종별 출고 필요 수량과 현재 재고 비교 (출고 뷰 응답 형식)"""
+        required = defaultdict(float)
+        first_movement = {}
+        for movement in movements:
+            if movement.stock_change < 0:
+                required[movement.fish_type_id] -= movement.stock_change
+                first_movement.setdefault(movement.fish_type_id, movement)
+
+        insufficient_items = []
+        for fish_type_id, quantity in required.items():
+            inventory = inventories.get(fish_type_id)
+            current_stock = inventory.stock_quantity if inventory else 0
+            if current_stock < quantity:
+                movement = first_movement[fish_type_id]
+                insufficient_items.append({
+                    'fish_name': movement.fish_name,
+                    'required_quantity': quantity,
+                    'current_stock': current_stock,
+                    'shortage': quantity - current_stock,
+                    'unit': movement.unit,
+                })
+        return insufficient_items
+
+    @staticmethod
+    def _invalidate_caches(user_id):
+        from dashboard.services import DashboardStatsService
+        from .services import InventorySnapshotService
+
+        DashboardStatsService.invalidate(user_id)
+        InventorySnapshotService.invalidate(user_id)
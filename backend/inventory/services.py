@@ -0,0 +1,137 @@
+"""
+사용자별 재고 스냅샷 서비스
+재고 목록(InventoryListCreateView), 재고 부족 목록(DashboardLowStockView), 재고 체크(StockCheckView)가
+요청마다 재고 테이블을 읽고 행마다 직렬화하던 것을 사용자별 스냅샷 하나로 대신합니다.
+- 스냅샷은 재고 조회 1회(어종 JOIN) + 어종 이름 조회 1회로 만들고, 목록/재고 부족 응답은 미리 JSON 으로 만들어 둡니다.
+- 각 JSON 에는 내용 해시로 만든 ETag 가 붙어, 클라이언트가 If-None-Match 를 보내면 304 로 응답합니다.
+- INVENTORY_SNAPSHOT_CACHE 가 켜져 있으면 Django 캐시(기본 프로세스 메모리, REDIS_URL 설정 시 Redis)에 저장합니다.
+캐시는 inventory.signals 와 StockLedger 에서 재고/어종 변경 시 무효화되고 다음 요청에서 다시 만들어집니다.
+"""
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Sum
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+from fish_registry.models import FishType
+from .models import Inventory
+
+logger = logging.getLogger(__name__)
+
+
+def json_blob(data):
+    """JSON 본문(bytes)과 내용 해시 ETag"""
+    body = json.dumps(data, cls=DjangoJSONEncoder).encode('utf-8')
+    return body, f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def snapshot_response(request, body, etag):
+    """미리 만든 JSON 응답 - If-None-Match 가 ETag 와 같으면 304 (클라이언트는 매번 재검증)"""
+    if_none_match = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+    if etag in if_none_match or '*' in if_none_match:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+class InventorySnapshotService:
+    """사용자별 재고 스냅샷 관리 클래스"""
+
+    CACHE_KEY = 'inventory:snapshot:{user_id}'
+
+    @staticmethod
+    def _cache_settings():
+        return getattr(settings, 'INVENTORY_SNAPSHOT_CACHE', {})
+
+    @staticmethod
+    def get_snapshot(user_id):
+        """캐시된 스냅샷 반환 (없으면 만든 뒤 캐시)"""
+        config = InventorySnapshotService._cache_settings()
+        if not config.get('ENABLED', True):
+            return InventorySnapshotService.build_snapshot(user_id)
+
+        cache_key = InventorySnapshotService.CACHE_KEY.format(user_id=user_id)
+        snapshot = cache.get(cache_key)
+        if snapshot is not None:
+            return snapshot
+
+        snapshot = InventorySnapshotService.build_snapshot(user_id)
+        cache.set(cache_key, snapshot, config.get('TTL_SECONDS', 10))
+        return snapshot
+
+    @staticmethod
+    def build_snapshot(user_id):
+        """
+        스냅샷 생성 (쿼리 2회)
+        items: 재고 목록 API 응답 항목 (최근 수정 순), names/stock: 어종 이름/어종별 재고 합계,
+        items_json/low_stock_json: 미리 만든 응답 본문과 ETag
+        """
+        from dashboard.services import LOW_STOCK_THRESHOLD
+        from .serializers import InventoryListSerializer
+
+        inventories = list(
+            Inventory.objects.select_related('fish_type').filter(user_id=user_id).order_by('-updated_at')
+        )
+
+        items = []
+        stock = {}
+        for inventory, item in zip(inventories, InventoryListSerializer(inventories, many=True).data):
+            item['ordered_quantity'] = inventory.ordered_quantity
+            items.append(item)
+            stock[inventory.fish_type_id] = stock.get(inventory.fish_type_id, 0) + inventory.stock_quantity
+
+        low_stock = [
+            {
+                'fish_name': inventory.fish_type.name,
+                'stock_quantity': inventory.stock_quantity,
+                'ordered_quantity': inventory.ordered_quantity,
+                'unit': inventory.unit,
+                'status': 'out_of_stock' if inventory.stock_quantity <= 0 else 'low'
+            }
+            for inventory in sorted(inventories, key=lambda inventory: inventory.id)
+            if inventory.stock_quantity <= LOW_STOCK_THRESHOLD
+        ]
+
+        logger.debug(f"재고 스냅샷 생성: user_id={user_id}, 재고 {len(items)}개")
+        return {
+            'items': items,
+            'names': dict(FishType.objects.filter(user_id=user_id).values_list('id', 'name')),
+            'stock': stock,
+            'items_json': json_blob(items),
+            'low_stock_json': json_blob(low_stock),
+        }
+
+    @staticmethod
+    def stock_levels(user_id, fish_type_ids):
+        """
+        재고 체크용 {'names': {어종 ID: 이름}, 'stock': {어종 ID: 재고 합계}}
+        캐시를 쓰면 스냅샷에서, 쓰지 않으면 요청한 어종만 조회 (쿼리 2회, 항목 수와 무관)
+        """
+        if InventorySnapshotService._cache_settings().get('ENABLED', True):
+            return InventorySnapshotService.get_snapshot(user_id)
+
+        stock_rows = Inventory.objects.filter(
+            user_id=user_id, fish_type_id__in=fish_type_ids
+        ).order_by().values('fish_type_id').annotate(total=Sum('stock_quantity'))
+        return {
+            'names': dict(FishType.objects.filter(user_id=user_id, id__in=fish_type_ids).values_list('id', 'name')),
+            'stock': {row['fish_type_id']: row['total'] or 0 for row in stock_rows},
+        }
+
+    @staticmethod
+    def invalidate(user_id):
+        """사용자 스냅샷 무효화 - 커밋 후에도 한 번 더 지워서 커밋 전 다시 만든 값이 남지 않게 함"""
+        if not user_id:
+            return
+        cache_key = InventorySnapshotService.CACHE_KEY.format(user_id=user_id)
+        cache.delete(cache_key)
+        transaction.on_commit(lambda: cache.delete(cache_key))
@@ -0,0 +1,19 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+import logging
+
+from fish_registry.models import FishType
+from .models import Inventory
+from .services import InventorySnapshotService
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Inventory)
+@receiver(post_delete, sender=Inventory)
+@receiver(post_save, sender=FishType)
+@receiver(post_delete, sender=FishType)
+def invalidate_inventory_snapshot(sender, instance, **kwargs):
+    """재고/어종 변경 시 해당 사용자의 재고 스냅샷 무효화"""
+    InventorySnapshotService.invalidate(instance.user_id)
+    logger.debug(f"🧹 재고 스냅샷 무효화: user_id={instance.user_id} ({sender.__name__})")
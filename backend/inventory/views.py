@@ -3,7 +3,6 @@ from django.views import View
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
-from django.db.models import Q
 from core.middleware import get_user_queryset_filter
 from .models import Inventory, InventoryLog
 from .serializers import (
@@ -29,41 +28,30 @@ class InventoryListCreateView(View):
         
         print(f"✅ 사용자 인증 확인: user_id={request.user_id}")
         
-        # 미들웨어에서 설정된 user_id 사용
-        queryset = Inventory.objects.select_related('fish_type').filter(**get_user_queryset_filter(request))
+        # 사용자 재고 스냅샷 (캐시, 재고/어종 변경 시 무효화) - 최근 수정 순으로 직렬화된 목록
+        from .services import InventorySnapshotService, json_blob, snapshot_response
+        snapshot = InventorySnapshotService.get_snapshot(request.user_id)
         
-        # 검색 기능
+        # 검색 기능 / 상태 필터 (스냅샷에서 거름)
         search = request.GET.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(fish_type__name__icontains=search) |
-                Q(status__icontains=search)
-            )
-        
-        # 상태 필터
         status_filter = request.GET.get('status', None)
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
-            
-        queryset = queryset.order_by('-updated_at')
-        
-        # 단순한 재고 데이터 조회 (새로운 방식)
-        print(f"📦 단순 재고 조회 시작 (총 {queryset.count()}개)")
+        if not search and not status_filter:
+            body, etag = snapshot['items_json']
+            print(f"✅ 재고 조회 완료: {len(snapshot['items'])}개 반환")
+            return snapshot_response(request, body, etag)
         
-        inventory_data = []
-        for inventory in queryset:
-            print(f"📦 재고 조회: {inventory.fish_type.name} - 현재 재고: {inventory.stock_quantity}")
-            
-            # 시리얼라이저 데이터 생성
-            inventory_serialized = InventoryListSerializer(inventory).data
-            
-            # 단순한 재고 정보만 추가
-            inventory_serialized['ordered_quantity'] = inventory.ordered_quantity
-            
-            inventory_data.append(inventory_serialized)
+        inventory_data = snapshot['items']
+        if search:
+            keyword = search.lower()
+            inventory_data = [
+                item for item in inventory_data
+                if keyword in (item['fish_type_name'] or '').lower() or keyword in (item['status'] or '').lower()
+            ]
+        if status_filter:
+            inventory_data = [item for item in inventory_data if item['status'] == status_filter]
         
         print(f"✅ 재고 조회 완료: {len(inventory_data)}개 반환")
-        return JsonResponse(inventory_data, safe=False)
+        return snapshot_response(request, *json_blob(inventory_data))
     
     def post(self, request):
         """재고 생성"""
@@ -314,6 +302,18 @@ class StockCheckView(View):
         warnings = []
         errors = []
         
+        # 요청 항목 전체의 어종 이름/재고 합계를 한 번에 조회 (캐시 사용 시 사용자 스냅샷)
+        from .services import InventorySnapshotService
+        
+        def to_fish_type_id(value):
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return None
+        
+        requested_ids = {to_fish_type_id(item.get('fish_type_id')) for item in order_items} - {None}
+        snapshot = InventorySnapshotService.stock_levels(request.user_id, requested_ids)
+        
         for item in order_items:
             fish_type_id = item.get('fish_type_id')
             quantity = item.get('quantity', 0)
@@ -323,21 +323,17 @@ class StockCheckView(View):
                 continue
                 
             try:
-                # 단순한 재고수량 조회
-                from django.db.models import Sum
-                
-                # 해당 어종의 재고수량 조회
-                total_stock = Inventory.objects.filter(
-                    fish_type_id=fish_type_id,
-                    **get_user_queryset_filter(request)
-                ).aggregate(total=Sum('stock_quantity'))['total'] or 0
+                fish_type_key = to_fish_type_id(fish_type_id)
+                if fish_type_key not in snapshot['names']:
+                    raise FishType.DoesNotExist
                 
-                # 어종 정보 가져오기
-                fish_type = FishType.objects.get(id=fish_type_id, **get_user_queryset_filter(request))
+                # 해당 어종의 재고수량 / 어종 이름
+                total_stock = snapshot['stock'].get(fish_type_key, 0)
+                fish_name = snapshot['names'][fish_type_key]
                 
                 item_result = {
                     'fish_type_id': fish_type_id,
-                    'fish_name': fish_type.name,
+                    'fish_name': fish_name,
                     'requested_quantity': quantity,
                     'current_stock': total_stock,
                     'unit': unit,
@@ -355,20 +351,20 @@ class StockCheckView(View):
                     total_stock_str = f"{total_stock:g}"
                     shortage_str = f"{shortage:g}"
                     
-                    warning_msg = f"🚨 {fish_type.name}: {quantity_str}{unit} 주문시 남은재고 {total_stock:g}{unit} (부족: {shortage_str}{unit})"
+                    warning_msg = f"🚨 {fish_name}: {quantity_str}{unit} 주문시 남은재고 {total_stock:g}{unit} (부족: {shortage_str}{unit})"
                     warnings.append(warning_msg)
                     errors.append({
-                        'fish_name': fish_type.name,
+                        'fish_name': fish_name,
                         'message': f'🚨 재고 부족! {quantity_str}{unit} 주문시 남은재고 {total_stock:g}{unit}',
                         'shortage': shortage
                     })
                 elif total_stock == 0:
                     item_result['status'] = 'out_of_stock'
                     quantity_str = f"{quantity:g}"
-                    warning_msg = f"❌ {fish_type.name}: {quantity_str}{unit} 주문시 재고 없음 (품절)"
+                    warning_msg = f"❌ {fish_name}: {quantity_str}{unit} 주문시 재고 없음 (품절)"
                     warnings.append(warning_msg)
                     errors.append({
-                        'fish_name': fish_type.name,
+                        'fish_name': fish_name,
                         'message': f'❌ 품절! {quantity_str}{unit} 주문 불가 (재고 없음)',
                         'shortage': quantity
                     })
@@ -376,7 +372,7 @@ class StockCheckView(View):
                     item_result['status'] = 'warning'
                     quantity_str = f"{quantity:g}"
                     remaining_stock = total_stock - quantity
-                    warning_msg = f"⚠️ {fish_type.name}: {quantity_str}{unit} 주문시 남은재고 {remaining_stock:g}{unit} (재고 부족 주의)"
+                    warning_msg = f"⚠️ {fish_name}: {quantity_str}{unit} 주문시 남은재고 {remaining_stock:g}{unit} (재고 부족 주의)"
                     warnings.append(warning_msg)
                 
                 results.append(item_result)
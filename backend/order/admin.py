@@ -12,7 +12,8 @@ class FishTypeAdmin(admin.ModelAdmin):
 class OrderAdmin(admin.ModelAdmin):
     list_display = ['id', 'business_id', 'total_price', 'source_type', 'order_status', 'order_datetime']
     list_filter = ['order_status', 'source_type']
-    search_fields = ['business_id', 'memo']
+    search_fields = ['business__business_name', 'memo']
+    list_select_related = ['business']
     readonly_fields = ['order_datetime']
 
 @admin.register(OrderItem)
@@ -0,0 +1,373 @@
+"""
+주문 일괄 가져오기 (CSV / NDJSON)
+거래처가 보낸 수십~수천 건의 주문을 OrderUploadView 를 한 건씩 호출하지 않고 한 번에 등록합니다.
+- 입력은 줄 단위로 읽어 처리하므로 파일 전체를 메모리에 올리지 않습니다.
+- 거래처/어종은 시작할 때 사용자 기준으로 한 번 읽어 둔 딕셔너리로 검증합니다.
+- 검증을 통과한 주문은 CHUNK_SIZE 건씩 한 트랜잭션에서 Order/OrderItem bulk_create, 재고 주문수량 반영(StockLedger),
+  미수금 원장 일괄 반영으로 저장합니다. 청크 저장이 실패하면 그 청크만 주문 단위로 다시 저장해 실패한 주문을 찾습니다.
+- 입력 행마다 결과(created/failed, 주문 ID, 오류)를 돌려줍니다.
+
+입력 형식 (한 행 = 주문 항목 1개, 같은 order_ref 가 연속된 행은 한 주문)
+    CSV:    order_ref,business_id,fish_type_id,quantity,unit_price,unit,remarks,delivery_datetime,memo,is_urgent
+            (business_id 대신 business_name, fish_type_id 대신 fish_type_name 사용 가능)
+    NDJSON: 위 CSV 한 행과 같은 키를 가진 객체, 또는 주문 한 건 {"business_id": .., "order_items": [{..}, ..], ..}
+"""
+import codecs
+import csv
+import itertools
+import json
+import logging
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from rest_framework import serializers
+
+from .models import Order, OrderItem
+from .services import OrderWriter
+
+logger = logging.getLogger(__name__)
+
+FORMAT_CSV = 'csv'
+FORMAT_NDJSON = 'ndjson'
+FORMATS = (FORMAT_CSV, FORMAT_NDJSON)
+
+ORDER_FIELDS = ('business_id', 'business_name', 'delivery_datetime', 'memo', 'is_urgent', 'total_price')
+TRUE_VALUES = ('1', 'true', 'y', 'yes', 'on', '예', 'o')
+
+
+def get_import_settings():
+    config = getattr(settings, 'ORDER_IMPORT', {})
+    return {
+        'CHUNK_SIZE': config.get('CHUNK_SIZE', 500),
+        'MAX_ROWS': config.get('MAX_ROWS', 50000),
+    }
+
+
+def detect_format(filename='', content_type=''):
+    """파일 이름/Content-Type 으로 형식 추정 (모르면 None)"""
+    filename = (filename or '').lower()
+    content_type = (content_type or '').lower()
+    if filename.endswith('.csv') or 'csv' in content_type:
+        return FORMAT_CSV
+    if filename.endswith(('.ndjson', '.jsonl')) or 'ndjson' in content_type or 'jsonl' in content_type:
+        return FORMAT_NDJSON
+    return None
+
+
+class ParsedOrder:
+    """입력 행들을 묶은 주문 한 건 (검증 결과 포함)"""
+
+    def __init__(self, ref, rows):
+        self.ref = ref
+        self.rows = rows  # 입력 행 번호 목록
+        self.fields = {}
+        self.items = []
+        self.errors = []
+        self.order = None
+
+
+class OrderImporter:
+    """사용자 한 명의 주문 일괄 가져오기"""
+
+    def __init__(self, user_id, chunk_size=None, max_rows=None):
+        config = get_import_settings()
+        self.user_id = user_id
+        self.chunk_size = max(1, chunk_size or config['CHUNK_SIZE'])
+        self.max_rows = max_rows or config['MAX_ROWS']
+        self.results = []
+        self.created_orders = 0
+        self.failed_orders = 0
+        self.truncated = False
+        self._load_master_data()
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    def run(self, lines, fmt):
+        """
+        lines: 바이트 또는 문자열 줄 iterable (업로드 파일, 요청 본문, 열린 파일)
+        결과 보고서 딕셔너리 반환
+        """
+        chunk = []
+        for parsed in self._group_orders(self._read_records(lines, fmt)):
+            self._validate(parsed)
+            if parsed.errors:
+                self._report(parsed)
+                continue
+            chunk.append(parsed)
+            if len(chunk) >= self.chunk_size:
+                self._write_chunk(chunk)
+                chunk = []
+        self._write_chunk(chunk)
+
+        if self.created_orders:
+            from dashboard.services import DashboardStatsService
+            DashboardStatsService.invalidate(self.user_id)
+
+        logger.info(
+            f"주문 일괄 가져오기: 사용자 {self.user_id}, 생성 {self.created_orders}건, 실패 {self.failed_orders}건"
+        )
+        return self.report()
+
+    def report(self):
+        # 검증 실패 행은 바로, 통과한 행은 청크 저장 후 기록되므로 입력 순서로 정렬
+        self.results.sort(key=lambda result: result['row'])
+        return {
+            'summary': {
+                'rows': len(self.results),
+                'orders_created': self.created_orders,
+                'orders_failed': self.failed_orders,
+                'truncated': self.truncated,
+            },
+            'results': self.results,
+        }
+
+    # ------------------------------------------------------------------
+    # 입력 읽기
+    # ------------------------------------------------------------------
+    def _read_records(self, lines, fmt):
+        """(행 번호, 레코드 딕셔너리 또는 오류 문자열) 생성 - 최대 max_rows 행"""
+        lines = self._decode(lines)
+        if fmt == FORMAT_CSV:
+            reader = csv.DictReader(lines)
+            records = ((reader.line_num, row) for row in reader)
+        else:
+            records = self._ndjson_records(lines)
+
+        for count, (row_number, record) in enumerate(records, 1):
+            if count > self.max_rows:
+                self.truncated = True
+                return
+            yield row_number, record
+
+    @staticmethod
+    def _decode(lines):
+        """바이트 줄은 UTF-8 (BOM 허용) 로 디코딩"""
+        lines = iter(lines)
+        first = next(lines, None)
+        if first is None:
+            return
+        if isinstance(first, bytes):
+            yield from codecs.iterdecode(itertools.chain([first], lines), 'utf-8-sig')
+        else:
+            yield first.lstrip('\ufeff')
+            yield from lines
+
+    @staticmethod
+    def _ndjson_records(lines):
+        for row_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield row_number, f'JSON 형식 오류: {e.msg}'
+                continue
+            yield row_number, record if isinstance(record, dict) else 'JSON 객체가 아닙니다'
+
+    @staticmethod
+    def _group_orders(records):
+        """연속된 같은 order_ref 행을 주문 한 건으로 묶음 (order_ref 가 없으면 행마다 한 건)"""
+        current = None
+        seen_refs = set()
+        for row_number, record in records:
+            if isinstance(record, str):
+                if current:
+                    yield current
+                    current = None
+                parsed = ParsedOrder(None, [row_number])
+                parsed.errors.append(record)
+                yield parsed
+                continue
+
+            ref = str(record.get('order_ref') or '').strip() or None
+            if current and ref is not None and ref == current.ref:
+                current.rows.append(row_number)
+                OrderImporter._add_record(current, record, row_number)
+                continue
+
+            if current:
+                yield current
+            current = ParsedOrder(ref, [row_number])
+            if ref is not None and ref in seen_refs:
+                current.errors.append(f'order_ref {ref} 행이 연속되어 있지 않습니다')
+            seen_refs.add(ref)
+            OrderImporter._add_record(current, record, row_number)
+        if current:
+            yield current
+
+    @staticmethod
+    def _add_record(parsed, record, row_number):
+        for field in ORDER_FIELDS:
+            value = record.get(field)
+            if value not in (None, '') and field not in parsed.fields:
+                parsed.fields[field] = value
+        if isinstance(record.get('order_items'), list):
+            parsed.items.extend((row_number, item) for item in record['order_items'])
+        else:
+            parsed.items.append((row_number, record))
+
+    # ------------------------------------------------------------------
+    # 검증
+    # ------------------------------------------------------------------
+    def _load_master_data(self):
+        from business.models import Business
+        from fish_registry.models import FishType
+
+        self.business_ids = set()
+        self.business_by_name = {}
+        for business_id, name in Business.objects.filter(user_id=self.user_id).values_list('id', 'business_name'):
+            self.business_ids.add(business_id)
+            self.business_by_name.setdefault(name.strip(), business_id)
+
+        self.fish_type_units = {}
+        self.fish_type_by_name = {}
+        for fish_type_id, name, unit in FishType.objects.filter(user_id=self.user_id).values_list('id', 'name', 'unit'):
+            self.fish_type_units[fish_type_id] = unit
+            self.fish_type_by_name.setdefault(name.strip(), fish_type_id)
+
+    def _validate(self, parsed):
+        if parsed.errors:
+            return
+        fields = parsed.fields
+
+        business_id = self._lookup(fields.get('business_id'), fields.get('business_name'),
+                                   self.business_ids, self.business_by_name)
+        if business_id is None:
+            parsed.errors.append(
+                f"존재하지 않는 거래처입니다: {fields.get('business_id') or fields.get('business_name') or '(없음)'}"
+            )
+
+        delivery_datetime = None
+        if fields.get('delivery_datetime'):
+            try:
+                delivery_datetime = serializers.DateTimeField().to_internal_value(fields['delivery_datetime'])
+            except serializers.ValidationError:
+                parsed.errors.append(f"납기일 형식이 올바르지 않습니다: {fields['delivery_datetime']}")
+
+        total = Decimal(0)
+        items = []
+        if not parsed.items:
+            parsed.errors.append('주문 항목이 없습니다')
+        for row_number, item in parsed.items:
+            if not isinstance(item, dict):
+                parsed.errors.append(f'{row_number}행: 주문 항목 형식이 올바르지 않습니다')
+                continue
+            fish_type_id = self._lookup(item.get('fish_type_id'), item.get('fish_type_name'),
+                                        self.fish_type_units, self.fish_type_by_name)
+            if fish_type_id is None:
+                parsed.errors.append(
+                    f"{row_number}행: 존재하지 않는 어종입니다: {item.get('fish_type_id') or item.get('fish_type_name') or '(없음)'}"
+                )
+                continue
+            try:
+                quantity = float(item.get('quantity'))
+                if quantity <= 0:
+                    raise ValueError
+            except (TypeError, ValueError):
+                parsed.errors.append(f"{row_number}행: 수량이 올바르지 않습니다: {item.get('quantity')}")
+                continue
+            unit_price = None
+            if item.get('unit_price') not in (None, ''):
+                try:
+                    unit_price = Decimal(str(item['unit_price']))
+                    if not unit_price.is_finite() or unit_price < 0:
+                        raise InvalidOperation
+                except InvalidOperation:
+                    parsed.errors.append(f"{row_number}행: 단가가 올바르지 않습니다: {item.get('unit_price')}")
+                    continue
+                total += unit_price * Decimal(str(quantity))
+            items.append({
+                'fish_type_id': fish_type_id,
+                'quantity': quantity,
+                'unit_price': unit_price,
+                'unit': item.get('unit') or self.fish_type_units[fish_type_id],
+                'remarks': item.get('remarks') or None,
+            })
+
+        total_price = int(total)
+        if fields.get('total_price') not in (None, ''):
+            try:
+                total_price = int(Decimal(str(fields['total_price'])))
+            except (InvalidOperation, ValueError):
+                parsed.errors.append(f"총 주문 금액이 올바르지 않습니다: {fields['total_price']}")
+
+        if parsed.errors:
+            return
+        parsed.fields = {
+            'business_id': business_id,
+            'delivery_datetime': delivery_datetime,
+            'memo': fields.get('memo') or None,
+            'is_urgent': str(fields.get('is_urgent', '')).strip().lower() in TRUE_VALUES,
+            'total_price': total_price,
+            'source_type': 'manual',
+        }
+        parsed.items = items
+
+    @staticmethod
+    def _lookup(raw_id, raw_name, valid_ids, ids_by_name):
+        if raw_id not in (None, ''):
+            try:
+                value = int(raw_id)
+            except (TypeError, ValueError):
+                return None
+            return value if value in valid_ids else None
+        if raw_name not in (None, ''):
+            return ids_by_name.get(str(raw_name).strip())
+        return None
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def _write_chunk(self, chunk):
+        if not chunk:
+            return
+        try:
+            with transaction.atomic():
+                self._bulk_write(chunk)
+        except DatabaseError as e:
+            logger.warning(f"주문 일괄 저장 실패, 주문 단위로 다시 저장: {e}")
+            for parsed in chunk:
+                parsed.order = None
+                try:
+                    with transaction.atomic():
+                        parsed.order = OrderWriter.create_order(
+                            self.user_id, items_data=parsed.items, **parsed.fields
+                        )
+                except DatabaseError as order_error:
+                    parsed.errors.append(f'저장 실패: {order_error}')
+        for parsed in chunk:
+            self._report(parsed)
+
+    def _bulk_write(self, chunk):
+        from inventory.ledger import StockLedger
+        from payment.ledger import ReceivableLedger
+
+        orders = Order.objects.bulk_create([
+            Order(user_id=self.user_id, **parsed.fields) for parsed in chunk
+        ])
+        items = []
+        for parsed, order in zip(chunk, orders):
+            parsed.order = order
+            for item in parsed.items:
+                items.append(OrderItem(order=order, **item))
+        OrderItem.objects.bulk_create(items, batch_size=1000)
+        StockLedger.reserve_items(self.user_id, items)
+        # bulk_create 는 Order post_save 시그널을 보내지 않으므로 미수금 원장을 직접 반영
+        ReceivableLedger.record_new_orders(orders)
+
+    def _report(self, parsed):
+        created = parsed.order is not None and not parsed.errors
+        if created:
+            self.created_orders += 1
+        else:
+            self.failed_orders += 1
+        for row_number in parsed.rows:
+            self.results.append({
+                'row': row_number,
+                'order_ref': parsed.ref,
+                'status': 'created' if created else 'failed',
+                'order_id': parsed.order.id if created else None,
+                'errors': parsed.errors,
+            })
@@ -0,0 +1,56 @@
+"""
+주문 일괄 가져오기 관리 명령어 (CSV / NDJSON)
+
+    python manage.py import_orders orders.csv --user-id 3
+    python manage.py import_orders orders.ndjson --user-id 3 --report report.json
+"""
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from order.bulk_import import OrderImporter, FORMATS, detect_format
+
+
+class Command(BaseCommand):
+    help = 'CSV/NDJSON 파일의 주문을 청크 단위 일괄 저장으로 가져옵니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV 또는 NDJSON 파일 경로')
+        parser.add_argument('--user-id', type=int, required=True, help='주문을 등록할 사용자 ID')
+        parser.add_argument('--format', choices=FORMATS, help='입력 형식 (기본: 파일 확장자로 판단)')
+        parser.add_argument('--chunk-size', type=int, help='한 트랜잭션에 저장할 주문 수 (기본: ORDER_IMPORT["CHUNK_SIZE"])')
+        parser.add_argument('--max-rows', type=int, help='최대 입력 행 수 (기본: ORDER_IMPORT["MAX_ROWS"])')
+        parser.add_argument('--report', help='행별 결과 보고서를 저장할 JSON 파일 경로')
+
+    def handle(self, *args, **options):
+        fmt = options.get('format') or detect_format(options['path'])
+        if fmt is None:
+            raise CommandError('입력 형식을 알 수 없습니다. --format csv|ndjson 을 지정하세요.')
+
+        importer = OrderImporter(
+            options['user_id'], chunk_size=options.get('chunk_size'), max_rows=options.get('max_rows')
+        )
+        started = time.perf_counter()
+        try:
+            with open(options['path'], 'rb') as source:
+                report = importer.run(source, fmt)
+        except OSError as e:
+            raise CommandError(f'파일을 열 수 없습니다: {e}')
+        elapsed = time.perf_counter() - started
+
+        for result in report['results']:
+            if result['status'] == 'failed':
+                self.stdout.write(self.style.WARNING(f"  {result['row']}행: {'; '.join(result['errors'])}"))
+
+        if options.get('report'):
+            with open(options['report'], 'w', encoding='utf-8') as output:
+                json.dump(report, output, ensure_ascii=False, indent=2)
+
+        summary = report['summary']
+        if summary['truncated']:
+            self.stdout.write(self.style.WARNING(f'⚠️ 최대 행 수({importer.max_rows})를 넘어 나머지 행은 가져오지 않았습니다'))
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 주문 가져오기 완료: 입력 {summary['rows']}행, 생성 {summary['orders_created']}건, "
+            f"실패 {summary['orders_failed']}건 ({elapsed:.1f}초)"
+        ))
@@ -0,0 +1,66 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def check_orphaned_business_ids(apps, schema_editor):
+    """
+    거래처가 삭제된 주문(business_id 가 존재하지 않는 거래처를 가리킴)이 있으면 FK 제약조건 추가가 실패하므로
+    추측으로 고치지 않고 해당 주문 목록과 함께 중단합니다. 주문을 다른 거래처로 옮기거나 삭제한 뒤 다시 실행하세요.
+    """
+    Order = apps.get_model('order', 'Order')
+    Business = apps.get_model('business', 'Business')
+
+    orphaned = list(
+        Order.objects.using(schema_editor.connection.alias)
+        .exclude(business_id__in=Business.objects.using(schema_editor.connection.alias).values('id'))
+        .order_by('id')
+        .values_list('id', 'business_id')
+    )
+    if orphaned:
+        preview = ', '.join(f'주문 {order_id} → 거래처 {business_id}' for order_id, business_id in orphaned[:20])
+        more = f' 외 {len(orphaned) - 20}건' if len(orphaned) > 20 else ''
+        raise RuntimeError(
+            f"존재하지 않는 거래처를 가리키는 주문 {len(orphaned)}건이 있어 Order.business FK 를 추가할 수 없습니다: "
+            f"{preview}{more}. 해당 주문의 business_id 를 정리한 뒤 마이그레이션을 다시 실행하세요."
+        )
+
+
+class Migration(migrations.Migration):
+    """
+    Order.business_id (IntegerField) → Order.business (ForeignKey)
+    기존 business_id 컬럼을 그대로 유지하고 FK 제약조건과 인덱스만 추가합니다.
+    FK 를 추가하기 전에 거래처가 없는 주문이 있는지 확인하고, 있으면 주문 목록과 함께 중단합니다.
+    """
+
+    dependencies = [
+        ('business', '0001_initial'),
+        ('order', '0005_documentrequest'),
+    ]
+
+    operations = [
+        # 0. 거래처가 삭제된 주문 확인 (있으면 FK 제약조건 추가 전에 중단)
+        migrations.RunPython(check_orphaned_business_ids, migrations.RunPython.noop),
+        # 1. 컬럼명을 명시해 필드명 변경 시 컬럼이 바뀌지 않도록 함
+        migrations.AlterField(
+            model_name='order',
+            name='business_id',
+            field=models.IntegerField(db_column='business_id', verbose_name='거래처 ID'),
+        ),
+        # 2. 필드명 변경 (컬럼은 business_id 그대로)
+        migrations.RenameField(
+            model_name='order',
+            old_name='business_id',
+            new_name='business',
+        ),
+        # 3. ForeignKey 로 변경 (FK 제약조건 + 인덱스 추가)
+        migrations.AlterField(
+            model_name='order',
+            name='business',
+            field=models.ForeignKey(
+                db_column='business_id',
+                on_delete=django.db.models.deletion.PROTECT,
+                to='business.business',
+                verbose_name='거래처',
+            ),
+        ),
+    ]
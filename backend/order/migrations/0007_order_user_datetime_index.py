@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0006_order_business_foreign_key'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', 'order_datetime'], name='orders_user_datetime_idx'),
+        ),
+    ]
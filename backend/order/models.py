@@ -45,7 +45,12 @@ class Order(models.Model):
         on_delete=models.CASCADE, 
         verbose_name="사용자"
     )
-    business_id = models.IntegerField(verbose_name="거래처 ID")
+    business = models.ForeignKey(
+        'business.Business',
+        on_delete=models.PROTECT,
+        db_column='business_id',
+        verbose_name="거래처"
+    )
 
     total_price = models.IntegerField(default=0, verbose_name="총 주문 금액")
     order_datetime = models.DateTimeField(auto_now_add=True, verbose_name="주문 등록 일시")
@@ -103,17 +108,6 @@ class Order(models.Model):
     has_stock_issues = models.BooleanField(default=False, verbose_name="재고 부족 여부")
     last_updated_at = models.DateTimeField(auto_now=True, verbose_name="최종 수정 일시")
 
-    @property
-    def business(self):
-        """거래처 객체 반환"""
-        if not hasattr(self, '_business_cache'):
-            from business.models import Business
-            try:
-                self._business_cache = Business.objects.get(id=self.business_id)
-            except Business.DoesNotExist:
-                self._business_cache = None
-        return self._business_cache
-    
     @property
     def payment(self):
         """결제 정보 반환 (가장 최근 결제)"""
@@ -130,6 +124,10 @@ class Order(models.Model):
         verbose_name = '주문'
         verbose_name_plural = '주문들'
         ordering = ['-order_datetime']
+        indexes = [
+            # 사용자별 기간 조회 (대시보드 오늘 주문 수, 주문 목록 정렬)
+            models.Index(fields=['user', 'order_datetime'], name='orders_user_datetime_idx'),
+        ]
 
     def __str__(self):
         return f"주문 #{self.id} - 거래처 ID: {self.business_id}"
@@ -3,6 +3,7 @@ import os
 import pytesseract
 from PIL import Image
 from django.conf import settings
+from core.media_cache import MediaResultCache, KIND_OCR
 
 def extract_text_from_image(image_file):
     """
@@ -14,10 +15,19 @@ def extract_text_from_image(image_file):
     Returns:
         str: 이미지에서 추출된 텍스트
     """
-    # 이미지 파일 읽기
+    # 이미지 파일 읽기 (업로드 파일을 먼저 저장한 경우에도 처음부터 읽도록 위치 초기화)
+    if hasattr(image_file, 'seek'):
+        image_file.seek(0)
     image_bytes = image_file.read()
     image = Image.open(io.BytesIO(image_bytes))
     
+    # 같은 이미지(픽셀 기준)를 이미 인식했다면 저장된 결과 반환
+    cache_params = {'engine': 'tesseract', 'lang': 'kor'}
+    content_hash = MediaResultCache.hash_image(image) if MediaResultCache.enabled() else None
+    cached_text = MediaResultCache.get(KIND_OCR, content_hash, cache_params)
+    if cached_text is not None:
+        return cached_text
+    
     # 이 스크립트가 포함된 디렉토리 가져오기
     current_dir = os.path.dirname(os.path.abspath(__file__))
     
@@ -38,4 +48,6 @@ def extract_text_from_image(image_file):
         config=tessdata_dir_config
     )
     
-    return text.strip()
+    text = text.strip()
+    MediaResultCache.set(KIND_OCR, content_hash, cache_params, text)
+    return text
@@ -28,7 +28,7 @@ class OrderSerializer(serializers.ModelSerializer):
         fields = [
             'id',
             'business_id',  # write_only이므로 입력에만 사용
-            'business',     # ForeignKey 관계 출력용
+            'business',     # ForeignKey 관계 출력용 (거래처 ID)
             'user_id',      # user_id 필드 추가
             'total_price',
             'delivery_datetime',
@@ -58,64 +58,61 @@ class OrderSerializer(serializers.ModelSerializer):
             'refund_reason': {'required': False},
             'refund_reason_detail': {'required': False},
             'is_urgent': {'required': False},
-            'last_updated_at': {'required': False}
+            'last_updated_at': {'required': False},
+            'business': {'read_only': True}  # 입력은 business_id 로 받음
         }
 
     def create(self, validated_data):
-        print(f"🏗️ OrderSerializer.create() 호출됨 - 재고수량 차감, 주문수량 증가")
-        print(f"📦 validated_data keys: {list(validated_data.keys())}")
-        
+        """주문 생성 - 항목 일괄 저장과 재고 주문수량 증가를 항목 수와 관계없이 일정한 쿼리 수로 처리"""
+        from .services import OrderWriter
+
         order_items_data = validated_data.pop('order_items')
         business_id = validated_data.pop('business_id')
-        
-        print(f"🏢 추출된 business_id: {business_id}")
-        
-        from inventory.models import Inventory
-        from business.models import User
-        from django.db import transaction
-        from django.db.models import F
-        
-        user = User.objects.get(id=validated_data.get('user_id'))
-        
-        # 트랜잭션으로 주문 생성, 재고수량 차감, 주문수량 증가
-        with transaction.atomic():
-            # 주문 생성
-            order = Order.objects.create(
-                business_id=business_id,
-                **validated_data
-            )
-            
-            print(f"🎯 생성된 주문 ID: {order.id}, user_id: {order.user_id}")
-            print(f"🏪 생성된 주문 거래처: {order.business.business_name}")
-
-            # 주문 항목 생성, 재고수량 차감, 주문수량 증가
-            for item_data in order_items_data:
-                fish_type_id = item_data.pop('fish_type_id')
-                quantity = item_data.get('quantity', 0)
-                
-                # 주문 항목 생성
-                order_item = OrderItem.objects.create(order=order, fish_type_id=fish_type_id, **item_data)
-                
-                # 해당 어종의 첫 번째 재고의 주문수량만 증가 (재고수량은 건드리지 않음)
-                inventory = Inventory.objects.filter(
-                    fish_type_id=fish_type_id,
-                    user=user
-                ).first()
-                
-                if inventory:
-                    old_ordered = inventory.ordered_quantity
-                    
-                    inventory.ordered_quantity = F('ordered_quantity') + quantity
-                    inventory.save()
-                    inventory.refresh_from_db()  # F 표현식 갱신
-                    
-                    print(f"✅ 주문수량 증가: {order_item.fish_type.name} - 주문수량:{old_ordered}→{inventory.ordered_quantity} (+{quantity})")
-                else:
-                    print(f"⚠️ 재고 없음: {order_item.fish_type.name} - 재고 항목이 없어 처리 불가")
+        user_id = validated_data.pop('user_id')
 
+        order = OrderWriter.create_order(user_id, business_id, order_items_data, **validated_data)
         return order
 
 
+def build_order_list_context(orders, request=None):
+    """
+    주문 목록 한 페이지에 필요한 재고/결제 정보를 일괄 조회하여 OrderListSerializer context 로 반환
+    페이지 크기와 관계없이 재고 합계 1회, 결제 1회의 쿼리만 사용합니다.
+
+    Usage:
+        orders = list(orders_page.object_list)
+        serializer = OrderListSerializer(orders, many=True, context=build_order_list_context(orders, request))
+    """
+    from django.db.models import Sum
+    from inventory.models import Inventory
+    from payment.models import Payment
+
+    context = {'request': request}
+
+    # 어종별 재고수량 합계 (요청 사용자 기준)
+    stock_by_fish_type = {}
+    fish_type_ids = {item.fish_type_id for order in orders for item in order.items.all()}
+    user_id = getattr(request, 'user_id', None)
+    if user_id and fish_type_ids:
+        stock_rows = Inventory.objects.filter(
+            user_id=user_id,
+            fish_type_id__in=fish_type_ids
+        ).values('fish_type_id').annotate(total=Sum('stock_quantity'))
+        stock_by_fish_type = {row['fish_type_id']: row['total'] or 0 for row in stock_rows}
+    context['stock_by_fish_type'] = stock_by_fish_type
+
+    # 주문별 가장 최근 결제
+    latest_payment_by_order = {}
+    order_ids = [order.id for order in orders]
+    if order_ids:
+        payments = Payment.objects.filter(order_id__in=order_ids).order_by('order_id', '-created_at')
+        for payment in payments:
+            latest_payment_by_order.setdefault(payment.order_id, payment)
+    context['latest_payment_by_order'] = latest_payment_by_order
+
+    return context
+
+
 class OrderListSerializer(serializers.ModelSerializer):
     business = serializers.SerializerMethodField()
     items_summary = serializers.SerializerMethodField()
@@ -145,6 +142,24 @@ class OrderListSerializer(serializers.ModelSerializer):
                 'phone_number': '연락처 없음'
             }
     
+    def _get_current_stock(self, fish_type_id):
+        """어종 재고수량 합계 - build_order_list_context 로 미리 조회한 값이 있으면 사용"""
+        stock_by_fish_type = self.context.get('stock_by_fish_type')
+        if stock_by_fish_type is not None:
+            return stock_by_fish_type.get(fish_type_id, 0)
+        
+        request = self.context.get('request')
+        if not request or not hasattr(request, 'user_id'):
+            return None
+        
+        from django.db.models import Sum
+        from inventory.models import Inventory
+        
+        return Inventory.objects.filter(
+            fish_type_id=fish_type_id,
+            user_id=request.user_id
+        ).aggregate(total=Sum('stock_quantity'))['total'] or 0
+    
     def get_items_summary(self, obj):
         items = obj.items.all()
         if not items:
@@ -164,29 +179,18 @@ class OrderListSerializer(serializers.ModelSerializer):
             # 재고 부족 경고 표시 (재고수량 기준)
             stock_issue_indicator = ""
             try:
-                from django.db.models import Sum
-                from inventory.models import Inventory
+                current_stock = self._get_current_stock(item.fish_type_id)
                 
-                # 사용자 ID 가져오기 (context에서)
-                request = self.context.get('request')
-                if request and hasattr(request, 'user_id'):
-                    fish_type_obj = item.fish_type
-                    fish_type_id = fish_type_obj.id
-                    
-                    # 해당 어종의 재고수량 조회
-                    current_stock = Inventory.objects.filter(
-                        fish_type_id=fish_type_id,
-                        user_id=request.user_id
-                    ).aggregate(total=Sum('stock_quantity'))['total'] or 0
-                    
-                    # 재고 상태 판정
-                    if current_stock <= 0:
-                        stock_issue_indicator = "🚫"  # 재고 없음 (빨간색)
-                    elif current_stock <= 10:
-                        stock_issue_indicator = "❗"  # 재고 부족 (주황색)
-                    elif current_stock <= 20:
-                        stock_issue_indicator = "⚠️"  # 재고 주의 (노란색)
-                    # 재고가 충분하면 표시 없음
+                # 재고 상태 판정
+                if current_stock is None:
+                    pass  # 사용자 정보가 없으면 표시하지 않음
+                elif current_stock <= 0:
+                    stock_issue_indicator = "🚫"  # 재고 없음 (빨간색)
+                elif current_stock <= 10:
+                    stock_issue_indicator = "❗"  # 재고 부족 (주황색)
+                elif current_stock <= 20:
+                    stock_issue_indicator = "⚠️"  # 재고 주의 (노란색)
+                # 재고가 충분하면 표시 없음
                         
             except Exception as e:
                 print(f"❌ 재고 체크 오류 (어종 {item.fish_type.name}): {e}")
@@ -200,8 +204,12 @@ class OrderListSerializer(serializers.ModelSerializer):
     def get_payment(self, obj):
         """주문의 결제 정보를 반환합니다"""
         try:
-            # 주문과 연결된 가장 최근 결제 정보 조회
-            payment = obj.payment_set.order_by('-created_at').first()
+            # 주문과 연결된 가장 최근 결제 정보 (미리 조회한 값이 있으면 사용)
+            latest_payment_by_order = self.context.get('latest_payment_by_order')
+            if latest_payment_by_order is not None:
+                payment = latest_payment_by_order.get(obj.id)
+            else:
+                payment = obj.payment_set.order_by('-created_at').first()
             if payment:
                 return {
                     'id': payment.id,
@@ -251,28 +259,13 @@ class OrderDetailSerializer(serializers.ModelSerializer):
         ]
     
     def get_business_name(self, obj):
-        from business.models import Business
-        try:
-            business = Business.objects.get(id=obj.business_id)
-            return business.business_name
-        except Business.DoesNotExist:
-            return '거래처명 없음'
+        return obj.business.business_name if obj.business else '거래처명 없음'
     
     def get_business_phone(self, obj):
-        from business.models import Business
-        try:
-            business = Business.objects.get(id=obj.business_id)
-            return business.phone_number
-        except Business.DoesNotExist:
-            return '연락처 없음'
+        return obj.business.phone_number if obj.business else '연락처 없음'
     
     def get_business_address(self, obj):
-        from business.models import Business
-        try:
-            business = Business.objects.get(id=obj.business_id)
-            return business.address
-        except Business.DoesNotExist:
-            return '주소 없음'
+        return obj.business.address if obj.business else '주소 없음'
     
     def get_payment_method(self, obj):
         """결제 수단 반환"""
@@ -329,6 +322,7 @@ class OrderStatusUpdateSerializer(serializers.ModelSerializer):
 class OrderUpdateSerializer(serializers.ModelSerializer):
     """주문 수정을 위한 Serializer"""
     order_items = OrderItemSerializer(many=True)
+    business_id = serializers.IntegerField()
     
     class Meta:
         model = Order
@@ -362,22 +356,12 @@ class OrderUpdateSerializer(serializers.ModelSerializer):
         """주문 정보 및 항목 수정 (재고 연동)"""
         order_items_data = validated_data.pop('order_items', [])
         
-        from inventory.models import Inventory
-        from django.db.models import F
+        from inventory.ledger import StockLedger
         from django.db import transaction
         
         with transaction.atomic():
-            # 1. 기존 주문 항목들의 주문수량 감소 (원복)
-            for existing_item in instance.items.all():
-                inventory = Inventory.objects.filter(
-                    fish_type_id=existing_item.fish_type_id,
-                    user_id=instance.user_id
-                ).first()
-                
-                if inventory:
-                    inventory.ordered_quantity = F('ordered_quantity') - existing_item.quantity
-                    inventory.save()
-                    print(f"🔄 기존 주문수량 감소: {existing_item.fish_type.name} (-{existing_item.quantity})")
+            # 1. 기존 주문 항목 (주문수량 원복용)
+            old_items = list(instance.items.select_related('fish_type'))
             
             # 2. 주문 기본 정보 업데이트
             for attr, value in validated_data.items():
@@ -389,24 +373,16 @@ class OrderUpdateSerializer(serializers.ModelSerializer):
             # 3. 기존 주문 항목 삭제
             instance.items.all().delete()
             
-            # 4. 새로운 주문 항목 생성 및 주문수량 증가
+            # 4. 새로운 주문 항목 생성
+            new_items = []
             for item_data in order_items_data:
                 fish_type_id = item_data.pop('fish_type_id')
-                quantity = item_data.get('quantity', 0)
-                
-                # 주문 항목 생성
-                OrderItem.objects.create(order=instance, fish_type_id=fish_type_id, **item_data)
-                
-                # 주문수량 증가
-                inventory = Inventory.objects.filter(
-                    fish_type_id=fish_type_id,
-                    user_id=instance.user_id
-                ).first()
-                
-                if inventory:
-                    inventory.ordered_quantity = F('ordered_quantity') + quantity
-                    inventory.save()
-                    print(f"✅ 새 주문수량 증가: {inventory.fish_type.name} (+{quantity})")
+                new_items.append(
+                    OrderItem.objects.create(order=instance, fish_type_id=fish_type_id, **item_data)
+                )
+            
+            # 기존 항목 주문수량 감소 + 새 항목 주문수량 증가 (재고 잠금 후 한 번에 반영)
+            StockLedger.replace_items(instance, old_items, new_items)
             
             # 5. 총액 재계산
             total_price = sum(
@@ -0,0 +1,64 @@
+"""
+주문 일괄 생성 서비스
+주문 항목 수와 관계없이 일정한 쿼리 수로 주문을 만듭니다.
+- 어종 검증: id__in 조회 1회
+- 주문 항목: bulk_create 1회
+- 재고 주문수량 증가: StockLedger (재고 잠금 조회 1회 + bulk_update 1회 + 이력 bulk_create)
+bulk_create 는 OrderItem post_save 시그널을 보내지 않으므로 매출 집계는 항목 저장 후 직접 갱신합니다.
+"""
+import logging
+
+from django.db import transaction
+
+from inventory.ledger import StockLedger
+from .models import Order, OrderItem
+
+logger = logging.getLogger(__name__)
+
+
+class OrderWriter:
+    """주문/주문 항목/재고 주문수량을 집합 단위로 기록하는 클래스"""
+
+    @staticmethod
+    def missing_fish_type_ids(fish_type_ids):
+        """존재하지 않는 어종 ID 목록 (입력 순서 유지, 조회 1회)"""
+        from fish_registry.models import FishType
+
+        requested = list(dict.fromkeys(int(fish_type_id) for fish_type_id in fish_type_ids))
+        existing = set(FishType.objects.filter(id__in=requested).values_list('id', flat=True))
+        return [fish_type_id for fish_type_id in requested if fish_type_id not in existing]
+
+    @staticmethod
+    def create_order(user_id, business_id, items_data, **order_fields):
+        """
+        주문 생성 + 항목 일괄 저장 + 재고 주문수량 증가 (한 트랜잭션)
+        items_data: [{'fish_type_id', 'quantity', 'unit_price', 'unit', 'remarks'}, ...]
+        """
+        with transaction.atomic():
+            order = Order.objects.create(user_id=user_id, business_id=business_id, **order_fields)
+
+            items = OrderWriter.create_items(order, items_data)
+
+            applied = StockLedger.reserve(order, items)
+
+            OrderWriter.sync_item_dependents(order)
+
+        logger.info(f"주문 생성: {order.id} - 항목 {len(items)}개, 주문수량 반영 항목 {len(applied)}개")
+        return order
+
+    @staticmethod
+    def create_items(order, items_data):
+        """주문 항목 일괄 저장 (입력 딕셔너리는 변경하지 않음)"""
+        items = [
+            OrderItem(order=order, **item_data)
+            for item_data in items_data
+        ]
+        return OrderItem.objects.bulk_create(items)
+
+    @staticmethod
+    def sync_item_dependents(order):
+        """OrderItem post_save 시그널이 하던 후속 처리 (bulk_create 후 주문당 1회)"""
+        from sales.rollup import SalesRollupService, SALES_ORDER_STATUSES
+
+        if order.order_status in SALES_ORDER_STATUSES:
+            SalesRollupService.sync_order(order.id)
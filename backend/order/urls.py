@@ -4,11 +4,14 @@ from .views import (
     OrderStatusUpdateView, OrderCancelView,
     TranscriptionStatusView, TranscriptionToOrderView,
     CancelOrderView, UpdateOrderView, ShipOutOrderView,
-    DocumentRequestView, DocumentRequestListView
-)   
+    DocumentRequestView, DocumentRequestListView, OrderImportView
+)
+from transcription.views import TranscriptionBatchView, TranscriptionBatchStatusView
 
 urlpatterns = [
     path('upload/', OrderUploadView.as_view(), name='order-upload'),
+    # 주문 일괄 가져오기 (CSV / NDJSON)
+    path('import/', OrderImportView.as_view(), name='order-import'),
     # OCR 이미지 업로드는 upload/에서 source_type=image로 처리
     path('', OrderListView.as_view(), name='order-list'),
     path('<int:order_id>/', OrderDetailView.as_view(), name='order-detail'),
@@ -31,6 +34,8 @@ urlpatterns = [
     path('<int:order_id>/document-requests/', DocumentRequestListView.as_view(), name='document-request-list'),
     
     # STT 관련 API
+    path('transcription/batch/', TranscriptionBatchView.as_view(), name='transcription-batch'),
+    path('transcription/batch/<uuid:batch_id>/', TranscriptionBatchStatusView.as_view(), name='transcription-batch-status'),
     path('transcription/<uuid:transcription_id>/status/', TranscriptionStatusView.as_view(), name='transcription-status'),
     path('transcription/<uuid:transcription_id>/create-order/', TranscriptionToOrderView.as_view(), name='transcription-to-order'),
 ]
@@ -2,7 +2,7 @@
 결제 관리 Django Admin 설정
 """
 from django.contrib import admin
-from .models import Payment, CashReceipt, TaxInvoice
+from .models import Payment, CashReceipt, TaxInvoice, BusinessReceivable
 
 
 @admin.register(Payment)
@@ -47,3 +47,11 @@ class TaxInvoiceAdmin(admin.ModelAdmin):
     list_display = ['id', 'payment', 'is_requested', 'is_issued', 'invoice_number']
     list_filter = ['is_requested', 'is_issued']
     search_fields = ['payment__id', 'invoice_number']
+
+
+@admin.register(BusinessReceivable)
+class BusinessReceivableAdmin(admin.ModelAdmin):
+    list_display = ['business', 'outstanding_balance', 'unpaid_order_count', 'updated_at']
+    search_fields = ['business__business_name']
+    readonly_fields = ['business', 'outstanding_balance', 'unpaid_order_count', 'updated_at']
+    ordering = ['-outstanding_balance']
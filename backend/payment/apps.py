@@ -5,3 +5,7 @@ class PaymentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'payment'
     verbose_name = '결제 관리'
+
+    def ready(self):
+        # 미수금 원장 갱신 시그널 등록
+        import payment.signals
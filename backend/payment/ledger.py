@@ -0,0 +1,191 @@
+"""
+거래처 미수금 원장 서비스
+주문/결제가 바뀔 때 해당 주문의 미수 금액 차이만 BusinessReceivable 에 반영합니다.
+대시보드, 미수금 요약, 거래처 목록은 원장 한 행만 읽으면 됩니다.
+"""
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F, Sum, Count, Exists, OuterRef
+
+from .models import Payment, BusinessReceivable, OrderReceivable
+from order.models import Order
+
+logger = logging.getLogger(__name__)
+
+# 미수금에 포함되는 주문 상태 (취소 제외)
+RECEIVABLE_ORDER_STATUSES = ['placed', 'ready', 'delivered']
+# 미수금에서 제외되는 결제 상태 (결제 완료 및 환불)
+SETTLED_PAYMENT_STATUSES = ['paid', 'refunded']
+
+
+class ReceivableLedger:
+    """미수금 원장 관리 클래스"""
+
+    @staticmethod
+    def receivable_orders():
+        """현재 미수 상태인 주문 쿼리셋 (Business.compute_outstanding_balance 와 동일한 기준)"""
+        settled = Payment.objects.filter(
+            order_id=OuterRef('pk'),
+            payment_status__in=SETTLED_PAYMENT_STATUSES
+        )
+        return Order.objects.filter(
+            order_status__in=RECEIVABLE_ORDER_STATUSES
+        ).exclude(Exists(settled))
+
+    @staticmethod
+    @transaction.atomic
+    def sync_order(order_id):
+        """
+        주문 1건의 현재 미수 금액을 원장에 반영 (멱등)
+        이전에 반영된 금액과의 차액만 거래처 원장에 더합니다.
+        """
+        order = Order.objects.filter(id=order_id).only(
+            'id', 'business_id', 'total_price', 'order_status'
+        ).first()
+        entry = OrderReceivable.objects.select_for_update().filter(order_id=order_id).first()
+
+        is_receivable = (
+            order is not None
+            and order.order_status in RECEIVABLE_ORDER_STATUSES
+            and not Payment.objects.filter(
+                order_id=order_id,
+                payment_status__in=SETTLED_PAYMENT_STATUSES
+            ).exists()
+        )
+
+        if not is_receivable:
+            if entry:
+                ReceivableLedger._adjust(entry.business_id, -entry.amount, -1)
+                entry.delete()
+                logger.info(f"미수금 원장 제외: 주문 {order_id}, 거래처 {entry.business_id}, -{entry.amount}")
+            return
+
+        if entry is None:
+            OrderReceivable.objects.create(
+                order_id=order.id,
+                business_id=order.business_id,
+                amount=order.total_price
+            )
+            ReceivableLedger._adjust(order.business_id, order.total_price, 1)
+            logger.info(f"미수금 원장 반영: 주문 {order_id}, 거래처 {order.business_id}, +{order.total_price}")
+            return
+
+        if entry.business_id != order.business_id:
+            # 주문 수정으로 거래처가 바뀐 경우 이전 거래처에서 빼고 새 거래처에 더함
+            ReceivableLedger._adjust(entry.business_id, -entry.amount, -1)
+            ReceivableLedger._adjust(order.business_id, order.total_price, 1)
+        elif entry.amount != order.total_price:
+            ReceivableLedger._adjust(order.business_id, order.total_price - entry.amount, 0)
+        else:
+            return
+
+        entry.business_id = order.business_id
+        entry.amount = order.total_price
+        entry.save(update_fields=['business_id', 'amount'])
+        logger.info(f"미수금 원장 갱신: 주문 {order_id}, 거래처 {order.business_id}, {order.total_price}")
+
+    @staticmethod
+    @transaction.atomic
+    def record_new_orders(orders):
+        """
+        결제 내역이 없는 새 주문들을 원장에 일괄 반영 (bulk_create 로 만든 주문은 post_save 시그널이 없으므로 직접 호출)
+        주문별 반영 내역은 bulk_create 1회, 거래처 합계는 거래처마다 1회 갱신합니다.
+        """
+        entries = [
+            OrderReceivable(order_id=order.id, business_id=order.business_id, amount=order.total_price)
+            for order in orders
+            if order.order_status in RECEIVABLE_ORDER_STATUSES
+        ]
+        OrderReceivable.objects.bulk_create(entries, batch_size=1000)
+
+        totals = defaultdict(lambda: [0, 0])
+        for entry in entries:
+            totals[entry.business_id][0] += entry.amount
+            totals[entry.business_id][1] += 1
+        for business_id, (amount, count) in totals.items():
+            ReceivableLedger._adjust(business_id, amount, count)
+        if entries:
+            logger.info(f"미수금 원장 일괄 반영: 주문 {len(entries)}건, 거래처 {len(totals)}곳")
+
+    @staticmethod
+    @transaction.atomic
+    def remove_order(order_id):
+        """주문 삭제 시 원장에서 제외 (주문별 반영 내역은 CASCADE 로 함께 삭제됨)"""
+        entry = OrderReceivable.objects.select_for_update().filter(order_id=order_id).first()
+        if entry:
+            ReceivableLedger._adjust(entry.business_id, -entry.amount, -1)
+            entry.delete()
+
+    @staticmethod
+    def _adjust(business_id, amount_delta, count_delta):
+        """거래처 원장에 증감 반영 (행이 없으면 생성)"""
+        updated = BusinessReceivable.objects.filter(business_id=business_id).update(
+            outstanding_balance=F('outstanding_balance') + amount_delta,
+            unpaid_order_count=F('unpaid_order_count') + count_delta
+        )
+        if not updated:
+            receivable, created = BusinessReceivable.objects.get_or_create(business_id=business_id)
+            if not created:
+                # 동시에 다른 트랜잭션이 행을 만든 경우
+                ReceivableLedger._adjust(business_id, amount_delta, count_delta)
+                return
+            receivable.outstanding_balance = amount_delta
+            receivable.unpaid_order_count = count_delta
+            receivable.save(update_fields=['outstanding_balance', 'unpaid_order_count'])
+
+    @staticmethod
+    def compute_balances():
+        """원장 없이 주문/결제 테이블에서 직접 계산한 거래처별 {business_id: (미수금, 건수)}"""
+        rows = ReceivableLedger.receivable_orders().values('business_id').annotate(
+            total=Sum('total_price'),
+            count=Count('id')
+        )
+        return {row['business_id']: (row['total'] or 0, row['count']) for row in rows}
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild():
+        """원장 전체 재구성 - 주문별 반영 내역과 거래처 합계를 다시 계산"""
+        from business.models import Business
+
+        OrderReceivable.objects.all().delete()
+        BusinessReceivable.objects.all().delete()
+
+        entries = [
+            OrderReceivable(order_id=order_id, business_id=business_id, amount=total_price)
+            for order_id, business_id, total_price in ReceivableLedger.receivable_orders().values_list(
+                'id', 'business_id', 'total_price'
+            ).iterator()
+        ]
+        OrderReceivable.objects.bulk_create(entries, batch_size=1000)
+
+        balances = ReceivableLedger.compute_balances()
+        BusinessReceivable.objects.bulk_create([
+            BusinessReceivable(
+                business_id=business_id,
+                outstanding_balance=balances.get(business_id, (0, 0))[0],
+                unpaid_order_count=balances.get(business_id, (0, 0))[1]
+            )
+            for business_id in Business.objects.values_list('id', flat=True).iterator()
+        ], batch_size=1000)
+
+        logger.info(f"미수금 원장 재구성 완료: 주문 {len(entries)}건, 거래처 {len(balances)}곳")
+        return len(entries)
+
+    @staticmethod
+    def verify():
+        """원장과 직접 계산 값 비교 - 불일치 목록 [(business_id, 원장, 계산값)] 반환"""
+        from business.models import Business
+
+        balances = ReceivableLedger.compute_balances()
+        ledger = dict(BusinessReceivable.objects.values_list('business_id', 'outstanding_balance'))
+
+        mismatches = []
+        for business_id in Business.objects.values_list('id', flat=True).iterator():
+            expected = balances.get(business_id, (0, 0))[0]
+            actual = ledger.get(business_id, 0)
+            if expected != actual:
+                mismatches.append((business_id, actual, expected))
+        return mismatches
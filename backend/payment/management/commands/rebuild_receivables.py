@@ -0,0 +1,36 @@
+"""
+거래처 미수금 원장을 주문/결제 테이블에서 다시 계산하는 Django 관리 명령어
+"""
+from django.core.management.base import BaseCommand
+
+from payment.ledger import ReceivableLedger
+
+
+class Command(BaseCommand):
+    help = '거래처 미수금 원장을 재구성하거나 검증합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='재구성하지 않고 원장과 직접 계산 값의 불일치만 확인',
+        )
+
+    def handle(self, *args, **options):
+        if options['verify']:
+            mismatches = ReceivableLedger.verify()
+            if not mismatches:
+                self.stdout.write(self.style.SUCCESS('✅ 미수금 원장이 주문/결제 데이터와 일치합니다.'))
+                return
+
+            for business_id, actual, expected in mismatches:
+                self.stdout.write(
+                    self.style.ERROR(f'❌ 거래처 {business_id}: 원장 {actual:,}원 / 계산 {expected:,}원')
+                )
+            self.stdout.write(self.style.WARNING(
+                f'\n불일치 {len(mismatches)}건 - --verify 없이 실행하면 원장을 재구성합니다.'
+            ))
+            return
+
+        count = ReceivableLedger.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'✅ 미수금 원장 재구성 완료 (미수 주문 {count}건)'))
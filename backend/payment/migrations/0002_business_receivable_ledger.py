@@ -0,0 +1,77 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:26
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_receivables(apps, schema_editor):
+    """기존 주문/결제로 미수금 원장 초기값 채우기"""
+    Business = apps.get_model('business', 'Business')
+    Order = apps.get_model('order', 'Order')
+    Payment = apps.get_model('payment', 'Payment')
+    BusinessReceivable = apps.get_model('payment', 'BusinessReceivable')
+    OrderReceivable = apps.get_model('payment', 'OrderReceivable')
+
+    settled_order_ids = Payment.objects.filter(
+        payment_status__in=['paid', 'refunded']
+    ).values_list('order_id', flat=True)
+    receivable_orders = Order.objects.filter(
+        order_status__in=['placed', 'ready', 'delivered']
+    ).exclude(id__in=settled_order_ids)
+
+    balances = {}
+    entries = []
+    for order_id, business_id, total_price in receivable_orders.values_list('id', 'business_id', 'total_price').iterator():
+        entries.append(OrderReceivable(order_id=order_id, business_id=business_id, amount=total_price))
+        total, count = balances.get(business_id, (0, 0))
+        balances[business_id] = (total + total_price, count + 1)
+    OrderReceivable.objects.bulk_create(entries, batch_size=1000)
+
+    BusinessReceivable.objects.bulk_create([
+        BusinessReceivable(
+            business_id=business_id,
+            outstanding_balance=balances.get(business_id, (0, 0))[0],
+            unpaid_order_count=balances.get(business_id, (0, 0))[1]
+        )
+        for business_id in Business.objects.values_list('id', flat=True).iterator()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0006_order_business_foreign_key'),
+        ('business', '0001_initial'),
+        ('payment', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessReceivable',
+            fields=[
+                ('business', models.OneToOneField(db_column='business_id', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='receivable', serialize=False, to='business.business')),
+                ('outstanding_balance', models.BigIntegerField(default=0, help_text='미수금 합계')),
+                ('unpaid_order_count', models.IntegerField(default=0, help_text='미수 주문 건수')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='최종 갱신 시각')),
+            ],
+            options={
+                'verbose_name': '거래처 미수금',
+                'verbose_name_plural': '거래처 미수금 목록',
+                'db_table': 'business_receivables',
+            },
+        ),
+        migrations.CreateModel(
+            name='OrderReceivable',
+            fields=[
+                ('order', models.OneToOneField(db_column='order_id', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='receivable', serialize=False, to='order.order')),
+                ('amount', models.IntegerField(default=0, help_text='원장에 반영된 미수 금액')),
+                ('business', models.ForeignKey(db_column='business_id', on_delete=django.db.models.deletion.CASCADE, to='business.business')),
+            ],
+            options={
+                'verbose_name': '주문 미수금',
+                'verbose_name_plural': '주문 미수금 목록',
+                'db_table': 'order_receivables',
+            },
+        ),
+        migrations.RunPython(backfill_receivables, migrations.RunPython.noop),
+    ]
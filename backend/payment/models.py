@@ -108,3 +108,48 @@ class TaxInvoice(models.Model):
     
     def __str__(self):
         return f"세금계산서 {self.id} - 결제 {self.payment.id} ({'발급됨' if self.is_issued else '미발급'})"
+
+
+class BusinessReceivable(models.Model):
+    """거래처별 미수금 원장 (주문/결제 변경 시 증분 갱신)"""
+    
+    business = models.OneToOneField(
+        'business.Business',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='receivable',
+        db_column='business_id'
+    )
+    outstanding_balance = models.BigIntegerField(default=0, help_text="미수금 합계")
+    unpaid_order_count = models.IntegerField(default=0, help_text="미수 주문 건수")
+    updated_at = models.DateTimeField(auto_now=True, help_text="최종 갱신 시각")
+    
+    class Meta:
+        db_table = 'business_receivables'
+        verbose_name = '거래처 미수금'
+        verbose_name_plural = '거래처 미수금 목록'
+    
+    def __str__(self):
+        return f"거래처 {self.business_id} 미수금 {self.outstanding_balance:,}원 ({self.unpaid_order_count}건)"
+
+
+class OrderReceivable(models.Model):
+    """주문별 미수금 반영 내역 - 원장에 반영된 금액을 기록해 변경 시 차액만 갱신"""
+    
+    order = models.OneToOneField(
+        'order.Order',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='receivable',
+        db_column='order_id'
+    )
+    business = models.ForeignKey('business.Business', on_delete=models.CASCADE, db_column='business_id')
+    amount = models.IntegerField(default=0, help_text="원장에 반영된 미수 금액")
+    
+    class Meta:
+        db_table = 'order_receivables'
+        verbose_name = '주문 미수금'
+        verbose_name_plural = '주문 미수금 목록'
+    
+    def __str__(self):
+        return f"주문 {self.order_id} 미수금 {self.amount:,}원"
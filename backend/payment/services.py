@@ -10,6 +10,7 @@ from django.db import transaction
 from rest_framework import status
 from rest_framework.response import Response
 from .models import Payment
+from .ledger import ReceivableLedger
 from order.models import Order
 
 logger = logging.getLogger(__name__)
@@ -36,6 +37,8 @@ class PaymentService:
             Order.objects.filter(id=order_id).update(
                 order_status='ready'  # order_status 필드명 사용
             )
+            # update()는 시그널을 보내지 않으므로 미수금 원장을 직접 갱신
+            ReceivableLedger.sync_order(order_id)
             logger.info(f"주문 {order_id} 상태를 'ready'로 변경했습니다.")
         except Exception as e:
             logger.error(f"주문 상태 변경 실패 (주문 {order_id}): {e}")
@@ -369,41 +372,19 @@ class PaymentService:
     def restore_stock_on_cancel(order):
         """주문 취소/환불시 주문수량만 감소 (재고수량은 건드리지 않음)"""
         try:
-            from inventory.models import Inventory
-            from django.db.models import F
+            from inventory.ledger import StockLedger
             
             logger.info(f"주문 취소에 따른 주문수량 감소 시작: 주문 {order.id}")
             
-            # 주문 항목별로 주문수량만 감소
-            order_items = order.items.all()
-            restored_items = []
-            
-            for item in order_items:
-                quantity = item.quantity
-                fish_type_id = item.fish_type_id
-                
-                # 해당 어종의 첫 번째 재고의 주문수량만 감소 (재고수량은 건드리지 않음)
-                inventory = Inventory.objects.filter(
-                    fish_type_id=fish_type_id,
-                    user_id=order.user_id
-                ).first()
-                
-                if inventory:
-                    old_ordered = inventory.ordered_quantity
-                    
-                    inventory.ordered_quantity = F('ordered_quantity') - quantity
-                    inventory.save()
-                    inventory.refresh_from_db()  # F 표현식 갱신
-                    
-                    restored_items.append({
-                        'fish_type': item.fish_type.name,
-                        'quantity': quantity,
-                        'unit': item.unit
-                    })
-                    
-                    logger.info(f"주문수량 감소: {item.fish_type.name} - 주문수량:{old_ordered}→{inventory.ordered_quantity} (-{quantity})")
-                else:
-                    logger.warning(f"주문수량 감소 실패: {item.fish_type.name} - 재고 없음")
+            # 주문 항목별로 주문수량만 감소 (재고 잠금 후 한 번에 반영)
+            restored_items = [
+                {
+                    'fish_type': movement.fish_name,
+                    'quantity': -movement.ordered_change,
+                    'unit': movement.unit
+                }
+                for movement in StockLedger.release(order)
+            ]
             
             logger.info(f"주문수량 감소 완료: 주문 {order.id}, 처리 항목 {len(restored_items)}개")
             
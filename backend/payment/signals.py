@@ -0,0 +1,33 @@
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+import logging
+
+from order.models import Order
+from .models import Payment
+from .ledger import ReceivableLedger
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Order)
+def sync_receivable_on_order_save(sender, instance, **kwargs):
+    """주문 생성/수정/상태 변경 시 미수금 원장 갱신 (주문 저장과 같은 트랜잭션)"""
+    ReceivableLedger.sync_order(instance.id)
+
+
+@receiver(pre_delete, sender=Order)
+def remove_receivable_on_order_delete(sender, instance, **kwargs):
+    """주문 삭제 전 미수금 원장에서 제외"""
+    ReceivableLedger.remove_order(instance.id)
+
+
+@receiver(post_save, sender=Payment)
+def sync_receivable_on_payment_save(sender, instance, **kwargs):
+    """결제 완료/환불 시 미수금 원장 갱신"""
+    ReceivableLedger.sync_order(instance.order_id)
+
+
+@receiver(post_delete, sender=Payment)
+def sync_receivable_on_payment_delete(sender, instance, **kwargs):
+    """결제 삭제 시 해당 주문을 다시 미수로 반영"""
+    ReceivableLedger.sync_order(instance.order_id)
@@ -1,7 +1,6 @@
 import logging
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
-from django.db.models import Sum, Count
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -11,7 +10,7 @@ from core.middleware import UserValidationMixin, get_user_queryset_filter
 from .serializers import TossConfirmSerializer, MarkPaidSerializer, RefundSerializer, CancelOrderSerializer
 from .services import PaymentService, PaymentError
 from order.models import Order
-from payment.models import Payment  # 결제 모델
+from payment.models import Payment, BusinessReceivable  # 결제 모델, 미수금 원장
 
 logger = logging.getLogger(__name__)
 
@@ -297,35 +296,22 @@ class ARSummaryView(UserValidationMixin, APIView):
     def get(self, request):
         try:
             user_filter = get_user_queryset_filter(request)
-            from business.models import Business
 
+            # 미수금 원장에서 바로 조회 (주문/결제 테이블 집계 없음)
             summary_data = (
-                Order.objects
-                .filter(**user_filter)
-                .exclude(payment__payment_status="paid")
-                .values("business_id")
-                .annotate(
-                    unpaidTotal=Sum("total_price"),
-                    unpaidOrders=Count("id")
-                )
-                .order_by("-unpaidTotal")
+                BusinessReceivable.objects
+                .filter(business__user_id=user_filter['user_id'], unpaid_order_count__gt=0)
+                .values("business_id", "business__business_name", "outstanding_balance", "unpaid_order_count")
+                .order_by("-outstanding_balance")
             )
 
             summary_list = []
             for item in summary_data:
-                business_id = item["business_id"]
-                business_name = "알 수 없는 거래처"
-                if business_id:
-                    try:
-                        business = Business.objects.get(id=business_id)
-                        business_name = business.business_name
-                    except Business.DoesNotExist:
-                        pass
                 summary_list.append({
-                    "businessId": business_id,
-                    "businessName": business_name,
-                    "unpaidTotal": item["unpaidTotal"] or 0,
-                    "unpaidOrders": item["unpaidOrders"] or 0
+                    "businessId": item["business_id"],
+                    "businessName": item["business__business_name"] or "알 수 없는 거래처",
+                    "unpaidTotal": item["outstanding_balance"] or 0,
+                    "unpaidOrders": item["unpaid_order_count"]
                 })
 
             return Response(summary_list)
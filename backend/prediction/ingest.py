@@ -0,0 +1,261 @@
+"""
+aT 경매 데이터 수집 엔진 (populate_auction_data 4단계)
+날짜 × 어종 코드마다 순차로 API 를 호출하고 항목마다 마스터 데이터를 조회해 한 건씩 저장하던 방식을
+- 연결 풀을 쓰는 requests.Session 하나로 여러 페이지를 스레드 풀에서 동시에 가져오고 (초당 요청 수 제한 + 재시도)
+- 도매시장/어종/공통 코드는 시작할 때 한 번 읽어 둔 딕셔너리에서 찾고
+- ActualAuctionPrice 는 batch_size 단위 bulk_create(ignore_conflicts=True) 로 저장하는 방식으로 바꿨습니다.
+DB 쓰기는 호출한 스레드에서만 수행하고, 작업 스레드는 HTTP 요청과 JSON 파싱만 합니다.
+"""
+import datetime
+import logging
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from prediction.models import ActualAuctionPrice, CommonCode, FishSpecies, WholesaleMarket
+
+logger = logging.getLogger(__name__)
+
+AT_MARKET_PRICE_URL = "http://apis.data.go.kr/B552845/KatRealTime/trades"
+
+DEFAULT_INGEST_CONFIG = {
+    'WORKERS': 8,  # 동시 HTTP 요청 수 (연결 풀 크기)
+    'RATE_PER_SECOND': 10.0,  # 초당 최대 요청 수 (0: 제한 없음)
+    'RETRIES': 3,  # 연결 오류/429/5xx 재시도 횟수
+    'BACKOFF_SECONDS': 0.5,  # 재시도 간격 (0.5, 1, 2초 ...)
+    'TIMEOUT_SECONDS': 15,
+    'PAGE_SIZE': 1000,
+    'BATCH_SIZE': 1000,  # bulk_create 1회 저장 건수
+}
+
+
+def get_ingest_settings():
+    """AUCTION_INGEST 설정 (기본값 포함)"""
+    return {**DEFAULT_INGEST_CONFIG, **getattr(settings, 'AUCTION_INGEST', {})}
+
+
+def build_session(pool_size, retries, backoff_seconds):
+    """연결 풀 + 재시도(GET, 429/5xx, Retry-After 준수)가 설정된 requests 세션"""
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_seconds,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class RateLimiter:
+    """초당 요청 수 제한 (여러 스레드가 공유, 요청 시작 시각을 일정 간격으로 배치)"""
+
+    def __init__(self, rate_per_second):
+        self.interval = 1.0 / rate_per_second if rate_per_second and rate_per_second > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
+class MasterDataIndex:
+    """경매 항목의 코드 → 마스터 데이터 조회용 메모리 인덱스 (수집 시작 시 한 번 로드)"""
+
+    def __init__(self):
+        self.markets = {market.market_api_code: market for market in WholesaleMarket.objects.all()}
+        self.species = {species.item_small_category_code: species for species in FishSpecies.objects.all()}
+        self.codes = {
+            (code.code_type, code.code_value): code
+            for code in CommonCode.objects.filter(code_type__in=['PLOR', 'PKG', 'UNIT', 'GRD'])
+        }
+
+    def code(self, code_type, value):
+        return self.codes.get((code_type, value))
+
+
+class IngestStats:
+    def __init__(self):
+        self.pages = 0
+        self.items = 0
+        self.created = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self.errors = []
+
+
+class AuctionIngestEngine:
+    """기간 × 어종 코드의 aT 경매 데이터를 동시에 가져와 일괄 저장하는 수집 엔진"""
+
+    def __init__(self, api_key, url=AT_MARKET_PRICE_URL, workers=None, rate_per_second=None,
+                 retries=None, backoff_seconds=None, timeout=None, page_size=None, batch_size=None,
+                 session=None):
+        config = get_ingest_settings()
+        self.api_key = api_key
+        self.url = url
+        self.workers = max(1, workers or config['WORKERS'])
+        self.timeout = timeout or config['TIMEOUT_SECONDS']
+        self.page_size = page_size or config['PAGE_SIZE']
+        self.batch_size = batch_size or config['BATCH_SIZE']
+        self.rate_limiter = RateLimiter(config['RATE_PER_SECOND'] if rate_per_second is None else rate_per_second)
+        self.session = session or build_session(
+            self.workers,
+            config['RETRIES'] if retries is None else retries,
+            config['BACKOFF_SECONDS'] if backoff_seconds is None else backoff_seconds,
+        )
+
+    # ------------------------------------------------------------------
+    # 수집
+    # ------------------------------------------------------------------
+    def run(self, start_date, end_date, fish_codes, on_day_complete=None):
+        """
+        start_date ~ end_date 의 어종 코드별 경매 데이터를 수집해 저장하고 IngestStats 반환
+        on_day_complete(date, fish_code, stats) 는 (날짜, 어종 코드) 의 모든 페이지를 처리할 때마다 호출됩니다.
+        """
+        stats = IngestStats()
+        master = MasterDataIndex()
+        buffer = []
+        pending_pages = {}
+
+        tasks = []
+        current_date = start_date
+        while current_date <= end_date:
+            for fish_code in fish_codes:
+                tasks.append((current_date, fish_code, 1))
+            current_date += datetime.timedelta(days=1)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='auction-ingest') as executor:
+            futures = {}
+            for task in tasks:
+                futures[executor.submit(self.fetch_page, *task)] = task
+                pending_pages[task[:2]] = 1
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    date_to_fetch, fish_code, page = futures.pop(future)
+                    key = (date_to_fetch, fish_code)
+                    pending_pages[key] -= 1
+                    stats.pages += 1
+                    try:
+                        items, total_count = future.result()
+                    except (requests.exceptions.RequestException, ValueError) as e:
+                        stats.errors.append(f"{date_to_fetch} {fish_code} p{page}: {e}")
+                        logger.warning(f"⚠️ 경매 데이터 API 호출 오류: {date_to_fetch} {fish_code} p{page} - {e}")
+                        items, total_count = [], 0
+
+                    # 첫 페이지의 전체 건수를 보고 나머지 페이지를 동시에 요청
+                    if page == 1 and total_count > self.page_size:
+                        for next_page in range(2, math.ceil(total_count / self.page_size) + 1):
+                            futures[executor.submit(self.fetch_page, date_to_fetch, fish_code, next_page)] = (
+                                date_to_fetch, fish_code, next_page
+                            )
+                            pending_pages[key] += 1
+
+                    stats.items += len(items)
+                    buffer.extend(self.build_rows(date_to_fetch, items, master, stats))
+                    if len(buffer) >= self.batch_size:
+                        self._flush(buffer, stats)
+                        buffer = []
+
+                    if pending_pages[key] == 0 and on_day_complete:
+                        on_day_complete(date_to_fetch, fish_code, stats)
+
+        self._flush(buffer, stats)
+        return stats
+
+    def fetch_page(self, date_to_fetch, fish_code, page):
+        """한 페이지 요청 - (항목 목록, 전체 건수) 반환"""
+        params = {
+            'serviceKey': self.api_key,
+            'pageNo': page,
+            'numOfRows': self.page_size,
+            'dataType': 'JSON',
+            'trd_dd': date_to_fetch.strftime('%Y-%m-%d'),
+            'gds_sclsf_cd': fish_code,
+        }
+        self.rate_limiter.wait()
+        response = self.session.get(self.url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        body = response.json().get('response', {}).get('body', {}) or {}
+
+        items = (body.get('items') or {})
+        items = items.get('item', []) if isinstance(items, dict) else []
+        if isinstance(items, dict):  # 결과가 한 건이면 목록 대신 객체로 옴
+            items = [items]
+        try:
+            total_count = int(body.get('totalCount') or 0)
+        except (TypeError, ValueError):
+            total_count = 0
+        return items, total_count
+
+    # ------------------------------------------------------------------
+    # 변환/저장
+    # ------------------------------------------------------------------
+    @staticmethod
+    def build_rows(date_to_fetch, items, master, stats):
+        """API 항목 → ActualAuctionPrice (마스터 데이터가 없거나 파싱할 수 없는 항목은 건너뜀)"""
+        date_str = date_to_fetch.strftime('%Y-%m-%d')
+        rows = []
+        for item in items:
+            try:
+                market = master.markets.get(item.get('marketCode', ''))
+                fish_species = master.species.get(item.get('itemCode', ''))
+                origin_place = master.code('PLOR', item.get('originPlaceCode', 'BUSAN'))
+                package = master.code('PKG', item.get('packageCode', 'FRESH'))
+                unit = master.code('UNIT', item.get('unitCode', 'KG'))
+                if not (market and fish_species and origin_place and package and unit):
+                    stats.skipped += 1
+                    continue
+                grade = master.code('GRD', item.get('gradeCode')) if item.get('gradeCode') else None
+
+                rows.append(ActualAuctionPrice(
+                    auction_sequence_id=item.get('auctionSequenceId', f"AUCTION_{date_str}_{item.get('marketCode')}_{item.get('itemCode')}"),
+                    trade_date=date_to_fetch,
+                    trade_timestamp=datetime.datetime.strptime(item.get('tradeTime'), '%Y-%m-%d %H:%M:%S') if item.get('tradeTime') else None,
+                    market=market,
+                    fish_species=fish_species,
+                    origin_place_code=origin_place,
+                    package_code=package,
+                    unit_code=unit,
+                    grade_code=grade,
+                    trade_volume=float(item.get('tradeVolume', 0)),
+                    auction_price=float(item.get('auctionPrice', 0)),
+                    unit_weight_kg=float(item.get('unitWeight', 1.0))
+                ))
+            except (ValueError, KeyError, TypeError) as e:
+                stats.skipped += 1
+                logger.warning(f"⚠️ 경매 데이터 파싱 오류: {e}")
+        return rows
+
+    def _flush(self, rows, stats):
+        """배치 저장 - 이미 저장된 경매 일련번호는 미리 걸러 신규 건수를 세고, 동시 수집과의 충돌은 ignore_conflicts 로 무시"""
+        if not rows:
+            return
+        unique_rows = {}
+        for row in rows:
+            unique_rows.setdefault(row.auction_sequence_id, row)
+        existing = set(
+            ActualAuctionPrice.objects.filter(auction_sequence_id__in=list(unique_rows))
+            .values_list('auction_sequence_id', flat=True)
+        )
+        new_rows = [row for sequence_id, row in unique_rows.items() if sequence_id not in existing]
+        ActualAuctionPrice.objects.bulk_create(new_rows, batch_size=self.batch_size, ignore_conflicts=True)
+        stats.created += len(new_rows)
+        stats.duplicates += len(rows) - len(new_rows)
@@ -2,12 +2,14 @@
 
 import requests
 import datetime
+import time
 import xml.etree.ElementTree as ET
 from dateutil.relativedelta import relativedelta
 from django.core.management.base import BaseCommand, CommandParser
 from django.conf import settings
 from django.db import transaction
-from prediction.models import WholesaleMarket, FishSpecies, CommonCode, ActualAuctionPrice, ActualCatchVolume, ExternalEnvironmentalData
+from prediction.models import WholesaleMarket, FishSpecies, CommonCode, ActualCatchVolume, ExternalEnvironmentalData
+from prediction.ingest import AuctionIngestEngine
 
 # --- 설정 값 ---
 
@@ -49,6 +51,8 @@ class Command(BaseCommand):
     def add_arguments(self, parser: CommandParser):
         parser.add_argument('--start', type=str, help='데이터 수집 시작일 (YYYY-MM-DD 형식)')
         parser.add_argument('--end', type=str, help='데이터 수집 종료일 (YYYY-MM-DD 형식)')
+        parser.add_argument('--workers', type=int, help='경매 데이터 동시 요청 수 (기본: AUCTION_INGEST["WORKERS"])')
+        parser.add_argument('--rate', type=float, help='경매 데이터 초당 최대 요청 수 (기본: AUCTION_INGEST["RATE_PER_SECOND"], 0: 제한 없음)')
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -104,10 +108,7 @@ class Command(BaseCommand):
         # 4. 기존 API 데이터 수집 (API 키가 있을 때만)
         if self.at_api_key:
             self.stdout.write(self.style.SUCCESS(f"=== 4. 기존 API 데이터 수집 시작 ==="))
-            current_date = start_date
-            while current_date <= end_date:
-                self.fetch_daily_auction_data(current_date)
-                current_date += datetime.timedelta(days=1)
+            self.fetch_auction_data(start_date, end_date, workers=options.get('workers'), rate=options.get('rate'))
         else:
             self.stdout.write(self.style.WARNING("=== 4. DATA_GO_KR_API_KEY가 없어 기존 API 데이터를 수집하지 않습니다. ==="))
 
@@ -334,114 +335,27 @@ class Command(BaseCommand):
         
         self.stdout.write(self.style.SUCCESS("  -> 마스터 데이터 업데이트 완료"))
 
+    def fetch_auction_data(self, start_date, end_date, workers=None, rate=None):
+        """기간 전체의 경매 데이터를 동시에 가져와 일괄 저장합니다 (AuctionIngestEngine)."""
+        engine = AuctionIngestEngine(self.at_api_key, url=AT_MARKET_PRICE_URL, workers=workers, rate_per_second=rate)
+        started = time.perf_counter()
+
+        def report(date_to_fetch, fish_code, stats):
+            self.stdout.write(f"    -> {date_to_fetch.strftime('%Y-%m-%d')} {fish_code} 수집 완료 (누적 {stats.items}건)")
+
+        stats = engine.run(start_date, end_date, TARGET_FISH_CODES_AT, on_day_complete=report)
+
+        for error in stats.errors:
+            self.stdout.write(self.style.ERROR(f"    -> API 호출 오류: {error}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"  -> 경매 데이터 수집 완료: 페이지 {stats.pages}개, 항목 {stats.items}건, 신규 저장 {stats.created}건, "
+            f"중복 {stats.duplicates}건, 건너뜀 {stats.skipped}건 ({time.perf_counter() - started:.1f}초, 동시 요청 {engine.workers}개)"
+        ))
+        return stats
+
     def fetch_daily_auction_data(self, date_to_fetch):
         """하루치 경매 데이터를 가져와 DB에 저장합니다."""
-        date_str = date_to_fetch.strftime('%Y-%m-%d')
-        self.stdout.write(f"  -> {date_str} 데이터 수집 중...")
-
-        # ⭐️ API 기본 URL과 엔드포인트를 정확한 것으로 수정 ⭐️
-        base_url = "http://apis.data.go.kr/B552845/KatRealTime"
-        endpoint = "/trades"
-        
-        for fish_code in TARGET_FISH_CODES_AT:
-            # ⭐️ 날짜 파라미터 이름을 'baseDate'에서 'trd_dd'로 수정 ⭐️
-            params = {
-                'serviceKey': self.at_api_key,
-                'pageNo': 1,
-                'numOfRows': 1000,
-                'dataType': 'JSON',
-                'trd_dd': date_str,  # <-- 'baseDate'가 아니라 'trd_dd'가 올바른 파라미터명입니다.
-                'gds_sclsf_cd': fish_code
-            }
-            
-            try:
-                # ⭐️ API 호출 부분을 수정한 URL로 변경 ⭐️
-                response = requests.get(f"{base_url}{endpoint}", params=params, timeout=15)
-                response.raise_for_status()
-                data = response.json()
-                
-                # 응답 데이터 확인
-                items = data.get('response', {}).get('body', {}).get('items', {}).get('item', [])
-                if not items:
-                    self.stdout.write(self.style.WARNING(f"    -> {date_str} {fish_code} 경매 데이터가 없습니다."))
-                    continue
-                
-                # 데이터 처리 및 저장
-                processed_count = 0
-                for item in items:
-                    try:
-                        # 도매시장 찾기
-                        market = WholesaleMarket.objects.filter(
-                            market_api_code=item.get('marketCode', '')
-                        ).first()
-                        if not market:
-                            continue
-                        
-                        # 어종 찾기
-                        fish_species = FishSpecies.objects.filter(
-                            item_small_category_code=item.get('itemCode', '')
-                        ).first()
-                        if not fish_species:
-                            continue
-                        
-                        # 공통 코드들 찾기
-                        origin_place = CommonCode.objects.filter(
-                            code_type='PLOR',
-                            code_value=item.get('originPlaceCode', 'BUSAN')
-                        ).first()
-                        
-                        package = CommonCode.objects.filter(
-                            code_type='PKG',
-                            code_value=item.get('packageCode', 'FRESH')
-                        ).first()
-                        
-                        unit = CommonCode.objects.filter(
-                            code_type='UNIT',
-                            code_value=item.get('unitCode', 'KG')
-                        ).first()
-                        
-                        grade = None
-                        if item.get('gradeCode'):
-                            grade = CommonCode.objects.filter(
-                                code_type='GRD',
-                                code_value=item.get('gradeCode')
-                            ).first()
-                        
-                        # 경매 데이터 생성
-                        auction_data = ActualAuctionPrice(
-                            auction_sequence_id=item.get('auctionSequenceId', f"AUCTION_{date_str}_{item.get('marketCode')}_{item.get('itemCode')}"),
-                            trade_date=date_to_fetch,
-                            trade_timestamp=datetime.datetime.strptime(item.get('tradeTime', f"{date_str} 00:00:00"), '%Y-%m-%d %H:%M:%S') if item.get('tradeTime') else None,
-                            market=market,
-                            fish_species=fish_species,
-                            origin_place_code=origin_place,
-                            package_code=package,
-                            unit_code=unit,
-                            grade_code=grade,
-                            trade_volume=float(item.get('tradeVolume', 0)),
-                            auction_price=float(item.get('auctionPrice', 0)),
-                            unit_weight_kg=float(item.get('unitWeight', 1.0))
-                        )
-                        auction_data.save()
-                        processed_count += 1
-                        
-                    except (ValueError, KeyError, TypeError) as e:
-                        self.stdout.write(self.style.WARNING(f"    -> 데이터 파싱 오류: {e}"))
-                        continue
-                
-                self.stdout.write(self.style.SUCCESS(f"    -> {date_str} {fish_code} 경매 데이터 수집 완료 ({processed_count}건)"))
-                
-            except requests.exceptions.RequestException as e:
-                self.stdout.write(self.style.ERROR(f"    -> {date_str} {fish_code} API 호출 오류: {e}"))
-                # API 응답 내용 확인
-                if hasattr(e, 'response') and e.response is not None:
-                    try:
-                        error_data = e.response.json()
-                        self.stdout.write(self.style.ERROR(f"    -> API 응답: {error_data}"))
-                    except:
-                        self.stdout.write(self.style.ERROR(f"    -> API 응답 텍스트: {e.response.text}"))
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"    -> {date_str} {fish_code} 경매 데이터 수집 오류: {e}"))
+        return self.fetch_auction_data(date_to_fetch, date_to_fetch)
 
     def fetch_kosis_catch_data(self, start_date, end_date):
         """KOSIS 통계 API를 통해 월별 어획량 데이터를 수집합니다."""
@@ -3,4 +3,8 @@ from django.apps import AppConfig
 
 class SalesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'sales'
\ No newline at end of file
+    name = 'sales'
+
+    def ready(self):
+        # 매출 집계 갱신 시그널 등록
+        import sales.signals
@@ -0,0 +1 @@
+# Django management module
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+매출 집계 테이블(일/월/어종별)을 주문 데이터로 다시 채우는 Django 관리 명령어
+초기값은 sales 0001 마이그레이션이 채우므로, 집계가 주문 데이터와 어긋났을 때 바로잡는 용도입니다.
+"""
+from django.core.management.base import BaseCommand
+
+from sales.rollup import SalesRollupService
+
+
+class Command(BaseCommand):
+    help = '납품 완료 주문으로 매출 집계 테이블을 재구성합니다 (집계 불일치 복구용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            help='특정 사용자의 집계만 재구성 (기본: 전체)',
+        )
+
+    def handle(self, *args, **options):
+        user_id = options.get('user')
+        target = f'사용자 {user_id}' if user_id else '전체 사용자'
+        self.stdout.write(f'📊 매출 집계 재구성 시작 ({target})...')
+
+        count = SalesRollupService.rebuild(user_id=user_id)
+
+        self.stdout.write(self.style.SUCCESS(f'✅ 매출 집계 재구성 완료: 주문 {count}건 반영'))
@@ -0,0 +1,156 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:31
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F, Sum, FloatField
+from django.utils import timezone
+import django.db.models.deletion
+
+
+def backfill_sales_rollups(apps, schema_editor):
+    """기존 납품 완료 주문으로 매출 집계 초기값 채우기 (SalesRollupService.rebuild 와 같은 집계)"""
+    Order = apps.get_model('order', 'Order')
+    OrderItem = apps.get_model('order', 'OrderItem')
+    OrderSalesEntry = apps.get_model('sales', 'OrderSalesEntry')
+    DailySales = apps.get_model('sales', 'DailySales')
+    MonthlySales = apps.get_model('sales', 'MonthlySales')
+    DailyFishSales = apps.get_model('sales', 'DailyFishSales')
+
+    orders = Order.objects.filter(order_status__in=['delivered', 'completed'])
+
+    fish_by_order = defaultdict(dict)
+    item_rows = OrderItem.objects.filter(order__in=orders).values('order_id', 'fish_type_id').annotate(
+        total_quantity=Sum('quantity'),
+        total_revenue=Sum(F('quantity') * F('unit_price'), output_field=FloatField())
+    )
+    for row in item_rows.iterator():
+        fish_by_order[row['order_id']][str(row['fish_type_id'])] = [
+            float(row['total_quantity'] or 0), float(row['total_revenue'] or 0)
+        ]
+
+    entries = []
+    daily = defaultdict(lambda: [0, 0])
+    monthly = defaultdict(lambda: [0, 0])
+    fish = defaultdict(lambda: [0.0, 0.0])
+    for order_id, user_id, total_price, order_datetime in orders.values_list(
+        'id', 'user_id', 'total_price', 'order_datetime'
+    ).iterator():
+        # 매출 일자는 주문 일시의 로컬 날짜 (sales.rollup.sales_date 와 같은 기준)
+        if timezone.is_aware(order_datetime):
+            order_datetime = timezone.localtime(order_datetime)
+        day = order_datetime.date()
+        fish_totals = fish_by_order.get(order_id, {})
+        entries.append(OrderSalesEntry(
+            order_id=order_id, user_id=user_id, date=day, revenue=total_price, fish_totals=fish_totals
+        ))
+        for bucket in (daily[(user_id, day)], monthly[(user_id, day.replace(day=1))]):
+            bucket[0] += total_price
+            bucket[1] += 1
+        for fish_type_id, (quantity, revenue) in fish_totals.items():
+            bucket = fish[(user_id, day, int(fish_type_id))]
+            bucket[0] += quantity
+            bucket[1] += revenue
+
+    OrderSalesEntry.objects.bulk_create(entries, batch_size=1000)
+    DailySales.objects.bulk_create([
+        DailySales(user_id=key[0], date=key[1], revenue=value[0], order_count=value[1])
+        for key, value in daily.items()
+    ], batch_size=1000)
+    MonthlySales.objects.bulk_create([
+        MonthlySales(user_id=key[0], month=key[1], revenue=value[0], order_count=value[1])
+        for key, value in monthly.items()
+    ], batch_size=1000)
+    DailyFishSales.objects.bulk_create([
+        DailyFishSales(user_id=key[0], date=key[1], fish_type_id=key[2], quantity=value[0], revenue=value[1])
+        for key, value in fish.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('order', '0007_order_user_datetime_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('fish_registry', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderSalesEntry',
+            fields=[
+                ('order', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sales_entry', serialize=False, to='order.order', verbose_name='주문')),
+                ('date', models.DateField(verbose_name='매출 일자')),
+                ('revenue', models.BigIntegerField(default=0, verbose_name='반영된 매출액')),
+                ('fish_totals', models.JSONField(default=dict, verbose_name='반영된 어종별 수량/매출액')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '주문 매출 반영 내역',
+                'verbose_name_plural': '주문 매출 반영 내역',
+                'db_table': 'sales_order_entries',
+            },
+        ),
+        migrations.CreateModel(
+            name='MonthlySales',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('month', models.DateField(verbose_name='매출 월 (1일)')),
+                ('revenue', models.BigIntegerField(default=0, verbose_name='매출액')),
+                ('order_count', models.IntegerField(default=0, verbose_name='주문 수')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '월 매출 집계',
+                'verbose_name_plural': '월 매출 집계',
+                'db_table': 'sales_monthly',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailySales',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('date', models.DateField(verbose_name='매출 일자')),
+                ('revenue', models.BigIntegerField(default=0, verbose_name='매출액')),
+                ('order_count', models.IntegerField(default=0, verbose_name='주문 수')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '일 매출 집계',
+                'verbose_name_plural': '일 매출 집계',
+                'db_table': 'sales_daily',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyFishSales',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('date', models.DateField(verbose_name='매출 일자')),
+                ('quantity', models.FloatField(default=0, verbose_name='판매 수량')),
+                ('revenue', models.FloatField(default=0, verbose_name='매출액')),
+                ('fish_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='fish_registry.fishtype', verbose_name='어종')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '어종별 일 매출 집계',
+                'verbose_name_plural': '어종별 일 매출 집계',
+                'db_table': 'sales_daily_fish',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='monthlysales',
+            constraint=models.UniqueConstraint(fields=('user', 'month'), name='sales_monthly_user_month_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailysales',
+            constraint=models.UniqueConstraint(fields=('user', 'date'), name='sales_daily_user_date_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyfishsales',
+            constraint=models.UniqueConstraint(fields=('user', 'date', 'fish_type'), name='sales_daily_fish_uniq'),
+        ),
+        migrations.RunPython(backfill_sales_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,90 @@
+from django.db import models
+from django.conf import settings
+
+
+class DailySales(models.Model):
+    """사용자별 일 매출 집계 (납품 완료 주문 기준, 주문 상태 변경 시 증분 갱신)"""
+    id = models.AutoField(primary_key=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, verbose_name="사용자")
+    date = models.DateField(verbose_name="매출 일자")
+    revenue = models.BigIntegerField(default=0, verbose_name="매출액")
+    order_count = models.IntegerField(default=0, verbose_name="주문 수")
+
+    class Meta:
+        db_table = 'sales_daily'
+        verbose_name = '일 매출 집계'
+        verbose_name_plural = '일 매출 집계'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='sales_daily_user_date_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.date} {self.revenue:,}원 ({self.order_count}건)"
+
+
+class MonthlySales(models.Model):
+    """사용자별 월 매출 집계 (month 는 해당 월 1일)"""
+    id = models.AutoField(primary_key=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, verbose_name="사용자")
+    month = models.DateField(verbose_name="매출 월 (1일)")
+    revenue = models.BigIntegerField(default=0, verbose_name="매출액")
+    order_count = models.IntegerField(default=0, verbose_name="주문 수")
+
+    class Meta:
+        db_table = 'sales_monthly'
+        verbose_name = '월 매출 집계'
+        verbose_name_plural = '월 매출 집계'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'month'], name='sales_monthly_user_month_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.month:%Y-%m} {self.revenue:,}원 ({self.order_count}건)"
+
+
+class DailyFishSales(models.Model):
+    """사용자별 일/어종별 판매 수량 및 매출 집계"""
+    id = models.AutoField(primary_key=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, verbose_name="사용자")
+    date = models.DateField(verbose_name="매출 일자")
+    fish_type = models.ForeignKey('fish_registry.FishType', on_delete=models.CASCADE, verbose_name="어종")
+    quantity = models.FloatField(default=0, verbose_name="판매 수량")
+    revenue = models.FloatField(default=0, verbose_name="매출액")
+
+    class Meta:
+        db_table = 'sales_daily_fish'
+        verbose_name = '어종별 일 매출 집계'
+        verbose_name_plural = '어종별 일 매출 집계'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date', 'fish_type'], name='sales_daily_fish_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.date} 어종 {self.fish_type_id} {self.quantity} / {self.revenue:,.0f}원"
+
+
+class OrderSalesEntry(models.Model):
+    """
+    주문별 매출 반영 내역
+    집계 테이블에 반영된 값을 기록해 두고, 주문이 바뀌면 차액만 집계에 더합니다.
+    fish_totals: {어종 ID: [수량, 매출액]}
+    """
+    order = models.OneToOneField(
+        'order.Order',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='sales_entry',
+        verbose_name="주문"
+    )
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, verbose_name="사용자")
+    date = models.DateField(verbose_name="매출 일자")
+    revenue = models.BigIntegerField(default=0, verbose_name="반영된 매출액")
+    fish_totals = models.JSONField(default=dict, verbose_name="반영된 어종별 수량/매출액")
+
+    class Meta:
+        db_table = 'sales_order_entries'
+        verbose_name = '주문 매출 반영 내역'
+        verbose_name_plural = '주문 매출 반영 내역'
+
+    def __str__(self):
+        return f"주문 {self.order_id} {self.date} {self.revenue:,}원"
@@ -0,0 +1,290 @@
+"""
+매출 집계(rollup) 서비스
+납품 완료 주문의 매출을 일/월/어종별 집계 테이블에 증분 반영하고, 매출 API 는 집계 테이블만 읽습니다.
+주문별로 반영한 값을 OrderSalesEntry 에 기록해 두므로 같은 주문을 여러 번 동기화해도 결과가 같습니다.
+"""
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F, Q, Sum, FloatField
+from django.utils import timezone
+
+from order.models import Order, OrderItem
+from .models import DailySales, MonthlySales, DailyFishSales, OrderSalesEntry
+
+logger = logging.getLogger(__name__)
+
+# 매출로 집계하는 주문 상태 (결제/납품 완료)
+SALES_ORDER_STATUSES = ['delivered', 'completed']
+
+
+def sales_date(order_datetime):
+    """주문 일시의 로컬 날짜 (order_datetime__date 조회와 같은 기준)"""
+    if timezone.is_aware(order_datetime):
+        order_datetime = timezone.localtime(order_datetime)
+    return order_datetime.date()
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def next_month(day):
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+class SalesRollupService:
+    """매출 집계 관리 클래스"""
+
+    # ------------------------------------------------------------------
+    # 증분 갱신
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _fish_totals(order_id):
+        """주문의 어종별 {어종 ID(str): [수량, 매출액]}"""
+        rows = OrderItem.objects.filter(order_id=order_id).values('fish_type_id').annotate(
+            total_quantity=Sum('quantity'),
+            total_revenue=Sum(F('quantity') * F('unit_price'), output_field=FloatField())
+        )
+        return {
+            str(row['fish_type_id']): [float(row['total_quantity'] or 0), float(row['total_revenue'] or 0)]
+            for row in rows
+        }
+
+    @staticmethod
+    @transaction.atomic
+    def sync_order(order_id):
+        """주문 1건의 현재 상태를 집계에 반영 (멱등)"""
+        order = Order.objects.filter(id=order_id).only(
+            'id', 'user_id', 'total_price', 'order_status', 'order_datetime'
+        ).first()
+        entry = OrderSalesEntry.objects.select_for_update().filter(order_id=order_id).first()
+
+        if order is None or order.order_status not in SALES_ORDER_STATUSES:
+            if entry:
+                SalesRollupService._apply(entry.user_id, entry.date, -entry.revenue, -1, entry.fish_totals, -1)
+                entry.delete()
+                logger.info(f"매출 집계 제외: 주문 {order_id}, {entry.date}, -{entry.revenue}")
+            return
+
+        day = sales_date(order.order_datetime)
+        fish_totals = SalesRollupService._fish_totals(order_id)
+
+        if entry and (entry.user_id, entry.date, entry.revenue, entry.fish_totals) == (
+            order.user_id, day, order.total_price, fish_totals
+        ):
+            return
+
+        if entry:
+            SalesRollupService._apply(entry.user_id, entry.date, -entry.revenue, -1, entry.fish_totals, -1)
+        SalesRollupService._apply(order.user_id, day, order.total_price, 1, fish_totals, 1)
+
+        OrderSalesEntry.objects.update_or_create(
+            order_id=order_id,
+            defaults={
+                'user_id': order.user_id,
+                'date': day,
+                'revenue': order.total_price,
+                'fish_totals': fish_totals,
+            }
+        )
+        logger.info(f"매출 집계 반영: 주문 {order_id}, {day}, {order.total_price}")
+
+    @staticmethod
+    @transaction.atomic
+    def remove_order(order_id):
+        """주문 삭제 시 집계에서 제외"""
+        entry = OrderSalesEntry.objects.select_for_update().filter(order_id=order_id).first()
+        if entry:
+            SalesRollupService._apply(entry.user_id, entry.date, -entry.revenue, -1, entry.fish_totals, -1)
+            entry.delete()
+
+    @staticmethod
+    def _apply(user_id, day, revenue_delta, count_delta, fish_totals, sign):
+        """일/월/어종별 집계에 증감 반영"""
+        SalesRollupService._increment(
+            DailySales, {'user_id': user_id, 'date': day},
+            revenue=revenue_delta, order_count=count_delta
+        )
+        SalesRollupService._increment(
+            MonthlySales, {'user_id': user_id, 'month': month_start(day)},
+            revenue=revenue_delta, order_count=count_delta
+        )
+        for fish_type_id, (quantity, revenue) in fish_totals.items():
+            SalesRollupService._increment(
+                DailyFishSales, {'user_id': user_id, 'date': day, 'fish_type_id': int(fish_type_id)},
+                quantity=quantity * sign, revenue=revenue * sign
+            )
+
+    @staticmethod
+    def _increment(model, lookup, **deltas):
+        """집계 행에 F() 증감 (행이 없으면 생성)"""
+        updated = model.objects.filter(**lookup).update(
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+        if updated:
+            return
+        row, created = model.objects.get_or_create(**lookup)
+        if not created:
+            # 동시에 다른 트랜잭션이 행을 만든 경우
+            SalesRollupService._increment(model, lookup, **deltas)
+            return
+        for field, delta in deltas.items():
+            setattr(row, field, delta)
+        row.save(update_fields=list(deltas))
+
+    # ------------------------------------------------------------------
+    # 백필
+    # ------------------------------------------------------------------
+    @staticmethod
+    @transaction.atomic
+    def rebuild(user_id=None):
+        """주문 테이블에서 집계 전체(또는 사용자 1명) 재구성 - 반영한 주문 수 반환"""
+        user_filter = {'user_id': user_id} if user_id else {}
+        for model in (OrderSalesEntry, DailySales, MonthlySales, DailyFishSales):
+            model.objects.filter(**user_filter).delete()
+
+        orders = Order.objects.filter(order_status__in=SALES_ORDER_STATUSES, **user_filter)
+
+        fish_by_order = defaultdict(dict)
+        item_rows = OrderItem.objects.filter(order__in=orders).values('order_id', 'fish_type_id').annotate(
+            total_quantity=Sum('quantity'),
+            total_revenue=Sum(F('quantity') * F('unit_price'), output_field=FloatField())
+        )
+        for row in item_rows.iterator():
+            fish_by_order[row['order_id']][str(row['fish_type_id'])] = [
+                float(row['total_quantity'] or 0), float(row['total_revenue'] or 0)
+            ]
+
+        entries = []
+        daily = defaultdict(lambda: [0, 0])
+        monthly = defaultdict(lambda: [0, 0])
+        fish = defaultdict(lambda: [0.0, 0.0])
+        for order_id, order_user_id, total_price, order_datetime in orders.values_list(
+            'id', 'user_id', 'total_price', 'order_datetime'
+        ).iterator():
+            day = sales_date(order_datetime)
+            fish_totals = fish_by_order.get(order_id, {})
+            entries.append(OrderSalesEntry(
+                order_id=order_id, user_id=order_user_id, date=day,
+                revenue=total_price, fish_totals=fish_totals
+            ))
+            for bucket in (daily[(order_user_id, day)], monthly[(order_user_id, month_start(day))]):
+                bucket[0] += total_price
+                bucket[1] += 1
+            for fish_type_id, (quantity, revenue) in fish_totals.items():
+                bucket = fish[(order_user_id, day, int(fish_type_id))]
+                bucket[0] += quantity
+                bucket[1] += revenue
+
+        OrderSalesEntry.objects.bulk_create(entries, batch_size=1000)
+        DailySales.objects.bulk_create([
+            DailySales(user_id=key[0], date=key[1], revenue=value[0], order_count=value[1])
+            for key, value in daily.items()
+        ], batch_size=1000)
+        MonthlySales.objects.bulk_create([
+            MonthlySales(user_id=key[0], month=key[1], revenue=value[0], order_count=value[1])
+            for key, value in monthly.items()
+        ], batch_size=1000)
+        DailyFishSales.objects.bulk_create([
+            DailyFishSales(user_id=key[0], date=key[1], fish_type_id=key[2], quantity=value[0], revenue=value[1])
+            for key, value in fish.items()
+        ], batch_size=1000)
+
+        logger.info(f"매출 집계 재구성 완료: 주문 {len(entries)}건, 일 {len(daily)}행, 월 {len(monthly)}행")
+        return len(entries)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _split_range(start, end):
+        """
+        [start, end] 를 온전한 월 구간과 앞뒤 일부 구간으로 분리
+        반환: (월 구간 [시작 월, 끝 월) 또는 None, 일 단위로 읽을 (시작, 끝) 목록)
+        """
+        full_start = start if start.day == 1 else next_month(start)
+        full_end = next_month(end) if next_month(end) - timedelta(days=1) == end else month_start(end)
+        if full_start >= full_end:
+            return None, [(start, end)]
+
+        day_ranges = []
+        if start < full_start:
+            day_ranges.append((start, full_start - timedelta(days=1)))
+        if full_end <= end:
+            day_ranges.append((full_end, end))
+        return (full_start, full_end), day_ranges
+
+    @staticmethod
+    def _daily_rows(user_id, day_ranges):
+        if not day_ranges:
+            return []
+        condition = Q()
+        for range_start, range_end in day_ranges:
+            condition |= Q(date__gte=range_start, date__lte=range_end)
+        return DailySales.objects.filter(condition, user_id=user_id, order_count__gt=0).values(
+            'date', 'revenue', 'order_count'
+        )
+
+    @staticmethod
+    def monthly_series(user_id, start, end):
+        """[start, end] 기간의 월별 [{'period': 월 1일, 'revenue', 'order_count'}] (기간 경계의 월은 일 집계로 계산)"""
+        month_range, day_ranges = SalesRollupService._split_range(start, end)
+
+        series = defaultdict(lambda: [0, 0])
+        if month_range:
+            rows = MonthlySales.objects.filter(
+                user_id=user_id, month__gte=month_range[0], month__lt=month_range[1], order_count__gt=0
+            ).values('month', 'revenue', 'order_count')
+            for row in rows:
+                series[row['month']][0] += row['revenue']
+                series[row['month']][1] += row['order_count']
+        for row in SalesRollupService._daily_rows(user_id, day_ranges):
+            bucket = series[month_start(row['date'])]
+            bucket[0] += row['revenue']
+            bucket[1] += row['order_count']
+
+        return [
+            {'period': period, 'revenue': revenue, 'order_count': order_count}
+            for period, (revenue, order_count) in sorted(series.items())
+            if order_count > 0
+        ]
+
+    @staticmethod
+    def yearly_series(user_id, start, end):
+        """[start, end] 기간의 연도별 [{'period': 1월 1일, 'revenue', 'order_count'}]"""
+        series = defaultdict(lambda: [0, 0])
+        for row in SalesRollupService.monthly_series(user_id, start, end):
+            bucket = series[row['period'].replace(month=1)]
+            bucket[0] += row['revenue']
+            bucket[1] += row['order_count']
+        return [
+            {'period': period, 'revenue': revenue, 'order_count': order_count}
+            for period, (revenue, order_count) in sorted(series.items())
+        ]
+
+    @staticmethod
+    def daily_series(user_id, start, end):
+        """[start, end] 기간의 일별 [{'period': 날짜, 'revenue', 'order_count'}]"""
+        return [
+            {'period': row['date'], 'revenue': row['revenue'], 'order_count': row['order_count']}
+            for row in SalesRollupService._daily_rows(user_id, [(start, end)]).order_by('date')
+        ]
+
+    @staticmethod
+    def total(user_id, start, end):
+        """[start, end] 기간의 (매출 합계, 주문 수)"""
+        series = SalesRollupService.monthly_series(user_id, start, end)
+        return (
+            sum(row['revenue'] for row in series),
+            sum(row['order_count'] for row in series),
+        )
+
+    @staticmethod
+    def fish_sales(user_id, day):
+        """특정 날짜의 어종별 [{'fish_type__name', 'total_quantity', 'total_revenue'}] (매출액 내림차순)"""
+        return DailyFishSales.objects.filter(user_id=user_id, date=day, quantity__gt=0).values(
+            'fish_type__name', total_quantity=F('quantity'), total_revenue=F('revenue')
+        ).order_by('-revenue')
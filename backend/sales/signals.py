@@ -0,0 +1,39 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+import logging
+
+from order.models import Order, OrderItem
+from .rollup import SalesRollupService, SALES_ORDER_STATUSES
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Order)
+def sync_sales_on_order_save(sender, instance, **kwargs):
+    """주문 상태 변경(납품 완료/취소 등) 시 매출 집계 갱신 (주문 저장과 같은 트랜잭션)"""
+    SalesRollupService.sync_order(instance.id)
+
+
+@receiver(pre_delete, sender=Order)
+def remove_sales_on_order_delete(sender, instance, **kwargs):
+    """주문 삭제 전 매출 집계에서 제외"""
+    SalesRollupService.remove_order(instance.id)
+
+
+@receiver(post_save, sender=OrderItem)
+def sync_sales_on_item_save(sender, instance, **kwargs):
+    """이미 매출로 집계된 주문의 품목이 추가/수정되면 어종별 집계 갱신"""
+    if instance.order.order_status in SALES_ORDER_STATUSES:
+        SalesRollupService.sync_order(instance.order_id)
+
+
+@receiver(post_delete, sender=OrderItem)
+def sync_sales_on_item_delete(sender, instance, **kwargs):
+    """
+    이미 매출로 집계된 주문의 품목이 삭제되면 어종별 집계 갱신
+    주문 삭제로 함께 지워지는 품목도 여기로 오므로 커밋 후에 동기화 (그때는 주문이 없어 아무것도 반영하지 않음)
+    """
+    order_id = instance.order_id
+    if Order.objects.filter(id=order_id, order_status__in=SALES_ORDER_STATUSES).exists():
+        transaction.on_commit(lambda: SalesRollupService.sync_order(order_id))
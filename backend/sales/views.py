@@ -4,11 +4,12 @@ from django.views import View
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
-from django.db.models import Sum, Count, Q
-from django.db.models.functions import TruncMonth, TruncYear, TruncDate
+from django.db.models import Sum, Count
+from django.db.models.functions import Extract
 from core.middleware import get_user_queryset_filter
 from order.models import Order
-from decimal import Decimal
+from .models import DailySales
+from .rollup import SalesRollupService, next_month
 
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -53,75 +54,30 @@ class SalesStatsView(View):
             
             print(f"📅 실제 날짜 범위: {start_date} ~ {end_date}")
             
-            # 사용자의 결제 완료된 주문만 필터링
-            orders_queryset = Order.objects.filter(
-                **get_user_queryset_filter(request),
-                order_status__in=['delivered', 'completed'],  # 결제 완료된 상태
-                order_datetime__date__gte=start_date,
-                order_datetime__date__lte=end_date
-            )
+            user_id = request.user_id
             
-            print(f"🔍 필터링된 주문 수: {orders_queryset.count()}")
+            # 매출 집계 테이블 조회 (주문 원본 테이블을 집계하지 않음 - sales.rollup)
+            total_revenue, order_count = SalesRollupService.total(user_id, start_date, end_date)
             
-            # 총 매출 계산
-            total_revenue = orders_queryset.aggregate(
-                total=Sum('total_price')
-            )['total'] or Decimal('0')
+            print(f"🔍 필터링된 주문 수: {order_count}")
             
             # 특정 기간 선택 여부에 따른 계산 분기
+            # (비교 지표는 아래 공통 result 에서 formatted_data 기준으로 계산)
             selectedPeriod = request.GET.get('selected_period')
             if selectedPeriod:
                 if period_type == 'month':
-                    # 선택된 월의 통계
+                    # 선택된 월의 일별 데이터
                     year, month = selectedPeriod.split('-')
                     month_start = datetime(int(year), int(month), 1).date()
-                    if int(month) == 12:
-                        month_end = datetime(int(year) + 1, 1, 1).date() - timedelta(days=1)
-                    else:
-                        month_end = datetime(int(year), int(month) + 1, 1).date() - timedelta(days=1)
-                    
-                    # 해당 월의 일별 데이터
-                    daily_data = orders_queryset.filter(
-                        order_datetime__date__gte=month_start,
-                        order_datetime__date__lte=month_end
-                    ).annotate(
-                        day=TruncDate('order_datetime')
-                    ).values('day').annotate(
-                        revenue=Sum('total_price'),
-                        order_count=Count('id')
-                    ).order_by('day')
-                    
-                    # 일평균 매출
-                    days_in_month = (month_end - month_start).days + 1
-                    daily_average = float(total_revenue) / days_in_month if days_in_month > 0 else 0
+                    month_end = next_month(month_start) - timedelta(days=1)
                     
-                    # 최고 매출일
-                    highest_day = daily_data.order_by('-revenue').first()
-                    highest_period = highest_day['day'].strftime('%m월 %d일') if highest_day else '데이터 없음'
-                    
-                    # 지난달 매출과 비교하여 성장률 계산
-                    prev_month = int(month) - 1 if int(month) > 1 else 12
-                    prev_year = int(year) if int(month) > 1 else int(year) - 1
-                    prev_month_start = datetime(prev_year, prev_month, 1).date()
-                    if prev_month == 12:
-                        prev_month_end = datetime(prev_year + 1, 1, 1).date() - timedelta(days=1)
-                    else:
-                        prev_month_end = datetime(prev_year, prev_month + 1, 1).date() - timedelta(days=1)
-                    
-                    prev_month_revenue = Order.objects.filter(
-                        **get_user_queryset_filter(request),
-                        order_status__in=['delivered', 'completed'],
-                        order_datetime__date__gte=prev_month_start,
-                        order_datetime__date__lte=prev_month_end
-                    ).aggregate(total=Sum('total_price'))['total'] or Decimal('0')
-                    
-                    growth_rate = 0
-                    if prev_month_revenue > 0:
-                        growth_rate = ((total_revenue - prev_month_revenue) / prev_month_revenue) * 100
+                    daily_data = SalesRollupService.daily_series(
+                        user_id, max(start_date, month_start), min(end_date, month_end)
+                    )
                     
                     formatted_data = []
                     for item in daily_data:
-                        day_str = item['day'].strftime('%m월 %d일')
+                        day_str = item['period'].strftime('%m월 %d일')
                         formatted_data.append({
                             'month': day_str,
                             'revenue': float(item['revenue'] or 0),
@@ -129,73 +85,29 @@ class SalesStatsView(View):
                         })
                     
                 else:  # year
-                    # 선택된 년도의 통계
+                    # 선택된 년도의 월별 데이터
                     year = int(selectedPeriod)
                     year_start = datetime(year, 1, 1).date()
                     year_end = datetime(year, 12, 31).date()
                     
-                    # 해당 년도의 월별 데이터
-                    monthly_data = orders_queryset.filter(
-                        order_datetime__date__gte=year_start,
-                        order_datetime__date__lte=year_end
-                    ).annotate(
-                        month=TruncMonth('order_datetime')
-                    ).values('month').annotate(
-                        revenue=Sum('total_price'),
-                        order_count=Count('id')
-                    ).order_by('month')
-                    
-                    # 월평균 매출
-                    daily_average = float(total_revenue) / 12 if total_revenue > 0 else 0
-                    
-                    # 최고 매출월
-                    highest_month = monthly_data.order_by('-revenue').first()
-                    highest_period = highest_month['month'].strftime('%m월') if highest_month else '데이터 없음'
-                    
-                    # 지난해 매출과 비교하여 성장률 계산
-                    prev_year_start = datetime(year - 1, 1, 1).date()
-                    prev_year_end = datetime(year - 1, 12, 31).date()
-                    
-                    prev_year_revenue = Order.objects.filter(
-                        **get_user_queryset_filter(request),
-                        order_status__in=['delivered', 'completed'],
-                        order_datetime__date__gte=prev_year_start,
-                        order_datetime__date__lte=prev_year_end
-                    ).aggregate(total=Sum('total_price'))['total'] or Decimal('0')
-                    
-                    growth_rate = 0
-                    if prev_year_revenue > 0:
-                        growth_rate = ((total_revenue - prev_year_revenue) / prev_year_revenue) * 100
+                    monthly_data = SalesRollupService.monthly_series(
+                        user_id, max(start_date, year_start), min(end_date, year_end)
+                    )
                     
                     formatted_data = []
                     for item in monthly_data:
-                        month_str = item['month'].strftime('%Y년 %m월')
+                        month_str = item['period'].strftime('%Y년 %m월')
                         formatted_data.append({
                             'month': month_str,
                             'revenue': float(item['revenue'] or 0),
                             'order_count': item['order_count']
                         })
                 
-                result = {
-                    'total_revenue': float(total_revenue),
-                    'daily_average': daily_average,  # 일평균 또는 월평균
-                    'highest_period': highest_period,  # 최고 매출일 또는 월
-                    'growth_rate': round(growth_rate, 1),
-                    'monthly_data': formatted_data,
-                    'period_type': period_type,
-                    'selected_period': selectedPeriod
-                }
-                
             else:
-                # 기본 범위 조회 (기존 로직)
+                # 기본 범위 조회
                 if period_type == 'month':
                     # 월별 데이터
-                    monthly_data = orders_queryset.annotate(
-                        period=TruncMonth('order_datetime')
-                    ).values('period').annotate(
-                        revenue=Sum('total_price'),
-                        order_count=Count('id')
-                    ).order_by('period')
+                    monthly_data = SalesRollupService.monthly_series(user_id, start_date, end_date)
                     
                     # 월 이름 형식으로 변환
                     formatted_data = []
@@ -208,12 +120,7 @@ class SalesStatsView(View):
                         })
                 else:
                     # 연도별 데이터
-                    yearly_data = orders_queryset.annotate(
-                        period=TruncYear('order_datetime')
-                    ).values('period').annotate(
-                        revenue=Sum('total_price'),
-                        order_count=Count('id')
-                    ).order_by('period')
+                    yearly_data = SalesRollupService.yearly_series(user_id, start_date, end_date)
                     
                     # 연도 형식으로 변환
                     formatted_data = []
@@ -295,14 +202,14 @@ class DailySalesView(View):
                 order_datetime__date=target_date
             ).select_related('business').order_by('-order_datetime')
             
-            print(f"🔍 해당 날짜 주문 수: {daily_orders.count()}")
-            
-            # 총 매출 및 주문 수 계산
-            total_revenue = daily_orders.aggregate(
-                total=Sum('total_price')
-            )['total'] or Decimal('0')
+            # 총 매출 및 주문 수 (일 매출 집계 1행)
+            daily_sales = DailySales.objects.filter(
+                user_id=request.user_id, date=target_date
+            ).values('revenue', 'order_count').first() or {}
+            total_revenue = daily_sales.get('revenue') or 0
+            order_count = daily_sales.get('order_count') or 0
             
-            order_count = daily_orders.count()
+            print(f"🔍 해당 날짜 주문 수: {order_count}")
             
             # 시간대별 매출 데이터
             hourly_data = daily_orders.annotate(
@@ -320,17 +227,8 @@ class DailySalesView(View):
                     'order_count': item['order_count']
                 })
             
-            # 어종별 매출 및 수량 통계
-            from django.db.models import F, Extract
-            from order.models import OrderItem
-            fish_stats = OrderItem.objects.filter(
-                order__in=daily_orders
-            ).select_related('fish_type').values(
-                'fish_type__name'
-            ).annotate(
-                total_quantity=Sum('quantity'),
-                total_revenue=Sum(F('quantity') * F('unit_price'))
-            ).order_by('-total_revenue')
+            # 어종별 매출 및 수량 통계 (어종별 일 매출 집계)
+            fish_stats = list(SalesRollupService.fish_sales(request.user_id, target_date))
             
             total_fish_revenue = sum(item['total_revenue'] for item in fish_stats if item['total_revenue'])
             
@@ -0,0 +1,35 @@
+"""
+API 테스트 공통 설정
+JWT 서명 키 고정, 인증/Django 캐시 초기화, 승인된 테스트 사용자(self.user) 생성과 인증 헤더를 제공합니다.
+TestCase / TransactionTestCase 어느 쪽과도 함께 쓸 수 있도록 믹스인으로 둡니다.
+"""
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from business.models import User
+from core import auth_cache, jwt_utils
+
+
+class AuthenticatedUserMixin:
+    JWT_SECRET_KEY = 'test-secret-key-for-api-tests'
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(jwt_utils, 'JWT_SECRET_KEY', self.JWT_SECRET_KEY)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        auth_cache.token_cache.clear()
+        auth_cache.user_status_cache.clear()
+        cache.clear()
+
+        self.user = User.objects.create(username='owner', business_name='테스트수산', status='approved')
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Bearer {jwt_utils.generate_access_token(self.user)}'}
+
+
+class AuthenticatedTestCase(AuthenticatedUserMixin, TestCase):
+    pass
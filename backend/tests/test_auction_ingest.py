@@ -0,0 +1,121 @@
+"""
+경매 데이터 수집 엔진 테스트 (로컬 스텁 HTTP 서버)
+페이지 분할/재시도/중복 무시와 일괄 저장 쿼리 수를 확인합니다.
+"""
+import datetime
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from prediction.ingest import AuctionIngestEngine
+from prediction.models import ActualAuctionPrice, CommonCode, FishSpecies, WholesaleMarket
+
+FISH_CODES = ['531200', '532100']
+ITEMS_PER_DAY = 7
+PAGE_SIZE = 3
+
+
+class StubAuctionAPI(BaseHTTPRequestHandler):
+    """aT 경매 API 흉내 - 날짜/어종별 ITEMS_PER_DAY 건, 각 요청의 첫 시도는 503 (재시도 확인용)"""
+
+    failed_once = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        with self.lock:
+            first_attempt = self.path not in self.failed_once
+            self.failed_once.add(self.path)
+        if first_attempt:
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        page, rows = int(query['pageNo']), int(query['numOfRows'])
+        items = [
+            {
+                'auctionSequenceId': f"{query['trd_dd']}-{query['gds_sclsf_cd']}-{index}",
+                'marketCode': 'M1',
+                'itemCode': query['gds_sclsf_cd'],
+                'tradeTime': f"{query['trd_dd']} 05:00:00",
+                'tradeVolume': '10',
+                'auctionPrice': '15000',
+            }
+            for index in range(ITEMS_PER_DAY)
+        ][(page - 1) * rows:page * rows]
+        body = json.dumps({'response': {'body': {'totalCount': ITEMS_PER_DAY, 'items': {'item': items}}}}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AuctionIngestEngineTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubAuctionAPI)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f'http://127.0.0.1:{cls.server.server_address[1]}/trades'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        StubAuctionAPI.failed_once.clear()
+        WholesaleMarket.objects.create(market_api_code='M1', market_name_kr='부산공판장')
+        for code in FISH_CODES:
+            FishSpecies.objects.create(
+                item_large_category_code='5', item_large_category_name_kr='수산물',
+                item_medium_category_code='53', item_medium_category_name_kr='어류',
+                item_small_category_code=code, item_small_category_name_kr=f'어종{code}',
+            )
+        for code_type, value in [('PLOR', 'BUSAN'), ('PKG', 'FRESH'), ('UNIT', 'KG')]:
+            CommonCode.objects.create(code_type=code_type, code_value=value, code_name_kr=value)
+
+    def _engine(self):
+        return AuctionIngestEngine(
+            'test-key', url=self.url, workers=4, rate_per_second=0,
+            retries=2, backoff_seconds=0, page_size=PAGE_SIZE, batch_size=10,
+        )
+
+    def test_fetches_all_pages_with_retry_and_bulk_saves(self):
+        start = datetime.date(2024, 1, 1)
+        end = datetime.date(2024, 1, 3)
+        days = 3
+        expected = days * len(FISH_CODES) * ITEMS_PER_DAY
+
+        with CaptureQueriesContext(connection) as context:
+            stats = self._engine().run(start, end, FISH_CODES)
+
+        self.assertEqual(stats.errors, [])
+        self.assertEqual(stats.pages, days * len(FISH_CODES) * 3)  # 7건 / 페이지 3건 = 3페이지
+        self.assertEqual(stats.created, expected)
+        self.assertEqual(ActualAuctionPrice.objects.count(), expected)
+        # 마스터 데이터 3회 + 배치(10건)마다 중복 조회 1회 + INSERT 1회 - 항목 수와 무관하게 일정
+        self.assertLessEqual(len(context), 3 + 2 * -(-expected // 10) + 2)
+
+    def test_rerun_ignores_existing_rows(self):
+        day = datetime.date(2024, 1, 1)
+        self._engine().run(day, day, FISH_CODES)
+        StubAuctionAPI.failed_once.clear()
+
+        stats = self._engine().run(day, day, FISH_CODES)
+
+        self.assertEqual(stats.created, 0)
+        self.assertEqual(stats.duplicates, len(FISH_CODES) * ITEMS_PER_DAY)
+        self.assertEqual(ActualAuctionPrice.objects.count(), len(FISH_CODES) * ITEMS_PER_DAY)
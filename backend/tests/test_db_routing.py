@@ -0,0 +1,104 @@
+"""
+읽기 replica 라우팅 테스트
+replica 별칭은 헬스 모니터 스텁으로 주입하고, 지연 기반 제외는 SQLite default 별칭을 replica 로 프로브해 확인합니다.
+- 읽기 분산 / 쓰기 후 primary 고정 / atomic 블록 안의 읽기 / 사용자 sticky 기간 / 복제 지연 초과 시 풀 제외
+"""
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TransactionTestCase, override_settings
+
+from business.models import User
+from config import db_router
+from config.db_health import DatabaseHealthMonitor
+from config.db_router import DatabaseFallbackRouter
+from core.middleware import DatabaseRoutingMiddleware
+
+REPLICAS = {'ALIASES': ['replica_1', 'replica_2'], 'MAX_LAG_SECONDS': 5, 'STICKY_SECONDS': 1}
+
+
+class StubHealthMonitor:
+    active_alias = 'default'
+    healthy_replicas = ('replica_1', 'replica_2')
+
+    def ensure_started(self):
+        pass
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+@mock.patch.object(db_router, 'get_health_monitor', StubHealthMonitor)
+class ReplicaRoutingTestCase(TransactionTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.router = DatabaseFallbackRouter()
+        self.tokens = db_router.reset_request_routing()
+
+    def tearDown(self):
+        db_router.restore_request_routing(self.tokens)
+
+    def test_reads_use_replicas_until_write(self):
+        self.assertEqual(
+            {self.router.db_for_read(User) for _ in range(4)}, {'replica_1', 'replica_2'}
+        )
+        with db_router.use_primary():
+            self.assertEqual(self.router.db_for_read(User), 'default')
+
+        self.assertEqual(self.router.db_for_write(User), 'default')
+        self.assertEqual(self.router.db_for_read(User), 'default')
+
+    def test_reads_inside_atomic_block_use_primary(self):
+        # 작업 스레드처럼 미들웨어 없이 고정되지 않은 상태에서 select_for_update 를 하는 경우
+        with transaction.atomic():
+            self.assertEqual(self.router.db_for_read(User), 'default')
+        self.assertIn(self.router.db_for_read(User), REPLICAS['ALIASES'])
+
+    def test_user_sticky_window_after_write(self):
+        factory = RequestFactory()
+        seen = []
+
+        def view(request):
+            if request.method == 'POST':
+                self.router.db_for_write(User)
+            seen.append(self.router.db_for_read(User))
+            return HttpResponse()
+
+        middleware = DatabaseRoutingMiddleware(view)
+
+        def call(method):
+            request = getattr(factory, method)('/')
+            request.user_id = 7
+            middleware(request)
+            return seen[-1]
+
+        self.assertIn(call('get'), REPLICAS['ALIASES'])
+        self.assertEqual(call('post'), 'default')
+        self.assertEqual(call('get'), 'default')  # sticky 기간 안
+
+        time.sleep(REPLICAS['STICKY_SECONDS'] + 0.2)
+        self.assertIn(call('get'), REPLICAS['ALIASES'])
+
+
+class ReplicaLagTestCase(TransactionTestCase):
+
+    def test_lagging_replica_removed_and_restored(self):
+        # default(SQLite)를 replica 로 프로브하고 복제 지연만 바꿔가며 확인
+        monitor = DatabaseHealthMonitor(
+            primary='primary_absent', fallback='fallback_absent', replicas=('default',),
+            fail_threshold=1, recover_threshold=2, max_replica_lag=5,
+        )
+        self.assertEqual(monitor.healthy_replicas, ('default',))
+
+        with mock.patch.object(monitor, 'measure_lag', return_value=12.0):
+            monitor.probe_once()
+        self.assertEqual(monitor.healthy_replicas, ())
+        self.assertEqual(monitor.states['default'].lag_seconds, 12.0)
+
+        with mock.patch.object(monitor, 'measure_lag', return_value=0.5):
+            monitor.probe_once()
+            self.assertEqual(monitor.healthy_replicas, ())  # RECOVER_THRESHOLD 회 연속 성공 전
+            monitor.probe_once()
+        self.assertEqual(monitor.healthy_replicas, ('default',))
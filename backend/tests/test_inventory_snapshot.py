@@ -0,0 +1,74 @@
+"""
+재고 스냅샷 API 테스트
+재고 목록/재고 부족 목록이 캐시된 JSON 과 ETag 로 응답하고, 재고 변경 후에는 새 ETag 가 나오는지 확인합니다.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from business.models import Business
+from fish_registry.models import FishType
+from inventory.models import Inventory
+from order.services import OrderWriter
+from tests.base import AuthenticatedTestCase
+
+
+class InventorySnapshotTestCase(AuthenticatedTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.flatfish = FishType.objects.create(user=self.user, name='광어', unit='kg')
+        self.rockfish = FishType.objects.create(user=self.user, name='우럭', unit='kg')
+        self.flatfish_inventory = Inventory.objects.create(
+            user=self.user, fish_type=self.flatfish, stock_quantity=50, unit='kg', status='normal'
+        )
+        Inventory.objects.create(user=self.user, fish_type=self.rockfish, stock_quantity=3, unit='kg', status='low')
+
+    def _get(self, url, etag=None):
+        headers = self.auth_headers()
+        if etag:
+            headers['HTTP_IF_NONE_MATCH'] = etag
+        return self.client.get(url, **headers)
+
+    def test_inventory_list_etag_and_not_modified(self):
+        response = self._get('/api/v1/inventory/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['fish_type_name'] for item in response.json()], ['우럭', '광어'])
+        self.assertEqual(response.json()[1]['ordered_quantity'], 0)
+        etag = response['ETag']
+
+        with CaptureQueriesContext(connection) as context:
+            response = self._get('/api/v1/inventory/', etag=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(context), 0)
+
+        response = self._get('/api/v1/inventory/?search=광')
+        self.assertEqual([item['fish_type_name'] for item in response.json()], ['광어'])
+
+        # 주문 접수(StockLedger bulk_update)도 스냅샷을 무효화
+        business = Business.objects.create(
+            user=self.user, business_name='동해수산', phone_number='01012345678', address='부산'
+        )
+        OrderWriter.create_order(
+            self.user.id, business.id,
+            [{'fish_type_id': self.flatfish.id, 'quantity': 4, 'unit_price': 1000, 'unit': 'kg'}],
+            total_price=4000,
+        )
+        response = self._get('/api/v1/inventory/', etag=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()[0]['ordered_quantity'], 4)
+
+    def test_low_stock_served_from_snapshot(self):
+        response = self._get('/api/v1/dashboard/low-stock/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            [{'fish_name': '우럭', 'stock_quantity': 3, 'ordered_quantity': 0, 'unit': 'kg', 'status': 'low'}]
+        )
+        self.assertEqual(self._get('/api/v1/dashboard/low-stock/', etag=response['ETag']).status_code, 304)
+
+        self.flatfish_inventory.stock_quantity = 0
+        self.flatfish_inventory.save()
+        response = self._get('/api/v1/dashboard/low-stock/', etag=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['status'] for item in response.json()], ['out_of_stock', 'low'])
@@ -0,0 +1,95 @@
+"""
+주문 일괄 가져오기 API 테스트
+행별 결과, 재고 주문수량/미수금 원장 반영, 주문 수와 무관한 쿼리 수를 확인합니다.
+"""
+import json
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from business.models import Business
+from fish_registry.models import FishType
+from inventory.models import Inventory
+from order.models import Order, OrderItem
+from payment.models import BusinessReceivable
+from tests.base import AuthenticatedTestCase
+
+CSV_HEADER = 'order_ref,business_id,fish_type_name,quantity,unit_price,unit,memo\n'
+
+
+class OrderImportTestCase(AuthenticatedTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.business = Business.objects.create(
+            user=self.user, business_name='동해수산', phone_number='01012345678', address='부산'
+        )
+        self.flatfish = FishType.objects.create(user=self.user, name='광어', unit='kg')
+        self.rockfish = FishType.objects.create(user=self.user, name='우럭', unit='kg')
+        self.inventory = Inventory.objects.create(user=self.user, fish_type=self.flatfish, stock_quantity=100, unit='kg')
+
+    def _post_csv(self, content):
+        upload = SimpleUploadedFile('orders.csv', content.encode('utf-8'), content_type='text/csv')
+        return self.client.post('/api/v1/orders/import/', {'file': upload}, **self.auth_headers())
+
+    def _csv(self, order_count, start=0):
+        rows = []
+        for index in range(start, start + order_count):
+            rows.append(f'R{index},{self.business.id},광어,2,10000,kg,메모{index}')
+            rows.append(f'R{index},{self.business.id},우럭,1,5000,,')
+        return CSV_HEADER + '\n'.join(rows) + '\n'
+
+    def test_csv_import_reports_each_row(self):
+        content = self._csv(2) + (
+            f'BAD,{self.business.id},없는어종,1,1000,kg,\n'
+            f'R9,{self.business.id},광어,-1,1000,kg,\n'
+        )
+        response = self._post_csv(content)
+
+        self.assertEqual(response.status_code, 201, response.content)
+        report = response.json()
+        self.assertEqual(report['summary']['orders_created'], 2)
+        self.assertEqual(report['summary']['orders_failed'], 2)
+        self.assertEqual([result['row'] for result in report['results']], [2, 3, 4, 5, 6, 7])
+        self.assertEqual(report['results'][0]['order_id'], report['results'][1]['order_id'])
+        self.assertIn('없는어종', report['results'][4]['errors'][0])
+
+        order = Order.objects.get(id=report['results'][0]['order_id'])
+        self.assertEqual(order.total_price, 25000)
+        self.assertEqual(order.memo, '메모0')
+        self.assertEqual(OrderItem.objects.filter(order=order).count(), 2)
+
+        self.inventory.refresh_from_db()
+        self.assertEqual(self.inventory.ordered_quantity, 4)
+        receivable = BusinessReceivable.objects.get(business=self.business)
+        self.assertEqual((receivable.outstanding_balance, receivable.unpaid_order_count), (50000, 2))
+
+    def test_ndjson_body(self):
+        body = '\n'.join([
+            json.dumps({'business_name': '동해수산', 'order_items': [
+                {'fish_type_id': self.flatfish.id, 'quantity': 3, 'unit_price': 1000},
+                {'fish_type_id': self.rockfish.id, 'quantity': 1},
+            ]}),
+            '{broken',
+        ])
+        response = self.client.post(
+            '/api/v1/orders/import/', data=body, content_type='application/x-ndjson', **self.auth_headers()
+        )
+
+        self.assertEqual(response.status_code, 201, response.content)
+        results = response.json()['results']
+        self.assertEqual([(r['row'], r['status']) for r in results], [(1, 'created'), (2, 'failed')])
+
+    def test_query_count_independent_of_order_count(self):
+        self._post_csv(self._csv(1, start=1000))  # 인증 캐시 워밍업
+
+        def count(order_count, start):
+            with CaptureQueriesContext(connection) as context:
+                response = self._post_csv(self._csv(order_count, start))
+            self.assertEqual(response.json()['summary']['orders_created'], order_count)
+            return len(context)
+
+        small = count(5, 0)
+        large = count(50, 100)
+        self.assertEqual(small, large, f'주문 5건 {small}쿼리 → 50건 {large}쿼리')
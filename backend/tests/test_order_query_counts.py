@@ -0,0 +1,100 @@
+"""
+주문 목록 계열 API 쿼리 수 회귀 테스트
+주문 수가 늘어나도 쿼리 수가 일정해야 합니다 (거래처/결제/재고 N+1 방지).
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from business.models import Business
+from fish_registry.models import FishType
+from inventory.models import Inventory
+from order.models import Order, OrderItem
+from payment.models import Payment
+from tests.base import AuthenticatedTestCase
+
+
+class OrderQueryCountTestCase(AuthenticatedTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.business = Business.objects.create(
+            user=self.user, business_name='동해수산', phone_number='01012345678', address='부산'
+        )
+        self.fish_types = [
+            FishType.objects.create(user=self.user, name=f'어종{i}', unit='kg') for i in range(4)
+        ]
+        for fish_type in self.fish_types[:2]:
+            Inventory.objects.create(user=self.user, fish_type=fish_type, stock_quantity=5, unit='kg')
+
+    def _create_orders(self, count):
+        for _ in range(count):
+            # 주문마다 다른 거래처를 사용해 거래처 조회가 행 단위로 늘어나는지 확인
+            business = Business.objects.create(
+                user=self.user, business_name='거래처', phone_number='01012345678', address='부산'
+            )
+            order = Order.objects.create(
+                user=self.user, business=business, total_price=40000,
+                source_type='manual', order_status='delivered'
+            )
+            for fish_type in self.fish_types:
+                OrderItem.objects.create(
+                    order=order, fish_type=fish_type, quantity=1, unit='kg', unit_price=10000
+                )
+            Payment.objects.create(order=order, business=business, amount=40000, method='cash')
+
+    def _count_queries(self, url):
+        headers = self.auth_headers()
+        self.client.get(url, **headers)  # 인증 캐시 워밍업
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, **headers)
+        self.assertEqual(response.status_code, 200, response.content)
+        return len(context)
+
+    def assertConstantQueries(self, url):
+        self._create_orders(2)
+        small = self._count_queries(url)
+        self._create_orders(8)
+        large = self._count_queries(url)
+        self.assertEqual(small, large, f'{url}: 주문 2건 {small}쿼리 → 10건 {large}쿼리')
+
+    def test_order_list(self):
+        self.assertConstantQueries('/api/v1/orders/?page_size=50')
+
+    def test_dashboard_recent_orders(self):
+        self.assertConstantQueries('/api/v1/dashboard/recent-orders/?limit=50')
+
+    def test_unpaid_orders(self):
+        self.assertConstantQueries('/api/v1/payments/ar/unpaid-orders/')
+
+    def test_daily_sales(self):
+        self.assertConstantQueries(f'/api/v1/sales/daily/?date={timezone.localdate().isoformat()}')
+
+    def _count_order_create_queries(self, item_count):
+        payload = {
+            'source_type': 'manual',
+            'business_id': self.business.id,
+            'total_price': 10000 * item_count,
+            'order_items': [
+                {'fish_type_id': self.fish_types[i % len(self.fish_types)].id, 'quantity': 1, 'unit_price': 10000, 'unit': 'kg'}
+                for i in range(item_count)
+            ],
+        }
+        headers = self.auth_headers()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                '/api/v1/orders/upload/', data=payload, content_type='application/json', **headers
+            )
+        self.assertEqual(response.status_code, 201, response.content)
+        return len(context)
+
+    def test_manual_order_create(self):
+        self._count_order_create_queries(1)  # 인증 캐시 워밍업
+        small = self._count_order_create_queries(2)
+        large = self._count_order_create_queries(12)
+        self.assertEqual(small, large, f'주문 생성: 항목 2개 {small}쿼리 → 12개 {large}쿼리')
+
+        inventory = Inventory.objects.get(fish_type=self.fish_types[0])
+        # 항목이 어종 4개를 순환하므로 어종0 은 1 + 1 + 3 = 5 만큼 주문수량 증가
+        self.assertEqual(inventory.ordered_quantity, 5)
+        self.assertEqual(OrderItem.objects.filter(order__user=self.user).count(), 1 + 2 + 12)
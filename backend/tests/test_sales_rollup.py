@@ -0,0 +1,55 @@
+"""
+매출 집계(rollup) 시그널 테스트
+납품 완료 주문의 품목 삭제와 주문 삭제가 어종별/일 집계에 반영되는지 확인합니다.
+"""
+from django.test import TestCase
+
+from business.models import User, Business
+from fish_registry.models import FishType
+from order.models import Order, OrderItem
+from sales.models import DailySales, OrderSalesEntry
+from sales.rollup import SalesRollupService, sales_date
+
+
+class SalesRollupSignalTestCase(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username='owner', business_name='테스트수산', status='approved')
+        business = Business.objects.create(
+            user=self.user, business_name='동해수산', phone_number='01012345678', address='부산'
+        )
+        self.flatfish = FishType.objects.create(user=self.user, name='광어', unit='kg')
+        self.rockfish = FishType.objects.create(user=self.user, name='우럭', unit='kg')
+        self.order = Order.objects.create(
+            user=self.user, business=business, total_price=5000, source_type='manual', order_status='delivered'
+        )
+        self.flatfish_item = OrderItem.objects.create(
+            order=self.order, fish_type=self.flatfish, quantity=2, unit='kg', unit_price=1000
+        )
+        OrderItem.objects.create(order=self.order, fish_type=self.rockfish, quantity=3, unit='kg', unit_price=1000)
+        self.day = sales_date(self.order.order_datetime)
+
+    def _fish_totals(self):
+        return {
+            row['fish_type__name']: (row['total_quantity'], row['total_revenue'])
+            for row in SalesRollupService.fish_sales(self.user.id, self.day)
+        }
+
+    def test_item_delete_updates_fish_totals(self):
+        self.assertEqual(self._fish_totals(), {'광어': (2, 2000), '우럭': (3, 3000)})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.flatfish_item.delete()
+
+        self.assertEqual(self._fish_totals(), {'우럭': (3, 3000)})
+        self.assertEqual(
+            OrderSalesEntry.objects.get(order=self.order).fish_totals, {str(self.rockfish.id): [3.0, 3000.0]}
+        )
+
+    def test_order_delete_removes_rollups(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order.delete()
+
+        self.assertEqual(self._fish_totals(), {})
+        self.assertFalse(OrderSalesEntry.objects.exists())
+        self.assertEqual(DailySales.objects.get(user=self.user, date=self.day).order_count, 0)
@@ -0,0 +1,65 @@
+"""
+재고 체크 API 테스트
+항목 수와 무관한 쿼리 수, 스냅샷 캐시 적중과 재고 변경 시 무효화를 확인합니다.
+"""
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from fish_registry.models import FishType
+from inventory.models import Inventory
+from tests.base import AuthenticatedTestCase
+
+
+class StockCheckTestCase(AuthenticatedTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.fish_types = [
+            FishType.objects.create(user=self.user, name=f'어종{i}', unit='kg') for i in range(30)
+        ]
+        self.inventories = [
+            Inventory.objects.create(user=self.user, fish_type=fish_type, stock_quantity=10, unit='kg')
+            for fish_type in self.fish_types
+        ]
+
+    def _check(self, items):
+        response = self.client.post(
+            '/api/v1/inventory/stock-check/', {'order_items': items},
+            content_type='application/json', **self.auth_headers()
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def _items(self, count, quantity=5):
+        return [
+            {'fish_type_id': fish_type.id, 'quantity': quantity, 'unit': 'kg'}
+            for fish_type in self.fish_types[:count]
+        ]
+
+    def _count_queries(self, items):
+        with CaptureQueriesContext(connection) as context:
+            self._check(items)
+        return len(context)
+
+    @override_settings(INVENTORY_SNAPSHOT_CACHE={'ENABLED': False})
+    def test_query_count_independent_of_item_count(self):
+        self._check(self._items(1))  # 인증 캐시 워밍업
+
+        self.assertEqual(self._count_queries(self._items(1)), self._count_queries(self._items(30)))
+
+    def test_snapshot_cache_and_invalidation(self):
+        result = self._check(self._items(30) + [{'fish_type_id': 999999, 'quantity': 1}])
+        self.assertEqual(result['status'], 'error')
+        self.assertEqual(len(result['items']), 30)
+        self.assertEqual(result['errors'][0]['fish_type_id'], 999999)
+
+        self.assertEqual(self._count_queries(self._items(30)), 0)
+
+        inventory = self.inventories[0]
+        inventory.stock_quantity = 2
+        inventory.save()
+
+        result = self._check(self._items(1))
+        self.assertEqual(result['items'][0]['status'], 'insufficient')
+        self.assertEqual(result['items'][0]['current_stock'], 2)
@@ -0,0 +1,132 @@
+"""
+재고 원장(StockLedger) 테스트
+출고/취소 재고 반영과 이력 기록, 동시 주문/출고에서 갱신 유실이 없는지 확인합니다.
+동시성 테스트는 행 잠금(select_for_update)을 지원하는 DB(PostgreSQL)에서만 실행됩니다.
+"""
+import threading
+from unittest import skipUnless
+
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase
+
+from business.models import Business
+from fish_registry.models import FishType
+from inventory.ledger import InsufficientStockError, StockLedger
+from inventory.models import Inventory, InventoryLog, StockTransaction
+from order.models import Order
+from order.services import OrderWriter
+from tests.base import AuthenticatedUserMixin
+
+
+class StockLedgerFixtureMixin(AuthenticatedUserMixin):
+
+    def setUp(self):
+        super().setUp()
+        self.business = Business.objects.create(
+            user=self.user, business_name='동해수산', phone_number='01012345678', address='부산'
+        )
+        self.flatfish = FishType.objects.create(user=self.user, name='광어', unit='kg')
+        self.inventory = Inventory.objects.create(
+            user=self.user, fish_type=self.flatfish, stock_quantity=10, unit='kg'
+        )
+
+    def _create_order(self, quantity, order_status='placed'):
+        return OrderWriter.create_order(
+            self.user.id, self.business.id,
+            [{'fish_type_id': self.flatfish.id, 'quantity': quantity, 'unit_price': 1000, 'unit': 'kg'}],
+            total_price=quantity * 1000, order_status=order_status,
+        )
+
+
+class StockLedgerTestCase(StockLedgerFixtureMixin, TestCase):
+
+    def test_ship_out_deducts_stock_and_writes_history(self):
+        order = self._create_order(4, order_status='ready')
+
+        response = self.client.post(f'/api/v1/orders/{order.id}/ship-out/', **self.auth_headers())
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.inventory.refresh_from_db()
+        self.assertEqual((self.inventory.stock_quantity, self.inventory.ordered_quantity), (6, 0))
+        log = InventoryLog.objects.get(inventory=self.inventory)
+        self.assertEqual((log.type, log.change, log.before_quantity, log.after_quantity), ('out', -4, 10, 6))
+        self.assertEqual(
+            list(StockTransaction.objects.filter(order=order).order_by('id').values_list('quantity_change', flat=True)),
+            [-4, 0]  # 접수(판매 가능 -4), 출고(재고/주문수량 함께 감소)
+        )
+
+    def test_ship_out_shortage_changes_nothing(self):
+        order = self._create_order(12, order_status='ready')
+
+        response = self.client.post(f'/api/v1/orders/{order.id}/ship-out/', **self.auth_headers())
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['insufficient_items'][0]['shortage'], 2)
+        order.refresh_from_db()
+        self.inventory.refresh_from_db()
+        self.assertEqual(order.order_status, 'ready')
+        self.assertEqual((self.inventory.stock_quantity, self.inventory.ordered_quantity), (10, 12))
+        self.assertFalse(InventoryLog.objects.exists())
+
+    def test_cancel_releases_ordered_quantity_once(self):
+        order = self._create_order(3)
+
+        for expected_status in (200, 400):
+            response = self.client.post(
+                '/api/v1/orders/cancel/', {'order_id': order.id}, content_type='application/json', **self.auth_headers()
+            )
+            self.assertEqual(response.status_code, expected_status)
+
+        self.inventory.refresh_from_db()
+        self.assertEqual((self.inventory.stock_quantity, self.inventory.ordered_quantity), (10, 0))
+
+
+@skipUnless(connection.features.has_select_for_update, '행 잠금(select_for_update)을 지원하는 DB 필요')
+class StockLedgerConcurrencyTestCase(StockLedgerFixtureMixin, TransactionTestCase):
+    THREADS = 16
+
+    def _run_concurrently(self, target, args_list):
+        barrier = threading.Barrier(len(args_list))
+        errors = []
+
+        def worker(*args):
+            try:
+                barrier.wait()
+                target(*args)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker, args=args) for args in args_list]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def test_parallel_orders_have_no_lost_updates(self):
+        errors = self._run_concurrently(self._create_order, [(1,)] * self.THREADS)
+
+        self.assertEqual(errors, [])
+        self.inventory.refresh_from_db()
+        self.assertEqual(self.inventory.ordered_quantity, self.THREADS)
+        self.assertEqual(StockTransaction.objects.filter(inventory=self.inventory).count(), self.THREADS)
+
+    def test_parallel_ship_out_never_oversells(self):
+        orders = [self._create_order(1, order_status='ready') for _ in range(self.THREADS)]
+
+        def ship(order):
+            try:
+                StockLedger.ship(order)
+            except InsufficientStockError:
+                pass
+
+        errors = self._run_concurrently(ship, [(order,) for order in orders])
+
+        self.assertEqual(errors, [])
+        self.inventory.refresh_from_db()
+        self.assertEqual(self.inventory.stock_quantity, 0)
+        self.assertEqual(self.inventory.ordered_quantity, self.THREADS - 10)
+        self.assertEqual(InventoryLog.objects.filter(inventory=self.inventory).count(), 10)
+        self.assertEqual(Order.objects.count(), self.THREADS)
@@ -0,0 +1,120 @@
+"""
+스트리밍 STT 유틸리티
+오디오 파일을 처음부터 끝까지 메모리에 올리지 않고 CHUNK_SECONDS 단위로 디코딩한 뒤,
+VAD 로 찾은 묵음 구간에서 잘라 모델에 넘깁니다. 말하는 도중에 잘리지 않도록
+마지막 묵음 이후의 오디오는 다음 청크 앞에 붙여서 처리합니다.
+
+최대 메모리 사용량은 파일 길이와 무관하게 약 2 × CHUNK_SECONDS 분량의 오디오로 제한되고,
+첫 청크 변환이 끝나는 즉시 부분 결과를 돌려줄 수 있습니다.
+
+STT 워커 프로세스에서 사용하므로 이 모듈은 Django 를 import 하지 않습니다.
+"""
+import numpy as np
+
+SAMPLING_RATE = 16000
+
+
+def iter_audio_chunks(path, chunk_seconds=15, sampling_rate=SAMPLING_RATE):
+    """오디오 파일을 16kHz mono float32 청크(chunk_seconds 길이)로 순차 디코딩"""
+    import av
+
+    chunk_samples = int(chunk_seconds * sampling_rate)
+    resampler = av.audio.resampler.AudioResampler(format='s16', layout='mono', rate=sampling_rate)
+    buffer = []
+    buffered = 0
+
+    def drain(frames):
+        nonlocal buffered
+        for frame in frames:
+            array = frame.to_ndarray().reshape(-1)
+            buffer.append(array)
+            buffered += len(array)
+
+    with av.open(path, metadata_errors='ignore') as container:
+        for frame in container.decode(audio=0):
+            frame.pts = None
+            drain(resampler.resample(frame))
+            while buffered >= chunk_samples:
+                data = np.concatenate(buffer)
+                buffer[:] = [data[chunk_samples:]]
+                buffered = len(buffer[0])
+                yield data[:chunk_samples].astype(np.float32) / 32768.0
+        drain(resampler.resample(None))
+
+    if buffered:
+        yield np.concatenate(buffer).astype(np.float32) / 32768.0
+
+
+def load_clip(path, max_seconds=30, sampling_rate=SAMPLING_RATE):
+    """
+    짧은 파일을 통째로 디코딩 - max_seconds 보다 길면 None (배치 추론 대상이 아님)
+    긴 파일은 앞부분만 디코딩한 뒤 멈추므로 메모리를 더 쓰지 않습니다.
+    """
+    chunks = iter_audio_chunks(path, max_seconds, sampling_rate)
+    clip = next(chunks, None)
+    if clip is None:
+        return np.zeros(0, dtype=np.float32)
+    if next(chunks, None) is not None:
+        chunks.close()
+        return None
+    return clip
+
+
+def find_cut(audio, min_silence_ms=500, sampling_rate=SAMPLING_RATE):
+    """
+    청크를 자를 위치(샘플 인덱스) - 마지막 묵음 구간의 중간
+    말소리가 청크 끝까지 이어지고 중간에 묵음도 없으면 청크 끝에서 자릅니다.
+    """
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    speech = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=min_silence_ms))
+    if not speech:
+        return len(audio)
+
+    min_silence = min_silence_ms * sampling_rate // 1000
+    if len(audio) - speech[-1]['end'] >= min_silence:
+        return (speech[-1]['end'] + len(audio)) // 2
+    if len(speech) > 1:
+        return (speech[-2]['end'] + speech[-1]['start']) // 2
+    return len(audio)
+
+
+def stream_transcribe(model, path, language='ko', chunk_seconds=15, beam_size=1, min_silence_ms=500):
+    """
+    청크 단위로 변환하면서 청크마다 결과를 반환하는 제너레이터
+    반환: {'text', 'start', 'end', 'language'} (start/end 는 파일 기준 초)
+    """
+    carry = np.zeros(0, dtype=np.float32)
+    offset = 0.0
+
+    def transcribe_piece(piece, start):
+        segments, info = model.transcribe(
+            piece,
+            language=language or None,
+            beam_size=beam_size,
+            temperature=0.0,
+            condition_on_previous_text=False,
+            vad_filter=True,
+            vad_parameters=dict(min_silence_duration_ms=min_silence_ms),
+        )
+        text = " ".join(segment.text.strip() for segment in segments).strip()
+        return {
+            'text': text,
+            'start': start,
+            'end': start + len(piece) / SAMPLING_RATE,
+            'language': info.language,
+        }
+
+    for chunk in iter_audio_chunks(path, chunk_seconds):
+        audio = np.concatenate([carry, chunk]) if len(carry) else chunk
+        cut = find_cut(audio, min_silence_ms)
+        if len(audio) - cut > len(chunk):
+            # 넘기는 오디오는 청크 1개 분량까지만 (긴 발화가 이어져도 메모리 상한 유지)
+            cut = len(audio)
+        piece, carry = audio[:cut], audio[cut:]
+        if len(piece):
+            yield transcribe_piece(piece, offset)
+            offset += len(piece) / SAMPLING_RATE
+
+    if len(carry):
+        yield transcribe_piece(carry, offset)
@@ -0,0 +1,49 @@
+"""
+STT 워커 풀과 작업 큐 디스패처를 전용 프로세스로 실행하는 Django 관리 명령어
+"""
+import signal
+
+from django.core.management.base import BaseCommand
+
+from transcription.workers import TranscriptionJobQueue, TranscriptionWorkerPool, get_worker_settings
+
+
+class Command(BaseCommand):
+    help = 'AudioTranscription 대기 작업을 STT 워커 풀에서 처리합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes',
+            type=int,
+            help='워커 프로세스 수 (기본: TRANSCRIPTION_WORKERS["PROCESSES"])',
+        )
+
+    def handle(self, *args, **options):
+        config = get_worker_settings()
+        pool = TranscriptionWorkerPool(
+            processes=options.get('processes') or config['PROCESSES'],
+            model_config=config['MODEL'],
+        )
+        job_queue = TranscriptionJobQueue.from_settings(pool=pool)
+
+        def shutdown(signum, frame):
+            self.stdout.write(self.style.WARNING('🛑 종료 신호 수신 - 실행 중 작업 완료 후 종료합니다'))
+            job_queue.stop()
+
+        signal.signal(signal.SIGTERM, shutdown)
+        signal.signal(signal.SIGINT, shutdown)
+
+        try:
+            self.stdout.write(f'🔄 STT 워커 모델 로딩 (프로세스 {pool.processes}개)...')
+            for pid, stats in pool.warmup().items():
+                self.stdout.write(
+                    f'  pid={pid}: {stats["model_size"]} {stats["load_seconds"]}s, 메모리 +{stats["memory_mb"]}MB'
+                )
+
+            self.stdout.write(self.style.SUCCESS(
+                f'🎧 STT 워커 시작 (프로세스 {pool.processes}개, 최대 대기 {job_queue.max_depth}건)'
+            ))
+            job_queue.run_forever()
+        finally:
+            pool.shutdown(wait=True)
+            self.stdout.write(self.style.SUCCESS('✅ STT 워커 종료'))
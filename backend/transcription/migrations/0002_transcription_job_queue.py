@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcription', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audiotranscription',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Number of times a worker has started this job'),
+        ),
+        migrations.AddField(
+            model_name='audiotranscription',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, help_text='When the job finished (completed or failed)', null=True),
+        ),
+        migrations.AddField(
+            model_name='audiotranscription',
+            name='error_message',
+            field=models.TextField(blank=True, help_text='Last processing error, if any'),
+        ),
+        migrations.AddField(
+            model_name='audiotranscription',
+            name='started_at',
+            field=models.DateTimeField(blank=True, help_text='When a worker picked up this job', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='audiotranscription',
+            index=models.Index(fields=['status', 'created_at'], name='transcripti_queue_idx'),
+        ),
+    ]
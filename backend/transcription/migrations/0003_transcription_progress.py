@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcription', '0002_transcription_job_queue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audiotranscription',
+            name='processed_seconds',
+            field=models.FloatField(default=0, help_text='Seconds of audio transcribed so far (transcription holds the partial text while processing)'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcription', '0003_transcription_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audiotranscription',
+            name='batch_id',
+            field=models.UUIDField(blank=True, db_index=True, help_text='Shared by transcriptions uploaded together through the batch API (transcribed in one model batch)', null=True),
+        ),
+    ]
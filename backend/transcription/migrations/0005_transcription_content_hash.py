@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcription', '0004_transcription_batch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audiotranscription',
+            name='content_hash',
+            field=models.CharField(blank=True, help_text='SHA-256 of the uploaded audio, used to reuse results for identical re-uploads', max_length=64),
+        ),
+    ]
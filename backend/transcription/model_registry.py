@@ -0,0 +1,304 @@
+"""
+STT 모델 레지스트리
+프로세스마다 faster-whisper 모델을 이름별로 한 번만 로드해 공유합니다.
+- 모델은 처음 요청될 때(또는 warmup 시) 로드되고, 동시에 여러 스레드가 요청해도 로드는 한 번만 일어납니다.
+- 로드된 모델은 여러 스레드가 함께 사용하며, 동시 변환 수는 모델의 NUM_WORKERS 로 제한합니다.
+- 모델별 로드 시간과 로드 전후 메모리(RSS) 증가량을 기록합니다.
+- 변환은 audio_stream 으로 청크 단위 스트리밍 처리하므로 긴 파일도 메모리 사용량이 일정합니다.
+
+STT 워커 프로세스(stt_worker)에서도 사용하므로 이 모듈은 Django 를 import 하지 않습니다.
+"""
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = 'default'
+
+DEFAULT_MODEL_CONFIG = {
+    'MODEL_SIZE': 'small',
+    'DEVICE': 'cpu',
+    'COMPUTE_TYPE': 'int8',
+    'CPU_THREADS': 0,
+    'NUM_WORKERS': 1,  # 한 모델로 동시에 변환할 수 있는 스레드 수
+    'BEAM_SIZE': 1,
+    'CHUNK_SECONDS': 15,  # 스트리밍 변환 청크 길이 (메모리 상한과 첫 결과 지연을 결정)
+    'BATCH_SIZE': 8,  # 짧은 파일 배치 추론 시 한 번에 인코딩하는 파일 수
+}
+
+
+def _current_rss_bytes():
+    """현재 프로세스의 RSS (바이트, 알 수 없으면 None)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        # Linux 는 KB, macOS 는 바이트 단위 최대 RSS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if os.uname().sysname == 'Darwin' else max_rss * 1024
+    except (ImportError, AttributeError):
+        return None
+
+
+class _ModelEntry:
+    def __init__(self, name, config):
+        self.name = name
+        self.config = {**DEFAULT_MODEL_CONFIG, **config}
+        self.model = None
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(max(1, self.config['NUM_WORKERS']))
+        self.load_seconds = None
+        self.memory_bytes = None
+        self.loaded_at = None
+        self.uses = 0
+
+
+class SpeechModelRegistry:
+    """이름 → faster-whisper 모델 레지스트리 (프로세스 단위)"""
+
+    def __init__(self, models=None):
+        self._entries = {}
+        self._lock = threading.Lock()
+        if models:
+            self.configure(models)
+
+    def configure(self, models):
+        """
+        모델 설정 등록 - {이름: {'MODEL_SIZE', 'DEVICE', 'COMPUTE_TYPE', ...}}
+        이미 로드됐거나 로드 중인 모델의 설정은 바꾸지 않습니다.
+        """
+        with self._lock:
+            for name, config in models.items():
+                new_entry = _ModelEntry(name, config or {})
+                entry = self._entries.get(name)
+                if entry is not None and (
+                    entry.model is not None or entry.lock.locked() or entry.config == new_entry.config
+                ):
+                    continue
+                self._entries[name] = new_entry
+
+    def _entry(self, name):
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"등록되지 않은 STT 모델입니다: {name}")
+        return entry
+
+    def get(self, name=DEFAULT_MODEL):
+        """로드된 모델 반환 (없으면 로드)"""
+        entry = self._entry(name)
+        if entry.model is None:
+            with entry.lock:
+                if entry.model is None:
+                    self._load(entry)
+        return entry.model
+
+    def _load(self, entry):
+        from faster_whisper import WhisperModel
+
+        config = entry.config
+        logger.info(f"🔄 STT 모델 로딩: {entry.name} ({config['MODEL_SIZE']}, {config['DEVICE']}/{config['COMPUTE_TYPE']})")
+        rss_before = _current_rss_bytes()
+        started = time.perf_counter()
+        model = WhisperModel(
+            config['MODEL_SIZE'],
+            device=config['DEVICE'],
+            compute_type=config['COMPUTE_TYPE'],
+            cpu_threads=config['CPU_THREADS'],
+            num_workers=max(1, config['NUM_WORKERS']),
+        )
+        entry.load_seconds = time.perf_counter() - started
+        rss_after = _current_rss_bytes()
+        if rss_before is not None and rss_after is not None:
+            entry.memory_bytes = max(0, rss_after - rss_before)
+        entry.loaded_at = time.time()
+        entry.model = model
+
+        memory = f", +{entry.memory_bytes / 1024 ** 2:.0f}MB" if entry.memory_bytes is not None else ""
+        logger.info(f"✅ STT 모델 로딩 완료: {entry.name} ({entry.load_seconds:.1f}s{memory}, pid={os.getpid()})")
+
+    def warmup(self, names=None):
+        """등록된 모델(또는 지정한 모델)을 미리 로드"""
+        for name in names or list(self._entries):
+            self.get(name)
+        return self.stats()
+
+    def transcribe_stream(self, path, language='ko', name=DEFAULT_MODEL):
+        """
+        오디오 파일을 CHUNK_SECONDS 단위로 디코딩/변환하며 청크별 결과를 반환하는 제너레이터
+        반환: {'text', 'start', 'end', 'language'} (audio_stream.stream_transcribe 참고)
+        """
+        from .audio_stream import stream_transcribe
+
+        model = self.get(name)
+        entry = self._entry(name)
+        with entry.slots:
+            entry.uses += 1
+            yield from stream_transcribe(
+                model,
+                path,
+                language=language,
+                chunk_seconds=entry.config['CHUNK_SECONDS'],
+                beam_size=entry.config['BEAM_SIZE'],
+            )
+
+    def transcribe(self, path, language='ko', name=DEFAULT_MODEL, on_progress=None):
+        """
+        오디오 파일을 텍스트로 변환
+        on_progress(지금까지의 텍스트, 처리한 오디오 길이(초)) 는 청크가 끝날 때마다 호출됩니다.
+        반환: {'text', 'language', 'duration', 'elapsed', 'model'}
+        """
+        started = time.perf_counter()
+        texts = []
+        detected_language = language
+        duration = 0.0
+        for piece in self.transcribe_stream(path, language, name):
+            if piece['text']:
+                texts.append(piece['text'])
+                detected_language = detected_language or piece['language']
+            duration = piece['end']
+            if on_progress is not None:
+                on_progress(" ".join(texts), duration)
+
+        return {
+            'text': " ".join(texts),
+            'language': detected_language,
+            'duration': duration,
+            'elapsed': time.perf_counter() - started,
+            'model': name,
+        }
+
+    def transcribe_batch(self, paths, language='ko', name=DEFAULT_MODEL):
+        """
+        여러 파일을 배치 추론으로 변환 (파일 순서대로 결과 반환, 실패한 파일은 {'error'})
+        30초 이하 파일은 길이순으로 정렬해 BATCH_SIZE 개씩 인코더/디코더를 한 번에 실행하고,
+        더 긴 파일은 transcribe() 로 하나씩 스트리밍 변환합니다.
+        """
+        from .audio_stream import SAMPLING_RATE, load_clip
+
+        model = self.get(name)
+        entry = self._entry(name)
+        max_seconds = model.feature_extractor.chunk_length
+        results = [None] * len(paths)
+        clips = []
+        for index, path in enumerate(paths):
+            try:
+                clip = load_clip(path, max_seconds)
+            except Exception as e:
+                results[index] = {'error': str(e)}
+                continue
+            if clip is None:
+                try:
+                    results[index] = self.transcribe(path, language, name)
+                except Exception as e:
+                    results[index] = {'error': str(e)}
+            else:
+                clips.append((index, clip))
+
+        # 길이가 비슷한 파일끼리 묶어 디코딩 길이 차이로 인한 낭비를 줄임
+        clips.sort(key=lambda item: len(item[1]))
+        batch_size = max(1, entry.config['BATCH_SIZE'])
+        with entry.slots:
+            entry.uses += 1
+            for start in range(0, len(clips), batch_size):
+                group = clips[start:start + batch_size]
+                started = time.perf_counter()
+                try:
+                    texts = self._generate_batch(model, entry, [clip for _, clip in group], language)
+                except Exception as e:
+                    for index, _ in group:
+                        results[index] = {'error': str(e)}
+                    continue
+                # 배치 소요 시간은 오디오 길이 비율로 나눠 기록
+                elapsed = time.perf_counter() - started
+                total_samples = sum(len(clip) for _, clip in group) or 1
+                for (index, clip), text in zip(group, texts):
+                    results[index] = {
+                        'text': text,
+                        'language': language,
+                        'duration': len(clip) / SAMPLING_RATE,
+                        'elapsed': elapsed * len(clip) / total_samples,
+                        'model': name,
+                        'batched': True,
+                    }
+        return results
+
+    @staticmethod
+    def _generate_batch(model, entry, clips, language):
+        """30초 이하 오디오 여러 개를 패딩해 한 번의 encode/generate 로 변환"""
+        import ctranslate2
+        import numpy as np
+        from faster_whisper.tokenizer import Tokenizer
+
+        extractor = model.feature_extractor
+        features = np.stack([
+            # 특징 추출 시 30초 패딩이 붙으므로 앞 nb_max_frames 만 사용
+            extractor(clip)[:, :extractor.nb_max_frames] for clip in clips
+        ]).astype(np.float32)
+        encoder_output = model.model.encode(
+            ctranslate2.StorageView.from_array(np.ascontiguousarray(features)), to_cpu=False
+        )
+
+        tokenizer = Tokenizer(
+            model.hf_tokenizer, model.model.is_multilingual, task='transcribe', language=language or 'ko'
+        )
+        prompt = list(tokenizer.sot_sequence) + [tokenizer.no_timestamps]
+        outputs = model.model.generate(
+            encoder_output,
+            [prompt] * len(clips),
+            beam_size=entry.config['BEAM_SIZE'],
+            max_length=model.max_length,
+            return_scores=True,
+            return_no_speech_prob=True,
+            suppress_blank=True,
+            suppress_tokens=[-1],
+        )
+
+        texts = []
+        for output in outputs:
+            # 묵음으로 판단되는 파일은 빈 텍스트 (faster-whisper 기본 기준과 동일)
+            tokens = output.sequences_ids[0]
+            avg_logprob = output.scores[0] * len(tokens) / (len(tokens) + 1)
+            if output.no_speech_prob > 0.6 and avg_logprob < -1.0:
+                texts.append('')
+                continue
+            texts.append(tokenizer.decode(tokens).strip())
+        return texts
+
+    def stats(self):
+        """모델별 로드 상태/로드 시간/메모리 사용량"""
+        return {
+            name: {
+                'model_size': entry.config['MODEL_SIZE'],
+                'device': entry.config['DEVICE'],
+                'compute_type': entry.config['COMPUTE_TYPE'],
+                'loaded': entry.model is not None,
+                'load_seconds': round(entry.load_seconds, 2) if entry.load_seconds is not None else None,
+                'memory_mb': round(entry.memory_bytes / 1024 ** 2, 1) if entry.memory_bytes is not None else None,
+                'uses': entry.uses,
+            }
+            for name, entry in list(self._entries.items())
+        }
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_speech_registry(models=None):
+    """
+    프로세스 단위 레지스트리 싱글톤 반환
+    models 를 넘기면 아직 로드되지 않은 모델 설정을 등록합니다.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SpeechModelRegistry()
+    if models:
+        _registry.configure(models)
+    return _registry
@@ -72,6 +72,39 @@ class AudioTranscription(models.Model):
         related_name='transcription',
         help_text="Order created from this transcription (if any)"
     )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When a worker picked up this job"
+    )
+    completed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the job finished (completed or failed)"
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Number of times a worker has started this job"
+    )
+    error_message = models.TextField(
+        blank=True,
+        help_text="Last processing error, if any"
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="SHA-256 of the uploaded audio, used to reuse results for identical re-uploads"
+    )
+    batch_id = models.UUIDField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="Shared by transcriptions uploaded together through the batch API (transcribed in one model batch)"
+    )
+    processed_seconds = models.FloatField(
+        default=0,
+        help_text="Seconds of audio transcribed so far (transcription holds the partial text while processing)"
+    )
     
     class Meta:
         ordering = ['-created_at']
@@ -79,6 +112,8 @@ class AudioTranscription(models.Model):
             models.Index(fields=['status']),
             models.Index(fields=['created_at']),
             models.Index(fields=['user']),
+            # Job queue: oldest pending job first
+            models.Index(fields=['status', 'created_at'], name='transcripti_queue_idx'),
         ]
     
     def __str__(self):
@@ -0,0 +1,60 @@
+"""
+STT 워커 프로세스 측 코드
+TranscriptionWorkerPool 이 띄운 각 워커 프로세스는 시작 시 SpeechModelRegistry 로 Whisper 모델을 한 번 로드(warm)하고,
+이후 요청마다 파일 경로만 받아 텍스트를 반환합니다.
+변환은 청크 단위로 진행되며, 청크가 끝날 때마다 지금까지의 텍스트를 진행 상황 큐로 보냅니다.
+워커 프로세스는 Django 설정/DB 에 접근하지 않으므로 이 모듈은 Django 를 import 하지 않습니다.
+"""
+import os
+
+from .model_registry import DEFAULT_MODEL, get_speech_registry
+
+_progress_queue = None
+
+
+def init_worker(config, progress_queue=None):
+    """워커 프로세스 초기화 - 모델을 미리 로드해 첫 요청 지연을 없앰"""
+    global _progress_queue
+    _progress_queue = progress_queue
+    stats = get_speech_registry({DEFAULT_MODEL: config}).warmup([DEFAULT_MODEL])[DEFAULT_MODEL]
+    memory = f", +{stats['memory_mb']}MB" if stats['memory_mb'] is not None else ""
+    print(f"✅ STT 워커 모델 로드 완료 (pid={os.getpid()}, {stats['load_seconds']}s{memory})")
+
+
+def transcribe_file(path, language='ko', progress_key=None):
+    """
+    오디오 파일을 텍스트로 변환
+    progress_key 를 넘기면 청크마다 (progress_key, 지금까지의 텍스트, 처리한 초) 를 진행 상황 큐에 넣습니다.
+    반환: {'text', 'language', 'duration', 'elapsed', 'model', 'pid', 'model_stats'}
+    """
+    on_progress = None
+    if progress_key is not None and _progress_queue is not None:
+        on_progress = lambda text, seconds: _progress_queue.put((progress_key, text, seconds))
+
+    registry = get_speech_registry()
+    result = registry.transcribe(path, language, on_progress=on_progress)
+    result['pid'] = os.getpid()
+    result['model_stats'] = registry.stats()[DEFAULT_MODEL]
+    return result
+
+
+def transcribe_batch(paths, language='ko'):
+    """
+    여러 파일을 배치 추론으로 변환
+    반환: {'items': [파일별 결과 또는 {'error'}], 'duration', 'elapsed', 'pid', 'model_stats'}
+    """
+    registry = get_speech_registry()
+    items = registry.transcribe_batch(paths, language)
+    succeeded = [item for item in items if 'error' not in item]
+    return {
+        'items': items,
+        'duration': sum(item['duration'] for item in succeeded),
+        'elapsed': sum(item['elapsed'] for item in succeeded),
+        'pid': os.getpid(),
+        'model_stats': registry.stats()[DEFAULT_MODEL],
+    }
+
+
+def model_stats():
+    """워커 프로세스의 모델 로드 상태 (warmup 확인용)"""
+    return {'pid': os.getpid(), 'model_stats': get_speech_registry().stats().get(DEFAULT_MODEL)}
@@ -1,14 +1,15 @@
 from celery import shared_task
-from .views import TranscribeAudioView
+from .workers import get_job_queue
 
 @shared_task(bind=True, max_retries=3)
 def process_audio_task(self, transcription_id):
     """
-    Celery task to process audio transcription in the background
+    Celery task to process audio transcription in the background.
+    Runs the job through the shared STT worker pool, so a Celery worker keeps
+    at most TRANSCRIPTION_WORKERS['PROCESSES'] warm model instances.
     """
     try:
-        # Call the static method from the view
-        TranscribeAudioView.process_audio(transcription_id)
+        get_job_queue().run_job(transcription_id)
     except Exception as exc:
         # Retry the task if it fails
         self.retry(exc=exc, countdown=60 * 5)  # Retry after 5 minutes
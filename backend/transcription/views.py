@@ -1,17 +1,15 @@
 import logging
 import os
 import tempfile
+import uuid
 
-# faster_whisper 모듈을 조건부로 import
-try:
-    from faster_whisper import WhisperModel
-    FASTER_WHISPER_AVAILABLE = True
-except ImportError:
-    print("⚠️ faster_whisper 모듈이 설치되지 않았습니다. STT 기능이 비활성화됩니다.")
-    WhisperModel = None
-    FASTER_WHISPER_AVAILABLE = False
 from django.conf import settings
 from django.db import transaction
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.response import Response
@@ -19,50 +17,46 @@ from rest_framework.permissions import AllowAny
 from .models import AudioTranscription
 from .serializers import AudioTranscriptionSerializer
 from .services.order_service import OrderCreationService
+from .model_registry import DEFAULT_MODEL, get_speech_registry
+from .workers import get_job_queue, get_worker_pool, get_worker_settings, stt_cache_params, TranscriptionQueueFull
+from core.media_cache import MediaResultCache, KIND_STT
 
 logger = logging.getLogger(__name__)
 
-# Faster-Whisper 모델 로드 (한 번만 로드)
-whisper_model = None
-
 def get_whisper_model():
-    """Faster-Whisper 모델을 로드하고 캐싱"""
-    global whisper_model
-    if whisper_model is None:
-        logger.info("🔄 Faster-Whisper 모델 로딩 중...")
-        # 'small' 모델 사용, CPU 최적화
-        whisper_model = WhisperModel("small", device="cpu", compute_type="int8")
-        logger.info("✅ Faster-Whisper 모델 로딩 완료")
-    return whisper_model
+    """
+    현재 프로세스에서 공유하는 Faster-Whisper 모델 반환 (SpeechModelRegistry 에서 한 번만 로드)
+    요청 처리 경로에서는 모델을 직접 쓰지 말고 process_audio_with_whisper(워커 풀)를 사용합니다.
+    """
+    return get_speech_registry({DEFAULT_MODEL: get_worker_settings()['MODEL']}).get(DEFAULT_MODEL)
 
 def process_audio_with_whisper(audio_file, language='ko'):
-    """Faster-Whisper를 사용하여 오디오를 텍스트로 변환"""
+    """STT 워커 풀을 사용하여 오디오를 텍스트로 변환 (요청 스레드는 결과만 대기)"""
     try:
         logger.info(f"🔄 Faster-Whisper STT 처리 시작: {audio_file.name}")
         
-        # 임시 파일로 저장
+        # 같은 파일을 이미 변환했다면 워커를 거치지 않고 바로 반환 (타임아웃 후 재업로드 등)
+        cache_params = stt_cache_params(language)
+        content_hash = MediaResultCache.hash_file(audio_file) if MediaResultCache.enabled() else None
+        cached_text = MediaResultCache.get(KIND_STT, content_hash, cache_params)
+        if cached_text is not None:
+            return cached_text
+        
+        # 임시 파일로 저장 (워커 프로세스는 파일 경로로 읽음)
         with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(audio_file.name)[1]) as temp_file:
             for chunk in audio_file.chunks():
                 temp_file.write(chunk)
             temp_file_path = temp_file.name
         
         try:
-            # Faster-Whisper 모델 가져오기
-            model = get_whisper_model()
-            
-            # 음성 인식 수행 (Faster-Whisper API)
-            segments, info = model.transcribe(
+            config = get_worker_settings()
+            result = get_worker_pool().transcribe(
                 temp_file_path,
-                language=language if language != 'ko' else 'ko',
-                beam_size=1,  # 빠른 처리
-                temperature=0.0,  # 일관된 결과
-                condition_on_previous_text=False,  # 긴 오디오 최적화
-                vad_filter=True,  # 음성 구간 자동 감지
-                vad_parameters=dict(min_silence_duration_ms=500)  # 무음 구간 처리
+                language,
+                timeout=config['JOB_TIMEOUT_SECONDS']
             )
-            
-            # 세그먼트 결합하여 전체 텍스트 생성
-            transcription_text = " ".join([segment.text for segment in segments]).strip()
+            transcription_text = result['text']
+            MediaResultCache.set(KIND_STT, content_hash, cache_params, transcription_text)
             logger.info(f"✅ Faster-Whisper STT 처리 완료: {transcription_text[:50]}...")
             
             return transcription_text
@@ -72,6 +66,8 @@ def process_audio_with_whisper(audio_file, language='ko'):
             if os.path.exists(temp_file_path):
                 os.unlink(temp_file_path)
                 
+    except TranscriptionQueueFull:
+        raise
     except Exception as e:
         logger.error(f"❌ STT 처리 실패: {str(e)}", exc_info=True)
         raise e
@@ -110,9 +106,160 @@ def transcribe_audio(request):
             status=status.HTTP_200_OK
         )
         
+    except TranscriptionQueueFull as e:
+        return Response(
+            {"error": "STT workers are busy, please retry later", "inflight": e.depth, "limit": e.limit},
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": "10"}
+        )
     except Exception as e:
         logger.error(f"Transcription error: {str(e)}")
         return Response(
             {"error": f"Failed to process request: {str(e)}"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
+
+
+def _batch_item(transcription, queue_positions=None):
+    """배치 항목별 상태 (pending 도 클라이언트에는 processing 으로 표시)"""
+    item = {
+        'transcription_id': str(transcription.id),
+        'file_name': os.path.basename(transcription.audio_file.name),
+        'status': 'processing' if transcription.status == 'pending' else transcription.status,
+        'job_status': transcription.status,
+        'transcribed_text': transcription.transcription,
+        'error_message': transcription.error_message,
+    }
+    if queue_positions is not None:
+        item['queue_position'] = queue_positions.get(transcription.id)
+    return item
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class TranscriptionBatchView(View):
+    """
+    여러 음성 파일 일괄 STT API
+    파일마다 AudioTranscription 을 만들고 같은 batch_id 로 묶어 대기열에 넣으면,
+    디스패처가 배치 단위로 꺼내 워커 1개에서 길이순으로 묶어 배치 추론합니다.
+    """
+
+    VALID_EXTENSIONS = ['.wav', '.mp3', '.flac', '.m4a', '.ogg', '.webm', '.aac']
+    MAX_FILES = 50
+
+    def post(self, request):
+        if not hasattr(request, 'user_id') or not request.user_id:
+            return JsonResponse({'error': '사용자 인증이 필요합니다.'}, status=401)
+
+        audio_files = request.FILES.getlist('audio_files')
+        if not audio_files:
+            return JsonResponse({'error': 'audio_files 파일이 필요합니다.'}, status=400)
+        if len(audio_files) > self.MAX_FILES:
+            return JsonResponse({'error': f'한 번에 최대 {self.MAX_FILES}개 파일까지 업로드할 수 있습니다.'}, status=400)
+
+        invalid = [
+            audio_file.name for audio_file in audio_files
+            if not any(audio_file.name.lower().endswith(ext) for ext in self.VALID_EXTENSIONS)
+        ]
+        if invalid:
+            return JsonResponse({
+                'error': f'지원하지 않는 오디오 형식입니다. 지원 형식: {", ".join(self.VALID_EXTENSIONS)}',
+                'invalid_files': invalid
+            }, status=400)
+
+        business_id = request.POST.get('business_id') or None
+        if business_id:
+            from business.models import Business
+            if not Business.objects.filter(id=business_id, user_id=request.user_id).exists():
+                return JsonResponse({'error': '거래처를 찾을 수 없습니다.'}, status=404)
+        language = request.POST.get('language', 'ko')
+
+        # 이미 변환한 적 있는 파일은 결과를 바로 채우고 나머지만 대기열에 등록
+        cache_params = stt_cache_params(language)
+        cached_texts = []
+        for audio_file in audio_files:
+            content_hash = MediaResultCache.hash_file(audio_file) if MediaResultCache.enabled() else ''
+            cached_texts.append((content_hash, MediaResultCache.get(KIND_STT, content_hash, cache_params)))
+        pending_count = sum(1 for _, text in cached_texts if text is None)
+
+        # 대기열에 파일 수만큼 여유가 없으면 파일을 저장하지 않고 바로 거절
+        job_queue = get_job_queue()
+        try:
+            queue_depth = job_queue.check_capacity(pending_count) if pending_count else job_queue.depth()
+        except TranscriptionQueueFull as e:
+            response = JsonResponse({
+                'error': '음성 인식 요청이 많아 잠시 후 다시 시도해주세요.',
+                'queue_depth': e.depth,
+                'max_queue_depth': e.limit
+            }, status=429)
+            response['Retry-After'] = '30'
+            return response
+
+        batch_id = uuid.uuid4()
+        now = timezone.now()
+        with transaction.atomic():
+            transcriptions = AudioTranscription.objects.bulk_create([
+                AudioTranscription(
+                    user_id=request.user_id,
+                    audio_file=audio_file,
+                    language=language,
+                    status='pending' if cached_text is None else 'completed',
+                    transcription=cached_text or '',
+                    completed_at=None if cached_text is None else now,
+                    content_hash=content_hash,
+                    business_id=business_id,
+                    batch_id=batch_id,
+                )
+                for audio_file, (content_hash, cached_text) in zip(audio_files, cached_texts)
+            ])
+            if pending_count:
+                job_queue.enqueue(transcriptions[0])
+
+        logger.info(
+            f"🎤 배치 STT 등록: {batch_id} ({len(transcriptions)}개, 캐시 적중 {len(transcriptions) - pending_count}개, 대기 {queue_depth}건)"
+        )
+        return JsonResponse({
+            'message': f'음성 파일 {len(transcriptions)}개가 업로드되었습니다. STT 처리 중입니다.',
+            'data': {
+                'batch_id': str(batch_id),
+                'status': 'processing' if pending_count else 'completed',
+                'queue_position': queue_depth,
+                'cached': len(transcriptions) - pending_count,
+                'items': [_batch_item(transcription) for transcription in transcriptions],
+            }
+        }, status=202)
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class TranscriptionBatchStatusView(View):
+    """일괄 STT 항목별 상태 조회 API"""
+
+    def get(self, request, batch_id):
+        if not hasattr(request, 'user_id') or not request.user_id:
+            return JsonResponse({'error': '사용자 인증이 필요합니다.'}, status=401)
+
+        transcriptions = list(
+            AudioTranscription.objects.filter(batch_id=batch_id, user_id=request.user_id).order_by('created_at')
+        )
+        if not transcriptions:
+            return JsonResponse({'error': '배치를 찾을 수 없습니다.'}, status=404)
+
+        # 대기 순번은 배치 전체 기준으로 한 번만 계산
+        first_pending = next((t for t in transcriptions if t.status == 'pending'), None)
+        queue_positions = {}
+        if first_pending is not None:
+            position = get_job_queue().position(first_pending)
+            queue_positions = {t.id: position for t in transcriptions if t.status == 'pending'}
+
+        counts = {}
+        for transcription in transcriptions:
+            counts[transcription.status] = counts.get(transcription.status, 0) + 1
+        finished = counts.get('completed', 0) + counts.get('failed', 0)
+
+        return JsonResponse({
+            'batch_id': str(batch_id),
+            'status': 'completed' if finished == len(transcriptions) else 'processing',
+            'total': len(transcriptions),
+            'completed': counts.get('completed', 0),
+            'failed': counts.get('failed', 0),
+            'items': [_batch_item(transcription, queue_positions) for transcription in transcriptions],
+        })
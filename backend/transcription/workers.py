@@ -0,0 +1,599 @@
+"""
+STT 워커 서브시스템
+- TranscriptionWorkerPool: 모델을 미리 로드한 고정 개수의 워커 프로세스 풀 (요청 스레드에서 모델을 로드하지 않음)
+- TranscriptionJobQueue: AudioTranscription 테이블을 영속 작업 큐로 사용 (status='pending' 행이 대기 작업)
+  디스패처 스레드가 풀에 여유가 있을 때만 작업을 꺼내 실행하고, 대기 작업이 MAX_QUEUE_DEPTH 를 넘으면
+  새 업로드를 TranscriptionQueueFull(→ 429)로 거절합니다.
+
+웹 프로세스가 여러 개인 운영 환경에서는 TRANSCRIPTION_WORKERS['AUTOSTART']=False 로 두고
+`python manage.py run_transcription_workers` 를 별도 프로세스로 실행하면 모델 인스턴스 수가 PROCESSES 개로 고정됩니다.
+"""
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.media_cache import MediaResultCache, KIND_STT
+from . import stt_worker
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionQueueFull(Exception):
+    """STT 작업 큐/워커 풀이 포화 상태"""
+
+    def __init__(self, depth, limit):
+        self.depth = depth
+        self.limit = limit
+        super().__init__(f"STT 작업 대기열이 가득 찼습니다 ({depth}/{limit})")
+
+
+def get_worker_settings():
+    config = dict(getattr(settings, 'TRANSCRIPTION_WORKERS', {}))
+    config.setdefault('PROCESSES', 2)
+    config.setdefault('MAX_QUEUE_DEPTH', 20)
+    config.setdefault('AUTOSTART', True)
+    config.setdefault('POLL_INTERVAL_SECONDS', 2.0)
+    config.setdefault('JOB_TIMEOUT_SECONDS', 600)
+    config.setdefault('MAX_ATTEMPTS', 2)
+    config.setdefault('MODEL', {})
+    return config
+
+
+def stt_cache_params(language='ko'):
+    """STT 결과 캐시 키에 포함할 모델/언어 파라미터 (모델 설정이 바뀌면 이전 결과를 쓰지 않음)"""
+    model_config = get_worker_settings()['MODEL']
+    return {
+        'engine': 'faster-whisper',
+        'model': model_config.get('MODEL_SIZE', 'small'),
+        'compute_type': model_config.get('COMPUTE_TYPE', 'int8'),
+        'beam_size': model_config.get('BEAM_SIZE', 1),
+        'language': language or 'auto',
+    }
+
+
+class TranscriptionWorkerPool:
+    """
+    Whisper 모델이 로드된 워커 프로세스 풀
+    프로세스마다 모델 1개만 유지하므로 메모리 사용량은 PROCESSES × 모델 크기로 고정됩니다.
+    """
+
+    def __init__(self, processes=2, model_config=None, max_inflight=None):
+        self.processes = max(1, processes)
+        self.max_inflight = max_inflight or self.processes * 2
+        self.model_config = dict(model_config or {})
+        if not self.model_config.get('CPU_THREADS'):
+            # 코어를 워커 수로 나눠 쓰도록 스레드 수 제한 (프로세스 간 과다 구독 방지)
+            self.model_config['CPU_THREADS'] = max(1, (os.cpu_count() or 1) // self.processes)
+
+        self._executor = None
+        self._lock = threading.Lock()
+        self._inflight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_audio_seconds = 0.0
+        self.total_elapsed_seconds = 0.0
+        self.worker_models = {}  # pid → 워커 프로세스의 모델 로드 시간/메모리
+        # 워커가 청크마다 보내는 부분 결과 (progress_key → 콜백)
+        self._progress_queue = None
+        self._progress_thread = None
+        self._progress_callbacks = {}
+
+    def _get_executor(self):
+        if self._executor is None:
+            logger.info(f"🚀 STT 워커 풀 시작 (프로세스 {self.processes}개, 모델 {self.model_config.get('MODEL_SIZE', 'small')})")
+            context = multiprocessing.get_context('spawn')
+            if self._progress_queue is None:
+                # 큐는 프로세스 생성 시 initargs 로만 넘길 수 있으므로 풀보다 먼저 만들어 둠
+                self._progress_queue = context.Queue()
+                self._progress_thread = threading.Thread(
+                    target=self._progress_loop, args=(self._progress_queue,),
+                    name='stt-progress', daemon=True
+                )
+                self._progress_thread.start()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=context,
+                initializer=stt_worker.init_worker,
+                initargs=(self.model_config, self._progress_queue),
+            )
+        return self._executor
+
+    def _progress_loop(self, progress_queue):
+        while True:
+            item = progress_queue.get()
+            if item is None:
+                return
+            progress_key, text, seconds = item
+            callback = self._progress_callbacks.get(progress_key)
+            if callback is None:
+                continue
+            try:
+                callback(text, seconds)
+            except Exception as e:
+                logger.warning(f"⚠️ STT 부분 결과 처리 실패: {e}")
+
+    @property
+    def inflight(self):
+        return self._inflight
+
+    @property
+    def idle_workers(self):
+        return max(0, self.processes - self._inflight)
+
+    def submit(self, path, language='ko', on_progress=None):
+        """
+        파일 변환 작업 제출 - 실행 중 작업이 max_inflight 이상이면 TranscriptionQueueFull
+        on_progress(지금까지의 텍스트, 처리한 초) 는 청크가 끝날 때마다 진행 상황 스레드에서 호출됩니다.
+        """
+        with self._lock:
+            if self._inflight >= self.max_inflight:
+                raise TranscriptionQueueFull(self._inflight, self.max_inflight)
+            progress_key = None
+            if on_progress is not None:
+                progress_key = uuid.uuid4().hex
+                self._progress_callbacks[progress_key] = on_progress
+            try:
+                try:
+                    future = self._get_executor().submit(stt_worker.transcribe_file, path, language, progress_key)
+                except BrokenProcessPool:
+                    # 워커가 비정상 종료(OOM 등)되면 풀을 새로 만든 뒤 재시도
+                    logger.error("❌ STT 워커 풀 손상 - 재시작합니다")
+                    self._executor = None
+                    future = self._get_executor().submit(stt_worker.transcribe_file, path, language, progress_key)
+            except Exception:
+                self._progress_callbacks.pop(progress_key, None)
+                raise
+            self._inflight += 1
+            self.submitted += 1
+        if progress_key is not None:
+            future.add_done_callback(lambda f: self._progress_callbacks.pop(progress_key, None))
+        future.add_done_callback(self._on_done)
+        return future
+
+    def submit_batch(self, paths, language='ko'):
+        """여러 파일을 워커 1개에서 배치 추론 (워커 슬롯 1개만 사용)"""
+        with self._lock:
+            if self._inflight >= self.max_inflight:
+                raise TranscriptionQueueFull(self._inflight, self.max_inflight)
+            try:
+                future = self._get_executor().submit(stt_worker.transcribe_batch, list(paths), language)
+            except BrokenProcessPool:
+                logger.error("❌ STT 워커 풀 손상 - 재시작합니다")
+                self._executor = None
+                future = self._get_executor().submit(stt_worker.transcribe_batch, list(paths), language)
+            self._inflight += 1
+            self.submitted += 1
+        future.add_done_callback(self._on_done)
+        return future
+
+    def transcribe(self, path, language='ko', timeout=None):
+        """동기 변환 (요청 스레드는 결과만 기다리고 모델은 워커 프로세스에서 실행)"""
+        return self.submit(path, language).result(timeout=timeout)
+
+    def _on_done(self, future):
+        with self._lock:
+            self._inflight -= 1
+            if future.cancelled():
+                self.failed += 1
+                return
+            if future.exception() is not None:
+                self.failed += 1
+                if isinstance(future.exception(), BrokenProcessPool):
+                    self._executor = None
+                return
+            result = future.result()
+            self.completed += 1
+            self.total_audio_seconds += result.get('duration') or 0
+            self.total_elapsed_seconds += result.get('elapsed') or 0
+            if result.get('model_stats'):
+                self.worker_models[result['pid']] = result['model_stats']
+
+    def warmup(self, timeout=None):
+        """워커 프로세스를 모두 띄워 모델을 미리 로드 - 워커별 모델 상태 반환"""
+        with self._lock:
+            executor = self._get_executor()
+            # 유휴 워커가 없을 때마다 새 프로세스가 뜨므로 한 번에 processes 개를 제출
+            futures = [executor.submit(stt_worker.model_stats) for _ in range(self.processes)]
+        for future in futures:
+            result = future.result(timeout=timeout)
+            self.worker_models[result['pid']] = result['model_stats']
+        return dict(self.worker_models)
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            progress_queue, self._progress_queue = self._progress_queue, None
+            self.worker_models = {}
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        if progress_queue is not None:
+            progress_queue.put(None)
+            self._progress_callbacks.clear()
+
+    def metrics(self):
+        return {
+            'processes': self.processes,
+            'running': self._executor is not None,
+            'inflight': self._inflight,
+            'max_inflight': self.max_inflight,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'audio_seconds': round(self.total_audio_seconds, 1),
+            # 1보다 작을수록 실시간보다 빠름
+            'real_time_factor': round(self.total_elapsed_seconds / self.total_audio_seconds, 3)
+            if self.total_audio_seconds else None,
+            'workers': dict(self.worker_models),
+        }
+
+
+class TranscriptionJobQueue:
+    """AudioTranscription 테이블 기반 영속 작업 큐 + 디스패처"""
+
+    QUEUED_STATUSES = ['pending', 'processing']
+
+    def __init__(self, pool, max_depth=20, poll_interval=2.0, job_timeout=600, max_attempts=2, batch_size=8):
+        self.pool = pool
+        self.batch_size = max(1, batch_size)
+        self.max_depth = max_depth
+        self.poll_interval = poll_interval
+        self.job_timeout = job_timeout
+        self.max_attempts = max_attempts
+
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._last_stale_check = 0.0
+
+    @classmethod
+    def from_settings(cls, pool=None):
+        config = get_worker_settings()
+        pool = pool or TranscriptionWorkerPool(
+            processes=config['PROCESSES'],
+            model_config=config['MODEL'],
+        )
+        return cls(
+            pool,
+            max_depth=config['MAX_QUEUE_DEPTH'],
+            poll_interval=config['POLL_INTERVAL_SECONDS'],
+            job_timeout=config['JOB_TIMEOUT_SECONDS'],
+            max_attempts=config['MAX_ATTEMPTS'],
+            batch_size=config['MODEL'].get('BATCH_SIZE', 8),
+        )
+
+    # ------------------------------------------------------------------
+    # 등록 / 조회
+    # ------------------------------------------------------------------
+    def depth(self):
+        from .models import AudioTranscription
+        return AudioTranscription.objects.filter(status__in=self.QUEUED_STATUSES).count()
+
+    def check_capacity(self, count=1):
+        """작업 count 건을 더하면 대기열이 넘치는 경우 TranscriptionQueueFull (업로드 파일 저장 전에 호출)"""
+        depth = self.depth()
+        if depth + count > self.max_depth:
+            raise TranscriptionQueueFull(depth, self.max_depth)
+        return depth
+
+    def enqueue(self, transcription):
+        """status='pending' 으로 저장된 작업을 커밋 후 디스패처에 알림"""
+        transaction.on_commit(self.notify)
+        if get_worker_settings()['AUTOSTART']:
+            self.ensure_started()
+
+    def notify(self):
+        self._wake.set()
+
+    def position(self, transcription):
+        """대기 순번 (0 이면 다음 실행 대상), 대기 중이 아니면 None"""
+        from .models import AudioTranscription
+        if transcription.status != 'pending':
+            return None
+        return AudioTranscription.objects.filter(
+            status='pending', created_at__lt=transcription.created_at
+        ).count()
+
+    # ------------------------------------------------------------------
+    # 디스패처
+    # ------------------------------------------------------------------
+    def ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self.run_forever, name='stt-dispatcher', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.poll_interval + 1)
+        self._thread = None
+
+    def run_forever(self):
+        logger.info(f"🎧 STT 디스패처 시작 (워커 {self.pool.processes}개, 최대 대기 {self.max_depth}건)")
+        while not self._stop_event.is_set():
+            try:
+                close_old_connections()
+                self.dispatch_once()
+            except Exception as e:
+                logger.error(f"❌ STT 디스패처 오류: {e}", exc_info=True)
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+        close_old_connections()
+
+    def dispatch_once(self):
+        """유휴 워커 수만큼 대기 작업을 꺼내 실행 - 실행한 작업 수 반환"""
+        if time.monotonic() - self._last_stale_check > self.job_timeout / 2:
+            self.requeue_stale()
+            self._last_stale_check = time.monotonic()
+
+        dispatched = 0
+        while self.pool.idle_workers > 0:
+            job = self._claim()
+            if job is None:
+                break
+            if job.batch_id and self.batch_size > 1:
+                # 같은 배치로 업로드된 대기 작업을 함께 꺼내 워커 1개에서 배치 추론
+                jobs = [job] + self._claim_jobs(limit=self.batch_size - 1, batch_id=job.batch_id)
+                self._submit_batch(jobs)
+                dispatched += len(jobs)
+            else:
+                self._submit(job)
+                dispatched += 1
+        return dispatched
+
+    def _claim(self, transcription_id=None):
+        """대기 작업 1건을 processing 으로 바꿔 점유 (여러 디스패처가 있어도 중복 실행 없음)"""
+        filters = {'id': transcription_id} if transcription_id is not None else {}
+        jobs = self._claim_jobs(limit=1, **filters)
+        return jobs[0] if jobs else None
+
+    def _claim_jobs(self, limit=1, **filters):
+        """대기 작업을 오래된 순으로 최대 limit 건 점유"""
+        from .models import AudioTranscription
+        with transaction.atomic():
+            jobs = list(
+                AudioTranscription.objects.select_for_update(skip_locked=True)
+                .filter(status='pending', **filters)
+                .order_by('created_at')[:limit]
+            )
+            if not jobs:
+                return []
+            now = timezone.now()
+            # 재시도 시 이전 시도의 부분 결과는 버림
+            AudioTranscription.objects.filter(id__in=[job.id for job in jobs]).update(
+                status='processing',
+                started_at=now,
+                attempts=F('attempts') + 1,
+                transcription='',
+                processed_seconds=0,
+                updated_at=now,
+            )
+        for job in jobs:
+            job.status = 'processing'
+            job.started_at = now
+            job.attempts += 1
+            job.transcription = ''
+            job.processed_seconds = 0
+        return jobs
+
+    def _submit(self, job):
+        from .models import AudioTranscription
+        cleanup = lambda: None
+        try:
+            path, cleanup = _local_audio_path(job.audio_file)
+            future = self.pool.submit(
+                path, job.language,
+                on_progress=lambda text, seconds: self._on_job_progress(job, text, seconds)
+            )
+        except TranscriptionQueueFull:
+            # 동기 요청이 워커를 점유한 경우 - 시도 횟수를 되돌리고 다시 대기
+            cleanup()
+            AudioTranscription.objects.filter(id=job.id).update(status='pending', attempts=job.attempts - 1)
+            return None
+        except Exception as e:
+            cleanup()
+            self._finish(job, error=e)
+            return None
+        future.add_done_callback(lambda f: self._on_job_done(job, f, cleanup))
+        return future
+
+    def _submit_batch(self, jobs):
+        from .models import AudioTranscription
+        ready, paths, cleanups = [], [], []
+        for job in jobs:
+            try:
+                path, cleanup = _local_audio_path(job.audio_file)
+            except Exception as e:
+                self._finish(job, error=e)
+                continue
+            ready.append(job)
+            paths.append(path)
+            cleanups.append(cleanup)
+        if not ready:
+            return None
+
+        def cleanup_all():
+            for cleanup in cleanups:
+                cleanup()
+
+        try:
+            future = self.pool.submit_batch(paths, ready[0].language)
+        except TranscriptionQueueFull:
+            cleanup_all()
+            AudioTranscription.objects.filter(id__in=[job.id for job in ready]).update(
+                status='pending', attempts=F('attempts') - 1
+            )
+            return None
+        except Exception as e:
+            cleanup_all()
+            for job in ready:
+                self._finish(job, error=e)
+            return None
+        future.add_done_callback(lambda f: self._on_batch_done(ready, f, cleanup_all))
+        return future
+
+    def _on_batch_done(self, jobs, future, cleanup):
+        try:
+            close_old_connections()
+            error = future.exception()
+            items = future.result()['items'] if error is None else [None] * len(jobs)
+            for job, item in zip(jobs, items):
+                if error is not None:
+                    self._finish(job, error=error)
+                elif 'error' in item:
+                    self._finish(job, error=RuntimeError(item['error']))
+                else:
+                    self._finish(job, result=item)
+        finally:
+            cleanup()
+            self._wake.set()
+
+    def _on_job_progress(self, job, text, seconds):
+        """청크 변환이 끝날 때마다 부분 텍스트 저장 (상태 조회 API 로 바로 확인 가능)"""
+        from .models import AudioTranscription
+        close_old_connections()
+        AudioTranscription.objects.filter(id=job.id, status='processing', attempts=job.attempts).update(
+            transcription=text,
+            processed_seconds=seconds,
+            updated_at=timezone.now(),
+        )
+
+    def _on_job_done(self, job, future, cleanup):
+        try:
+            close_old_connections()
+            error = future.exception()
+            self._finish(job, result=None if error else future.result(), error=error)
+        finally:
+            cleanup()
+            self._wake.set()
+
+    def _finish(self, job, result=None, error=None):
+        from .models import AudioTranscription
+        now = timezone.now()
+        if error is None:
+            AudioTranscription.objects.filter(id=job.id).update(
+                transcription=result['text'],
+                processed_seconds=result.get('duration') or 0,
+                status='completed',
+                completed_at=now,
+                error_message='',
+                updated_at=now,
+            )
+            MediaResultCache.set(KIND_STT, job.content_hash, stt_cache_params(job.language), result['text'])
+            logger.info(f"✅ STT 작업 완료: {job.id} ({result.get('duration', 0):.1f}s 음성, {result.get('elapsed', 0):.1f}s 소요)")
+            return
+
+        retry = job.attempts < self.max_attempts
+        AudioTranscription.objects.filter(id=job.id).update(
+            status='pending' if retry else 'failed',
+            error_message=str(error)[:1000],
+            completed_at=None if retry else now,
+            updated_at=now,
+        )
+        logger.error(f"❌ STT 작업 실패: {job.id} ({job.attempts}/{self.max_attempts}회) - {error}")
+
+    def requeue_stale(self):
+        """JOB_TIMEOUT 이 지나도록 processing 인 작업(워커/프로세스 중단)을 다시 대기열로"""
+        from .models import AudioTranscription
+        cutoff = timezone.now() - timedelta(seconds=self.job_timeout)
+        stale = AudioTranscription.objects.filter(status='processing', started_at__lt=cutoff)
+        failed = stale.filter(attempts__gte=self.max_attempts).update(
+            status='failed', error_message='처리 시간 초과', completed_at=timezone.now()
+        )
+        requeued = stale.update(status='pending')
+        if failed or requeued:
+            logger.warning(f"⚠️ 중단된 STT 작업 정리: 재시도 {requeued}건, 실패 {failed}건")
+
+    def run_job(self, transcription_id, timeout=None):
+        """특정 작업을 즉시 점유해 실행하고 완료까지 대기 (Celery 태스크 등 외부 실행기용)"""
+        job = self._claim(transcription_id)
+        if job is None:
+            return False
+        path, cleanup = _local_audio_path(job.audio_file)
+        try:
+            result = self.pool.transcribe(path, job.language, timeout=timeout or self.job_timeout)
+        except Exception as e:
+            self._finish(job, error=e)
+            raise
+        finally:
+            cleanup()
+        self._finish(job, result=result)
+        return True
+
+    def metrics(self):
+        from .models import AudioTranscription
+        from django.db.models import Count
+        counts = dict(
+            AudioTranscription.objects.filter(status__in=self.QUEUED_STATUSES)
+            .values_list('status').annotate(count=Count('id'))
+        )
+        return {
+            'pending': counts.get('pending', 0),
+            'processing': counts.get('processing', 0),
+            'max_queue_depth': self.max_depth,
+            'dispatcher_running': self._thread is not None and self._thread.is_alive(),
+            'pool': self.pool.metrics(),
+            'result_cache': MediaResultCache.metrics()[KIND_STT],
+        }
+
+
+def _local_audio_path(field_file):
+    """
+    워커 프로세스가 읽을 수 있는 로컬 파일 경로 반환 (path, cleanup)
+    로컬 스토리지면 원본 경로를 그대로 쓰고, 원격 스토리지면 임시 파일로 복사합니다.
+    """
+    try:
+        return field_file.path, lambda: None
+    except NotImplementedError:
+        pass
+
+    suffix = os.path.splitext(field_file.name)[1] or '.mp3'
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+        with field_file.open('rb') as source:
+            shutil.copyfileobj(source, temp_file)
+        temp_path = temp_file.name
+
+    def cleanup():
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+    return temp_path, cleanup
+
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+    """프로세스 단위 작업 큐 싱글톤 반환"""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                _job_queue = TranscriptionJobQueue.from_settings()
+    return _job_queue
+
+
+def get_worker_pool():
+    return get_job_queue().pool